@@ -0,0 +1,221 @@
+import asyncio
+import datetime
+import inspect
+import re
+import time
+
+from .log import log
+from .routing import RouteTable
+
+
+# Delay after startup before the first crawl, so it doesn't compete with cog load
+STARTUP_DELAY = 120
+# Pause between archive pages; a full crawl of a large forum should stay a background trickle
+PAGE_PAUSE = 1.0
+PAGE_SIZE = 100
+
+_THREAD_NUMBER_RE = re.compile(r"\[GH\]\s*\[#(\d+)\]")
+
+
+class ArchiveCrawler:
+    """Indexes every archived thread in the issue/PR forums.
+
+    The first crawl pages through all archived threads with the ``before`` cursor; later
+    crawls stop at the newest archive already indexed. Indexed threads are written into the
+    thread cache (as thread IDs) so ``find_thread`` resolves them without scanning archives.
+    Orphan cleanup keeps looking at the 100 most recent archived posts only.
+    """
+
+    def __init__(self, cog):
+        self.cog = cog
+        self.task = None
+        self.index = {}
+        self.crawling = False
+        self._loaded = False
+
+    def start(self):
+        if self.task and not self.task.done():
+            return
+        self.task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self.task:
+            self.task.cancel()
+            try:
+                await self.task
+            except (asyncio.CancelledError, Exception):
+                pass
+            self.task = None
+
+    async def _get(self, key, default):
+        attr = getattr(self.cog.config, key, None)
+        if attr is None:
+            return default
+        try:
+            val = attr()
+            if inspect.isawaitable(val):
+                val = await val
+        except Exception:
+            return default
+        if isinstance(default, (int, float)):
+            return val if isinstance(val, (int, float)) and not isinstance(val, bool) else default
+        return val if isinstance(val, type(default)) else default
+
+    async def load(self):
+        if self._loaded:
+            return
+        self._loaded = True
+        saved = await self._get("archive_index", {})
+        for forum_id, state in saved.items():
+            if isinstance(state, dict):
+                self.index[str(forum_id)] = state
+
+    async def save(self):
+        store = getattr(self.cog.config, "archive_index", None)
+        if store is None:
+            return
+        try:
+            res = store.set(self.index)
+            if inspect.isawaitable(res):
+                await res
+        except Exception as e:
+            log.warning("⚠️ Failed to persist archive index: %s", e)
+
+    async def _run(self):
+        await asyncio.sleep(STARTUP_DELAY)
+        while True:
+            hours = await self._get("archive_crawl_hours", 24)
+            try:
+                if hours > 0:
+                    await self.crawl_all()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                log.warning("⚠️ Archive crawl failed: %s", e)
+            await asyncio.sleep(max(hours, 1) * 3600)
+
+    async def _forums(self):
+        forums = []
+        forum_ids = [await self._get(key, 0) for key in ("issues_forum_id", "prs_forum_id")]
+        routes = getattr(self.cog, "routes", None)
+        if isinstance(routes, RouteTable):
+            forum_ids += routes.forum_ids()
+        for forum_id in dict.fromkeys(forum_ids):
+            if not forum_id:
+                continue
+            forum = self.cog.bot.get_channel(forum_id)
+            if forum is not None and hasattr(forum, "archived_threads"):
+                forums.append(forum)
+        return forums
+
+    async def crawl_all(self):
+        """Crawl every configured forum; returns the number of newly indexed threads."""
+        if self.crawling:
+            return 0
+        self.crawling = True
+        try:
+            await self.load()
+            repos = await self._repo_names()
+            added = 0
+            for forum in await self._forums():
+                added += await self.crawl(forum, repos)
+            return added
+        finally:
+            self.crawling = False
+
+    async def _repo_names(self):
+        """Map repo short names (as used for forum tags) to full ``owner/repo`` names."""
+        names = {}
+        for repo in await self._get("allowed_repos", []):
+            repo = repo.strip().lstrip("/")
+            if repo:
+                names.setdefault(repo.split("/")[-1].lower(), repo)
+        return names
+
+    async def crawl(self, forum, repos=None):
+        """Index archived threads of ``forum`` that are newer than the last crawl (all of them the first time)."""
+        await self.load()
+        repos = repos if repos is not None else await self._repo_names()
+        state = self.index.setdefault(str(forum.id), {"threads": {}, "newest": None, "complete": False, "crawled_at": None})
+        threads = state["threads"]
+        # An unfinished full crawl resumes from its cursor; a finished one only walks back to the newest known archive
+        stop_at = state["newest"] if state["complete"] else None
+        before = None
+        if not state["complete"] and state.get("cursor"):
+            before = datetime.datetime.fromisoformat(state["cursor"])
+        newest_seen = None
+        added = 0
+
+        while True:
+            page = []
+            async for thread in forum.archived_threads(limit=PAGE_SIZE, before=before):
+                page.append(thread)
+            reached_known = False
+            for thread in page:
+                archived_at = getattr(thread, "archive_timestamp", None)
+                stamp = archived_at.isoformat() if archived_at else None
+                if stop_at and stamp and stamp <= stop_at:
+                    reached_known = True
+                    break
+                if stamp and (newest_seen is None or stamp > newest_seen):
+                    newest_seen = stamp
+                if str(thread.id) not in threads:
+                    added += 1
+                threads[str(thread.id)] = self._record(forum, thread, repos)
+            if page:
+                last = page[-1]
+                before = getattr(last, "archive_timestamp", None) or last
+                if not state["complete"]:
+                    # Checkpoint the first full crawl page by page so a restart continues from here
+                    state["cursor"] = before.isoformat() if hasattr(before, "isoformat") else None
+                    if newest_seen and (state["newest"] is None or newest_seen > state["newest"]):
+                        state["newest"] = newest_seen
+                    await self.save()
+            if reached_known or len(page) < PAGE_SIZE:
+                break
+            await asyncio.sleep(PAGE_PAUSE)
+
+        if newest_seen and (state["newest"] is None or newest_seen > state["newest"]):
+            state["newest"] = newest_seen
+        state["complete"] = True
+        state.pop("cursor", None)
+        state["crawled_at"] = time.time()
+        await self.save()
+        if added:
+            log.info("🗄️ Indexed %s archived threads in %s (%s total)", added, getattr(forum, 'name', forum.id), len(threads))
+        return added
+
+    def _record(self, forum, thread, repos):
+        name = getattr(thread, "name", "") or ""
+        tags = [getattr(t, "name", "").lower() for t in (getattr(thread, "applied_tags", None) or [])]
+        match = _THREAD_NUMBER_RE.search(name)
+        entry = {"n": int(match.group(1)) if match else None, "tags": tags, "name": name[:100]}
+        self._cache_entry(forum.id, thread.id, entry, repos)
+        return entry
+
+    def _cache_entry(self, forum_id, thread_id, entry, repos):
+        repo = next((repos[t] for t in entry["tags"] if t in repos), None)
+        if entry["n"] is None or not repo:
+            return
+        # Thread IDs go into the shared thread index; live Thread objects already cached are kept
+        for key in ((forum_id, repo, entry["n"]), (str(forum_id), repo, entry["n"])):
+            self.cog.thread_cache.setdefault(key, int(thread_id))
+
+    async def hydrate(self):
+        """Load the persisted index and repopulate the thread cache from it (used at startup)."""
+        await self.load()
+        repos = await self._repo_names()
+        for forum_id, state in self.index.items():
+            for thread_id, entry in state["threads"].items():
+                self._cache_entry(int(forum_id), thread_id, entry, repos)
+
+    def forget(self, thread_id):
+        for state in self.index.values():
+            state["threads"].pop(str(thread_id), None)
+
+    def status(self):
+        """Return ``(forum_id, archived_count, complete, crawled_at)`` rows."""
+        return [
+            (forum_id, len(state["threads"]), state.get("complete", False), state.get("crawled_at"))
+            for forum_id, state in self.index.items()
+        ]
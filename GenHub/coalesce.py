@@ -0,0 +1,256 @@
+import asyncio
+import contextlib
+import copy
+import inspect
+
+from .log import log
+from .metrics import metrics
+from .tracing import detached_task
+
+
+# Issue/PR actions that only change labels, assignees or the title/body; bursts of these are merged
+COALESCED_ACTIONS = {
+    "labeled": "labels",
+    "unlabeled": "labels",
+    "assigned": "assignees",
+    "unassigned": "assignees",
+    "edited": "edited",
+}
+ITEM_KEYS = {"issues": "issue", "pull_request": "pull_request"}
+# Handler method per event, for bursts restored from Config after a restart
+HANDLER_NAMES = {"issues": "handle_issue", "pull_request": "handle_pull_request"}
+DEFAULT_WINDOW_MS = 1500
+
+
+def _slim_payload(data):
+    """Drop the bulky repository/org objects a coalesced handler never reads, so saved bursts stay small."""
+    slim = {k: v for k, v in data.items() if k not in ("organization", "installation", "enterprise")}
+    if isinstance(data.get("repository"), dict):
+        slim["repository"] = {"full_name": data["repository"].get("full_name")}
+    return slim
+
+
+def _net_changes(changes):
+    """Reduce ``[(action, name), ...]`` to the names added and removed by the whole burst."""
+    last = {}
+    for action, name in changes:
+        last[name] = action
+    first = {}
+    for action, name in reversed(changes):
+        first[name] = action
+    # A name added then removed (or removed then re-added) within the burst is no change at all
+    added = [n for n, a in last.items() if a in ("labeled", "assigned") and first[n] == a]
+    removed = [n for n, a in last.items() if a in ("unlabeled", "unassigned") and first[n] == a]
+    return added, removed
+
+
+class EventCoalescer:
+    """Merges bursts of label, assignee and edit events for one issue/PR into one handler run.
+
+    Clicking through the labels sidebar sends ``labeled`` five times; each would otherwise look
+    up the thread, recompute tags and log a line. Events keyed ``(repo, number, event)`` are held
+    for a fixed window from the first one, then replayed once per kind with the latest payload
+    (which carries the item's final labels, assignees and title) and the net change. Any other
+    action (opened, closed, reopened, merged...) first flushes what is queued for the item and
+    then runs at once, so notices go out in order. Everything for one item runs under a lock, so
+    a flush can't race an ``opened`` delivery into creating a second thread.
+
+    A queued event is acknowledged before its handler runs, so the queue is mirrored into Config
+    (``coalesce_pending``) on every change, like pending review batches, and replayed on load.
+    A burst leaves the saved copy only once its handlers have run.
+    """
+
+    def __init__(self, handlers):
+        self.handlers = handlers
+        self.pending = {}
+        # Bursts popped from ``pending`` whose handlers are still running
+        self._flushing = {}
+        self._locks = {}
+        self.merged = 0
+        # Set once the bursts saved by the previous cog instance have been read back
+        self.loaded = False
+
+    async def dispatch(self, event_type, data, repo_full_name, handler):
+        """Run ``handler(data, repo)`` now or queue it for merging."""
+        item = data.get(ITEM_KEYS.get(event_type, ""))
+        number = item.get("number") if isinstance(item, dict) else None
+        if number is None:
+            return await handler(data, repo_full_name)
+
+        key = (repo_full_name.lower(), number, event_type)
+        category = COALESCED_ACTIONS.get(data.get("action"))
+        if category:
+            window = await self.handlers._get_config_int("coalesce_window_ms", DEFAULT_WINDOW_MS)
+            if window > 0:
+                self._queue(key, category, data, repo_full_name, handler, window / 1000)
+                await self._save()
+                return
+
+        async with self._item(key):
+            await self._flush_locked(key)
+            await handler(data, repo_full_name)
+
+    @contextlib.asynccontextmanager
+    async def _item(self, key):
+        """Hold the item's lock; the lock is dropped once nobody holds or waits for it."""
+        lock, users = self._locks.get(key, (None, 0))
+        self._locks[key] = (lock or asyncio.Lock(), users + 1)
+        lock = self._locks[key][0]
+        try:
+            async with lock:
+                yield
+        finally:
+            _, users = self._locks[key]
+            if users == 1:
+                del self._locks[key]
+            else:
+                self._locks[key] = (lock, users - 1)
+
+    def _queue(self, key, category, data, repo_full_name, handler, window):
+        entry = self.pending.get(key)
+        if entry is None:
+            entry = self.pending[key] = {"repo": repo_full_name, "handler": handler, "kinds": {}, "count": 0}
+            entry["task"] = detached_task(self._flush_later(key, window))
+        entry["count"] += 1
+        kind = entry["kinds"].setdefault(category, {"data": None, "changes": []})
+        kind["data"] = data
+        if category == "labels":
+            kind["changes"].append((data["action"], (data.get("label") or {}).get("name", "tag")))
+        elif category == "assignees":
+            kind["changes"].append((data["action"], (data.get("assignee") or {}).get("login", "Unknown")))
+
+    async def _flush_later(self, key, window):
+        await asyncio.sleep(window)
+        async with self._item(key):
+            await self._flush_locked(key)
+
+    async def _flush_locked(self, key):
+        entry = self.pending.pop(key, None)
+        if not entry:
+            return
+        task = entry["task"]
+        if task is not asyncio.current_task():
+            task.cancel()
+
+        # A burst cut off here (unload deadline, crash) stays in _flushing and is saved for the next load
+        self._flushing[key] = entry
+        runs = 0
+        for category, kind in entry["kinds"].items():
+            data = self._merged_payload(category, kind)
+            if data is None:
+                continue
+            runs += 1
+            try:
+                await entry["handler"](data, entry["repo"])
+            except Exception as e:
+                await self.handlers.log_error(f"Failed to handle coalesced {key[2]} {category} for {entry['repo']}#{key[1]}: {e}")
+        del self._flushing[key]
+        await self._save()
+        if entry["count"] > runs:
+            self.merged += entry["count"] - runs
+            metrics.inc("genhub_coalesced_events_total", entry["count"] - runs, event=key[2])
+            log.debug("🧲 Merged %s %s event(s) for %s#%s into %s", entry["count"], key[2], entry["repo"], key[1], runs)
+
+    @staticmethod
+    def _merged_payload(category, kind):
+        """The latest payload rewritten to describe the burst's net change, or None if it cancelled out."""
+        data = kind["data"]
+        if category == "edited" or len(kind["changes"]) == 1:
+            return data
+        added, removed = _net_changes(kind["changes"])
+        if not added and not removed:
+            return None
+        data = copy.copy(data)
+        if category == "labels":
+            data["action"] = "labeled" if added else "unlabeled"
+            data["label"] = {"name": ", ".join([f"+{n}" for n in added] + [f"-{n}" for n in removed])}
+        else:
+            data["action"] = "assigned" if added else "unassigned"
+            # The item only names its primary assignee; the handlers render this instead
+            data["assignee_changes"] = {"added": added, "removed": removed}
+        return data
+
+    def _serialize(self) -> list:
+        """Snapshot queued and mid-flush bursts into JSON-safe Config data (tasks and handlers excluded)."""
+        snapshot = []
+        for batches in (self._flushing, self.pending):
+            for key, entry in batches.items():
+                kinds = {
+                    category: {"data": _slim_payload(kind["data"]), "changes": [list(c) for c in kind["changes"]]}
+                    for category, kind in entry["kinds"].items()
+                }
+                snapshot.append({"key": list(key), "repo": entry["repo"], "count": entry["count"], "kinds": kinds})
+        return snapshot
+
+    async def _save(self):
+        await self.handlers._store_config("coalesce_pending", self._serialize())
+
+    async def restore(self) -> int:
+        """Re-queue bursts saved by a previous cog instance; they flush after one window."""
+        store = getattr(getattr(self.handlers.cog, "config", None), "coalesce_pending", None)
+        if store is None:
+            return 0
+        try:
+            saved = store()
+            if inspect.isawaitable(saved):
+                saved = await saved
+        except Exception as e:
+            log.warning("⚠️ Failed to load coalesced events: %s", e)
+            return 0
+        self.loaded = True
+        if not isinstance(saved, list):
+            return 0
+
+        window = await self.handlers._get_config_int("coalesce_window_ms", DEFAULT_WINDOW_MS)
+        restored = 0
+        for stored in saved:
+            try:
+                key = tuple(stored["key"])
+                handler = getattr(self.handlers, HANDLER_NAMES[key[2]])
+                kinds = stored["kinds"]
+                if len(key) != 3 or not isinstance(kinds, dict):
+                    continue
+            except (KeyError, IndexError, TypeError):
+                continue
+            entry = self.pending.get(key)
+            if entry is None:
+                entry = self.pending[key] = {"repo": stored.get("repo") or key[0], "handler": handler, "kinds": {}, "count": 0}
+                entry["task"] = detached_task(self._flush_later(key, max(window, 0) / 1000))
+            entry["count"] += stored.get("count", 1)
+            for category, kind in kinds.items():
+                merged = entry["kinds"].setdefault(category, {"data": None, "changes": []})
+                merged["data"] = kind.get("data")
+                merged["changes"] += [tuple(c) for c in kind.get("changes", [])]
+            restored += 1
+
+        if restored:
+            log.info("♻️ Restored %s coalesced event burst(s) from previous session", restored)
+        return restored
+
+    async def suspend(self, save: bool = True):
+        """Cancel window timers without dropping their bursts, then persist what is left (if ``save``)."""
+        for entry in self.pending.values():
+            entry["task"].cancel()
+        if save:
+            await self._save()
+
+    async def flush(self, timeout: float) -> int:
+        """Run everything queued now (cog unload); returns bursts still unflushed after ``timeout``.
+
+        Bursts cut off mid-run are counted too; ``suspend`` persists both kinds.
+        """
+        async def flush_key(key):
+            async with self._item(key):
+                await self._flush_locked(key)
+
+        keys = list(self.pending)
+        if keys:
+            task = asyncio.ensure_future(asyncio.gather(*(flush_key(k) for k in keys)))
+            if timeout > 0:
+                await asyncio.wait({task}, timeout=timeout)
+            if not task.done():
+                task.cancel()
+                await asyncio.wait({task})
+        for entry in self.pending.values():
+            entry["task"].cancel()
+        return len(self.pending) + len(self._flushing)
@@ -0,0 +1,155 @@
+import asyncio
+import inspect
+import re
+
+from .log import log
+from .tracing import detached_task
+
+
+# Delay before a changed index is written back to Config, so bursts of posts share one write
+SAVE_DELAY = 10.0
+
+_COMMENT_URL_RE = re.compile(r"https://github\.com/[^/]+/[^/]+/(?:issues|pull)/\d+[#\w\-]+")
+
+
+class SyncedCommentIndex:
+    """Per-thread record of the GitHub comments already mirrored into Discord.
+
+    Entries are filled in as comments are posted, so reconcile can skip comments it
+    already synced without reading thread history. Threads that predate the index are
+    seeded once from their full history and never scanned again.
+    """
+
+    def __init__(self, cog):
+        self.cog = cog
+        self._threads = {}
+        self._loaded = False
+        self._save_task = None
+
+    @staticmethod
+    def _key(thread):
+        return str(getattr(thread, "id", thread))
+
+    def _entry(self, thread):
+        return self._threads.setdefault(
+            self._key(thread), {"urls": set(), "bots": set(), "seeded": False, "initial": False}
+        )
+
+    async def load(self):
+        """Load the persisted index from Config (once)."""
+        if self._loaded:
+            return
+        self._loaded = True
+        store = getattr(getattr(self.cog, "config", None), "synced_comments", None)
+        if store is None:
+            return
+        try:
+            saved = store()
+            if inspect.isawaitable(saved):
+                saved = await saved
+        except Exception:
+            return
+        if not isinstance(saved, dict):
+            return
+        for key, stored in saved.items():
+            if not isinstance(stored, dict):
+                continue
+            self._threads[str(key)] = {
+                "urls": set(stored.get("urls") or []),
+                "bots": set(stored.get("bots") or []),
+                "seeded": bool(stored.get("seeded")),
+                "initial": bool(stored.get("initial")),
+            }
+
+    async def save(self):
+        """Write the index to Config now."""
+        store = getattr(getattr(self.cog, "config", None), "synced_comments", None)
+        if store is None:
+            return
+        snapshot = {
+            key: {"urls": sorted(e["urls"]), "bots": sorted(e["bots"]), "seeded": e["seeded"], "initial": e["initial"]}
+            for key, e in self._threads.items()
+        }
+        try:
+            res = store.set(snapshot)
+            if inspect.isawaitable(res):
+                await res
+        except Exception as e:
+            log.warning("⚠️ Failed to persist synced comment index: %s", e)
+
+    def _schedule_save(self):
+        if self._save_task and not self._save_task.done():
+            return
+        try:
+            self._save_task = detached_task(self._delayed_save())
+        except RuntimeError:
+            pass
+
+    async def _delayed_save(self):
+        await asyncio.sleep(SAVE_DELAY)
+        await self.save()
+
+    async def close(self):
+        """Cancel any pending delayed write and persist immediately."""
+        if self._save_task and not self._save_task.done():
+            self._save_task.cancel()
+        self._save_task = None
+        await self.save()
+
+    def mark_new(self, thread):
+        """Register a thread we just created: it has its initial message and no prior comments."""
+        entry = self._entry(thread)
+        entry["seeded"] = True
+        entry["initial"] = True
+        self._schedule_save()
+
+    def record(self, thread, url: str = None, bot: str = None):
+        """Remember that the comment at ``url`` (and/or a review from ``bot``) was posted to ``thread``."""
+        entry = self._entry(thread)
+        if url:
+            entry["urls"].add(url)
+        if bot:
+            entry["bots"].add(bot.lower().strip())
+        entry["initial"] = True
+        self._schedule_save()
+
+    def discard(self, thread, url: str):
+        entry = self._threads.get(self._key(thread))
+        if entry and url in entry["urls"]:
+            entry["urls"].discard(url)
+            self._schedule_save()
+
+    def forget(self, thread_id):
+        """Drop a deleted thread from the index."""
+        if self._threads.pop(str(thread_id), None) is not None:
+            self._schedule_save()
+
+    async def entry_for(self, thread):
+        """Return ``{"urls", "bots", "initial"}`` for ``thread``, seeding from history on first use."""
+        await self.load()
+        entry = self._entry(thread)
+        if not entry["seeded"]:
+            await self._seed(thread, entry)
+        return entry
+
+    async def _seed(self, thread, entry):
+        """One-time full history scan for threads that existed before the index."""
+        found_any = False
+        async for message in thread.history(limit=None, oldest_first=True):
+            found_any = True
+            if message.content:
+                entry["urls"].update(_COMMENT_URL_RE.findall(message.content))
+            for emb in getattr(message, "embeds", []):
+                if emb.author and emb.author.name:
+                    # e.g. "deepsource-io[bot] (Bot Notice)" -> "deepsource-io[bot]"
+                    entry["bots"].add(emb.author.name.split(" ")[0].lower().strip())
+                if emb.author and emb.author.url:
+                    entry["urls"].add(emb.author.url)
+                if emb.description:
+                    entry["urls"].update(_COMMENT_URL_RE.findall(emb.description))
+        entry["initial"] = entry["initial"] or found_any
+        entry["seeded"] = True
+        self._schedule_save()
+
+    def __len__(self):
+        return len(self._threads)
@@ -231,6 +231,8 @@ class ConfigCommands(commands.Cog):
         if clean_secret.lower() in ("none", "clear", "reset", '""', "''"):
             clean_secret = ""
         await self.cog.config.github_secret.set(clean_secret)
+        if hasattr(self.cog, "webhook"):
+            self.cog.webhook.set_secret(clean_secret)
         if clean_secret:
             await ctx.send("✅ GitHub webhook secret updated.")
         else:
@@ -301,6 +303,19 @@ class ConfigCommands(commands.Cog):
         await self._set_config(ctx, "log_level", stored_level)
         await ctx.send(f"✅ Discord log level set to **`{stored_level}`**.")
 
+    @genhub.command(aliases=["logoutput"])
+    @commands.is_owner()
+    async def logformat(self, ctx, fmt: str):
+        """Set the console log format: `text` (Red's handlers) or `json` (one JSON object per line on stdout)."""
+        from .log import setup_logging
+
+        clean = fmt.lower().strip()
+        if clean not in ("text", "json"):
+            return await ctx.send("⚠️ Invalid log format. Valid options: `text`, `json`.")
+        await self.cog.config.log_json.set(clean == "json")
+        setup_logging(json_output=clean == "json")
+        await ctx.send(f"✅ Console log format set to **`{clean}`**.")
+
     @genhub.command()
     async def issuesforum(self, ctx, forum_id: int):
         """Set the Issues forum channel ID."""
@@ -403,7 +418,7 @@ class ConfigCommands(commands.Cog):
         pages = []
         total_prs = len(prs)
         total_pages = (total_prs + page_size - 1) // page_size
-        prs_forum_id = await self.cog.config.prs_forum_id()
+        prs_forum_id = await self.cog.handlers._route_config(repo, "prs_forum_id")
 
         for page_idx in range(total_pages):
             chunk = prs[page_idx * page_size : (page_idx + 1) * page_size]
@@ -483,7 +498,7 @@ class ConfigCommands(commands.Cog):
         pages = []
         total_issues = len(issues)
         total_pages = (total_issues + page_size - 1) // page_size
-        issues_forum_id = await self.cog.config.issues_forum_id()
+        issues_forum_id = await self.cog.handlers._route_config(repo, "issues_forum_id")
 
         for page_idx in range(total_pages):
             chunk = issues[page_idx * page_size : (page_idx + 1) * page_size]
@@ -577,8 +592,8 @@ class ConfigCommands(commands.Cog):
             description=repo_info.get("description", "GitHub Repository Integration")[:200] if repo_info else "Repository Overview",
         )
 
-        issues_forum_id = await self.cog.config.issues_forum_id()
-        prs_forum_id = await self.cog.config.prs_forum_id()
+        issues_forum_id = await self.cog.handlers._route_config(repo, "issues_forum_id")
+        prs_forum_id = await self.cog.handlers._route_config(repo, "prs_forum_id")
 
         # PRs Field
         prs_text = f"**Total Open:** `{len(prs)}`\n"
@@ -615,13 +630,326 @@ class ConfigCommands(commands.Cog):
         """Set the Contributor role ID for mentions."""
         await self._set_config(ctx, "contributor_role_id", role_id)
 
-    @genhub.command()
+    @genhub.group(name="reconcile", invoke_without_command=True)
     @commands.is_owner()
-    async def reconcile(self, ctx, repo: str = None):
+    async def reconcile(self, ctx, repo: str = None, *flags: str):
         """Reconcile all forum posts to ensure correct tags.
-        Optionally filter by repo name."""
-        await ctx.send("🔄 Starting reconciliation... this may take a while.")
-        await self.cog.handlers.reconcile_forum_tags(ctx, repo_filter=repo)
+        Optionally filter by repo name. Add `--dry-run` to only print what would change.
+
+        Usage:
+          !genhub reconcile [owner/repo] [--dry-run]
+        """
+        if repo and repo.startswith("--"):
+            flags, repo = (repo, *flags), None
+        dry_run = "--dry-run" in flags
+        if dry_run:
+            await ctx.send("🧪 Planning reconciliation (dry run, no changes will be made)...")
+        else:
+            await ctx.send("🔄 Starting reconciliation... this may take a while.")
+        await self.cog.handlers.reconcile_forum_tags(ctx, repo_filter=repo, dry_run=dry_run)
+
+    @reconcile.command(name="resume")
+    @commands.is_owner()
+    async def reconcile_resume(self, ctx):
+        """Resume an interrupted reconciliation from its saved checkpoint."""
+        if self.cog.handlers.is_reconciling:
+            return await ctx.send("⚠️ A reconciliation is already running.")
+        await ctx.send("⏩ Resuming reconciliation from the last checkpoint...")
+        await self.cog.handlers.reconcile_forum_tags(ctx, resume=True)
+
+    @reconcile.command(name="status", aliases=["schedule"])
+    @commands.is_owner()
+    async def reconcile_status(self, ctx):
+        """Show the background reconcile schedule: last and next run for each repository."""
+        scheduler = self.cog.scheduler
+        interval = await self.cog.config.auto_reconcile_minutes()
+        rows = scheduler.status_rows()
+        lines = ["🗓️ **GenHub Background Reconcile**", ""]
+        if interval:
+            lines.append(f"• Default interval: every `{interval}` min (±{int(await self.cog.config.auto_reconcile_jitter() * 100)}% jitter)")
+        else:
+            lines.append("• Default interval: ⏸️ disabled (`!genhub autoreconcile <minutes>` to enable)")
+        if getattr(self.cog.handlers, "is_reconciling", False):
+            lines.append("• A reconciliation is running right now")
+        checkpoint = await self.cog.handlers.load_reconcile_checkpoint()
+        if checkpoint and not self.cog.handlers.is_reconciling:
+            synced = sum(len(j.get("synced", [])) for j in checkpoint.get("jobs", {}).values())
+            lines.append(f"• 💾 Interrupted run saved ({synced} items synced) — `!genhub reconcile resume` to continue")
+        lines.append("")
+        if not rows:
+            lines.append("ℹ️ No repositories scheduled yet.")
+        for repo, next_at, last in rows:
+            next_str = f"<t:{int(next_at)}:R>" if next_at else "not scheduled"
+            if last.get("at"):
+                last_str = f"<t:{int(last['at'])}:R> — {last.get('status', 'unknown')} ({last.get('duration', 0)}s)"
+            else:
+                last_str = "never"
+            lines.append(f"• `{repo}` → next: {next_str} • last: {last_str}")
+        await ctx.send("\n".join(lines)[:1990])
+
+    @genhub.command(aliases=["autosync"])
+    @commands.is_owner()
+    async def autoreconcile(self, ctx, minutes: float, repo: str = None):
+        """Set the background reconcile interval in minutes (0 disables).
+
+        Usage:
+          !genhub autoreconcile 60            (all repositories)
+          !genhub autoreconcile 15 owner/repo (per-repo override, 0 to disable that repo)
+        """
+        minutes = max(0.0, minutes)
+        if repo:
+            repo = repo.strip().lstrip("/")
+            async with self.cog.config.auto_reconcile_repo_minutes() as overrides:
+                overrides[repo] = minutes
+            await ctx.send(f"✅ Background reconcile for `{repo}` set to every `{minutes:g}` min" if minutes else f"✅ Background reconcile disabled for `{repo}`")
+        else:
+            await self.cog.config.auto_reconcile_minutes.set(minutes)
+            await ctx.send(f"✅ Background reconcile set to every `{minutes:g}` min" if minutes else "✅ Background reconcile disabled")
+        # Reschedule from the new interval on the next tick
+        self.cog.scheduler.next_run.clear()
+
+    @genhub.command(aliases=["reconcileconcurrency"])
+    @commands.is_owner()
+    async def reconcileworkers(self, ctx, total: int, per_repo: int = None):
+        """Set the shared reconcile worker budget and the per-repository cap.
+
+        Usage: !genhub reconcileworkers <total> [per_repo]
+        """
+        total = max(1, total)
+        await self.cog.config.reconcile_concurrency.set(total)
+        if per_repo is not None:
+            await self.cog.config.reconcile_repo_concurrency.set(max(1, min(per_repo, total)))
+        per_repo = await self.cog.config.reconcile_repo_concurrency()
+        await ctx.send(f"✅ Reconcile budget set to `{total}` shared workers (at least `{min(per_repo, total)}` per repository).")
+
+    @genhub.command()
+    @commands.is_owner()
+    async def coalesce(self, ctx, window_ms: int):
+        """Merge label, assignee and edit bursts for one issue/PR arriving within `window_ms` (0 disables).
+
+        Usage: !genhub coalesce <window_ms>
+        """
+        window_ms = max(0, window_ms)
+        await self.cog.config.coalesce_window_ms.set(window_ms)
+        if not window_ms:
+            return await ctx.send("⏸️ Event coalescing disabled; every label, assignee and edit event is handled on its own.")
+        await ctx.send(f"✅ Label, assignee and edit events for the same issue/PR within `{window_ms} ms` are merged into one update.")
+
+    @genhub.command()
+    @commands.is_owner()
+    async def logbatch(self, ctx, seconds: int):
+        """Summarize label and assignee log lines per repository every `seconds` (0 logs each one).
+
+        Usage: !genhub logbatch <seconds>
+        """
+        seconds = max(0, seconds)
+        await self.cog.config.log_batch_seconds.set(seconds)
+        if not seconds:
+            return await ctx.send("⏸️ Label and assignee changes are logged one message per event.")
+        await ctx.send(f"✅ Label and assignee changes are summarized per repository every `{seconds}s` in the log channel.")
+
+    @genhub.command()
+    @commands.is_owner()
+    async def draintimeout(self, ctx, seconds: int):
+        """Set how long an unload waits for in-flight deliveries, review batches and reconciles.
+
+        Usage: !genhub draintimeout <seconds>
+        """
+        seconds = max(0, seconds)
+        await self.cog.config.drain_timeout_seconds.set(seconds)
+        if not seconds:
+            return await ctx.send("⏸️ Unload no longer waits; in-flight work is persisted or redelivered on the next load.")
+        await ctx.send(f"✅ Unload will wait up to `{seconds}s` for in-flight work before persisting the rest.")
+
+    @genhub.command()
+    @commands.is_owner()
+    async def offload(self, ctx, workers: int, threshold_kb: int = None):
+        """Decode and render payloads larger than `threshold_kb` in `workers` worker processes (0 disables).
+
+        Usage: !genhub offload <workers> [threshold_kb]
+        """
+        await self.cog.config.offload_workers.set(max(0, workers))
+        if threshold_kb is not None:
+            await self.cog.config.offload_threshold_kb.set(max(0, threshold_kb))
+        offloader = self.cog.offloader
+        await offloader.load()
+        if not offloader.workers:
+            return await ctx.send("⏸️ Payload offloading disabled; everything is decoded and rendered in-process.")
+        await ctx.send(
+            f"✅ Payloads of `{offloader.threshold // 1024}` KB or more will be processed by "
+            f"`{offloader.workers}` worker process(es)."
+        )
+
+    @genhub.group(name="events", invoke_without_command=True)
+    async def events(self, ctx):
+        """Show which GitHub webhook events are processed and which were skipped since startup."""
+        from .handlers import resolve_event_filter
+
+        allowlist = await self.cog.config.event_allowlist()
+        event_filter = resolve_event_filter(tuple(str(entry) for entry in allowlist or ()))
+        lines = ["📡 **GitHub Webhook Events**", ""]
+        if allowlist:
+            lines.append("• Allowlist: " + ", ".join(f"`{entry}`" for entry in allowlist))
+        else:
+            lines.append("• Allowlist: everything GenHub handles (`!genhub events allow <event[.action]>...` to narrow)")
+        for event, actions in event_filter.items():
+            if event != "ping":
+                lines.append(f"  • `{event}`: " + (", ".join(sorted(actions)) if actions is not None else "all actions"))
+
+        enable = [event for event in event_filter if event != "ping"]
+        lines += ["", "✅ **Enable on the GitHub hook:** " + ", ".join(f"`{event}`" for event in enable)]
+
+        skipped = getattr(self.cog.webhook, "skipped", {})
+        if skipped:
+            top = sorted(skipped.items(), key=lambda item: -item[1])
+            lines.append("⏭️ **Skipped since startup:** " + ", ".join(f"`{key}` ×{count}" for key, count in top[:15]))
+            if skipped.get("other"):
+                lines.append("💡 **Events GenHub doesn't handle reached the hook:** untick everything except the events above to save traffic")
+            disable = sorted(key for key in skipped if "." not in key and key != "other")
+            if disable:
+                lines.append("💡 **Excluded by the allowlist, disable on the hook:** " + ", ".join(f"`{key}`" for key in disable))
+        await ctx.send("\n".join(lines)[:1990])
+
+    @events.command(name="allow")
+    async def events_allow(self, ctx, *entries: str):
+        """Only process these events (`issues`) or event actions (`pull_request_review.submitted`).
+
+        Usage: !genhub events allow issues pull_request issue_comment.created
+        """
+        from .handlers import HANDLED_EVENTS
+
+        invalid = []
+        for entry in entries:
+            event, _, action = entry.partition(".")
+            if event not in HANDLED_EVENTS:
+                invalid.append(entry)
+            elif action and HANDLED_EVENTS[event] is not None and action not in HANDLED_EVENTS[event]:
+                invalid.append(entry)
+        if not entries or invalid:
+            handled = ", ".join(f"`{event}`" for event in HANDLED_EVENTS if event != "ping")
+            return await ctx.send(f"⚠️ Unknown or unhandled: {', '.join(f'`{e}`' for e in invalid) or '(none given)'}. Handled events: {handled}")
+        await self.cog.config.event_allowlist.set(list(entries))
+        await ctx.send("✅ Only these deliveries will be processed: " + ", ".join(f"`{entry}`" for entry in entries))
+
+    @events.command(name="reset", aliases=["all"])
+    async def events_reset(self, ctx):
+        """Process every event GenHub has a handler for."""
+        await self.cog.config.event_allowlist.set([])
+        await ctx.send("✅ Event allowlist cleared; every handled event will be processed.")
+
+    @genhub.command()
+    @commands.is_owner()
+    async def spool(self, ctx, path: str = None):
+        """Consume deliveries from the ingest service's spool file (`-` to stop), or show its status.
+
+        Usage: !genhub spool [/path/to/genhub-spool.db | -]
+        """
+        consumer = self.cog.spool_consumer
+        if path is not None:
+            await self.cog.config.spool_path.set("" if path == "-" else path)
+            await consumer.start()
+            if path == "-":
+                return await ctx.send("⏸️ Spool mode off; deliveries are only taken from the webhook server.")
+            if not consumer.spool:
+                return await ctx.send(f"❌ Could not open spool `{path}`; check the path and permissions.")
+        if not consumer.spool:
+            return await ctx.send("ℹ️ Spool mode is off. Run `python -m GenHub.ingest --spool <file>` and then `!genhub spool <file>`.")
+        last = f"<t:{int(consumer.last_consumed_at)}:R>" if consumer.last_consumed_at else "never"
+        await ctx.send(
+            f"📼 Consuming `{consumer.spool.path}` • offset `{consumer.offset}` • backlog `{await consumer.backlog()}`\n"
+            f"• Handled: `{consumer.consumed}` • duplicates skipped: `{consumer.duplicates}` • failed: `{consumer.failed}` • last: {last}"
+        )
+
+    # ---------------------------
+    # Route Profiles
+    # ---------------------------
+
+    @genhub.group(name="route", aliases=["routes"], invoke_without_command=True)
+    async def route(self, ctx):
+        """List route profiles: which repositories use which forums, channels, role and webhook secret."""
+        from .routing import ROUTE_KEYS
+
+        profiles = await self.cog.config.route_profiles()
+        if not profiles:
+            return await ctx.send("ℹ️ No route profiles; every repository uses the global settings. `!genhub route repo <profile> <owner/repo>` creates one.")
+        lines = ["🧭 **GenHub Route Profiles**", ""]
+        for name, profile in profiles.items():
+            repos = ", ".join(f"`{r}`" for r in profile.get("repos", [])) or "*no repositories*"
+            lines.append(f"**{name}** → {repos}")
+            settings = [f"{key}: <#{profile[key]}>" if key != "contributor_role_id" else f"{key}: <@&{profile[key]}>" for key in ROUTE_KEYS if profile.get(key)]
+            if profile.get("secret"):
+                settings.append("🔒 own webhook secret")
+            lines.append("  • " + (" • ".join(settings) if settings else "uses the global settings"))
+        await ctx.send("\n".join(lines)[:1990])
+
+    @route.command(name="repo", aliases=["add"])
+    async def route_repo(self, ctx, name: str, repo: str):
+        """Route `repo` through profile `name` (created if needed) and allow it.
+
+        Usage: !genhub route repo <profile> <owner/repo>
+        """
+        repo = repo.strip().lstrip("/")
+        async with self.cog.config.route_profiles() as profiles:
+            for other, profile in profiles.items():
+                if other != name and repo.lower() in (r.lower() for r in profile.get("repos", [])):
+                    return await ctx.send(f"⚠️ `{repo}` is already routed by profile **{other}**; remove it there first.")
+            profile = profiles.setdefault(name, {"repos": []})
+            if repo not in profile["repos"]:
+                profile["repos"].append(repo)
+        async with self.cog.config.allowed_repos() as repos:
+            if repo not in repos:
+                repos.append(repo)
+        await self.cog.routes.load()
+        await ctx.send(f"✅ `{repo}` now uses route profile **{name}**. Set its channels with `!genhub route set {name} <setting> <id>`.")
+
+    @route.command(name="set")
+    async def route_set(self, ctx, name: str, setting: str, *, value: str = ""):
+        """Set a profile's `secret` or channel/role override (empty or `-` clears it).
+
+        Settings: secret, issues_forum, prs_forum, issues_feed_chat, prs_feed_chat, updates_channel, contributor_role
+        Usage: !genhub route set <profile> <setting> <value>
+        """
+        from .routing import ROUTE_KEYS
+
+        setting = setting.lower().strip()
+        key = setting if setting in ROUTE_KEYS or setting == "secret" else f"{setting}_id"
+        if key not in ROUTE_KEYS and key != "secret":
+            return await ctx.send(f"⚠️ Unknown setting `{setting}`. Valid: `secret`, " + ", ".join(f"`{k[:-3]}`" for k in ROUTE_KEYS))
+        value = value.strip()
+        clear = value in ("", "-", "none", "clear")
+        if not clear and key != "secret":
+            resolve = self._resolve_role_id if key == "contributor_role_id" else self._resolve_channel_id
+            value = resolve(ctx.guild, value)
+            if value is None:
+                return await ctx.send(f"⚠️ Could not resolve `{setting}`; mention it or paste its ID.")
+        async with self.cog.config.route_profiles() as profiles:
+            if name not in profiles:
+                return await ctx.send(f"⚠️ No route profile **{name}**. Create it with `!genhub route repo {name} <owner/repo>`.")
+            if clear:
+                profiles[name].pop(key, None)
+            else:
+                profiles[name][key] = value
+        await self.cog.routes.load()
+        if key == "secret":
+            return await ctx.send(f"✅ Webhook secret for **{name}** {'cleared (the global secret applies)' if clear else 'updated'}.")
+        await ctx.send(f"✅ **{name}** `{key}` {'cleared (the global setting applies)' if clear else f'set to `{value}`'}.")
+
+    @route.command(name="remove", aliases=["delete", "del"])
+    async def route_remove(self, ctx, name: str, repo: str = None):
+        """Delete profile `name`, or only take `repo` out of it (the repo stays allowed).
+
+        Usage: !genhub route remove <profile> [owner/repo]
+        """
+        async with self.cog.config.route_profiles() as profiles:
+            if name not in profiles:
+                return await ctx.send(f"⚠️ No route profile **{name}**.")
+            if repo:
+                repo = repo.strip().lstrip("/")
+                profiles[name]["repos"] = [r for r in profiles[name].get("repos", []) if r.lower() != repo.lower()]
+            else:
+                del profiles[name]
+        await self.cog.routes.load()
+        await ctx.send(f"✅ Removed `{repo}` from **{name}**." if repo else f"✅ Deleted route profile **{name}**; its repositories use the global settings.")
 
     @genhub.command(aliases=["stopreconcile", "cancelsync"])
     @commands.is_owner()
@@ -639,6 +967,61 @@ class ConfigCommands(commands.Cog):
         self.cog.thread_cache.clear()
         await ctx.send("✅ Thread cache cleared. Next reconcile will do fresh lookups.")
 
+    @genhub.command(aliases=["archiveindex"])
+    @commands.is_owner()
+    async def archivecrawl(self, ctx, hours: float = None):
+        """Index archived forum threads now, or set the crawl interval in hours (0 disables).
+
+        The first crawl walks every archived thread; later crawls only fetch newer archives.
+        """
+        crawler = self.cog.archive_crawler
+        if hours is not None:
+            await self.cog.config.archive_crawl_hours.set(max(0.0, hours))
+            return await ctx.send(f"✅ Archived threads will be re-indexed every `{max(0.0, hours)}` hours." if hours > 0 else "⏸️ Nightly archive crawl disabled.")
+        if crawler.crawling:
+            return await ctx.send("ℹ️ An archive crawl is already running.")
+        await ctx.send("🗄️ Crawling archived threads... this can take a while the first time.")
+        added = await crawler.crawl_all()
+        lines = [f"✅ Archive crawl finished: `{added}` new threads indexed."]
+        for forum_id, count, complete, crawled_at in crawler.status():
+            when = f"<t:{int(crawled_at)}:R>" if crawled_at else "never"
+            lines.append(f"• <#{forum_id}>: `{count}` archived threads ({'complete' if complete else 'partial'}, last crawl {when})")
+        await ctx.send("\n".join(lines)[:1990])
+
+    @genhub.command()
+    @commands.is_owner()
+    async def trace(self, ctx, delivery: str):
+        """Show the span tree recorded for a webhook delivery (its `X-GitHub-Delivery` ID)."""
+        from .tracing import tracer, render_trace
+
+        found = tracer.get(delivery)
+        data = found.to_dict() if found else None
+        if data is None:
+            path = await self.cog.config.trace_jsonl_path()
+            if path:
+                data = tracer.find_jsonl(path, delivery)
+        if data is None:
+            return await ctx.send(f"❌ No trace recorded for delivery `{delivery}`.")
+        await ctx.send(f"```\n{render_trace(data, 1900)}\n```")
+
+    @genhub.command()
+    @commands.is_owner()
+    async def traceslow(self, ctx, ms: int, path: str = None):
+        """Dump traces of deliveries slower than `ms` milliseconds (0 disables).
+
+        With `path`, slow traces are appended to that JSONL file instead of the log channel (`-` to clear).
+        """
+        await self.cog.config.trace_slow_ms.set(max(0, ms))
+        if path is not None:
+            await self.cog.config.trace_jsonl_path.set("" if path == "-" else path)
+        if ms <= 0:
+            return await ctx.send("⏸️ Slow delivery traces disabled.")
+        target = "the log channel" if path in (None, "-") else f"`{path}`"
+        if path is None:
+            saved = await self.cog.config.trace_jsonl_path()
+            target = f"`{saved}`" if saved else "the log channel"
+        await ctx.send(f"✅ Deliveries slower than `{ms}` ms will be traced to {target}.")
+
     @genhub.command()
     async def testrepo(self, ctx, repo: str):
         """Test access to a GitHub repository."""
@@ -1,4 +1,10 @@
 import asyncio
+import hashlib
+import inspect
+import json
+import time
+
+import discord
 from redbot.core import commands, Config
 from redbot.core.bot import Red
 
@@ -6,6 +12,39 @@ from .webhook import WebhookServer
 from .handlers import GitHubEventHandlers
 from .config_commands import ConfigCommands
 from .slash_commands import SlashCommands
+from .scheduler import ReconcileScheduler
+from .spool import SpoolConsumer
+from .archive_crawler import ArchiveCrawler
+from .log import log, setup_logging, stop_logging
+from .offload import PayloadOffloader
+from .routing import RouteTable
+from .utils import invalidate_thread
+
+# Guild slash command syncs sent to Discord at once
+SYNC_CONCURRENCY = 4
+
+
+def _command_signature(tree):
+    """Return ``guild -> hash`` of the commands a sync would upload, or None if ``tree`` can't be hashed."""
+    if not isinstance(tree, discord.app_commands.CommandTree):
+        return None
+
+    def to_dict(cmd):
+        # Newer discord.py serializes against the tree (for translations); older versions take no arguments
+        try:
+            takes_tree = bool(inspect.signature(cmd.to_dict).parameters)
+        except (TypeError, ValueError):
+            takes_tree = True
+        return cmd.to_dict(tree) if takes_tree else cmd.to_dict()
+
+    def signature(guild):
+        try:
+            payload = [to_dict(cmd) for cmd in tree.get_commands(guild=guild)]
+            return hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode()).hexdigest()
+        except Exception as e:
+            log.debug("🔍 Could not hash slash commands for guild %s, syncing anyway: %s", getattr(guild, "id", guild), e)
+            return None
+    return signature
 
 
 class GenHub(commands.Cog):
@@ -30,30 +69,66 @@ class GenHub(commands.Cog):
             "github_token": "",
             "whitelisted_users": [135370180913004544],
             "thread_cache": {},
+            "pending_reviews": {},
+            "auto_reconcile_minutes": 0,
+            "auto_reconcile_repo_minutes": {},
+            "auto_reconcile_jitter": 0.2,
+            "auto_reconcile_quiet_minutes": 10,
+            "auto_reconcile_min_ratelimit": 500,
+            "reconcile_schedule": {},
+            "reconcile_checkpoint": {},
+            "synced_comments": {},
+            "archive_index": {},
+            "archive_crawl_hours": 24,
+            "reconcile_concurrency": 6,
+            "reconcile_repo_concurrency": 2,
+            "reconcile_write_burst": 20,
+            "trace_slow_ms": 2000,
+            "trace_jsonl_path": "",
+            "log_json": False,
+            "offload_workers": 0,
+            "offload_threshold_kb": 64,
+            "event_allowlist": [],
+            "webhook_max_body_kb": 25 * 1024,
+            "route_profiles": {},
+            "spool_path": "",
+            "drain_timeout_seconds": 20,
+            "slash_sync_hashes": {},
+            "coalesce_window_ms": 1500,
+            "coalesce_pending": [],
+            "log_batch_seconds": 10,
         }
         self.config.register_global(**default_global)
 
         self.thread_cache = {}
+        # Set once warmup has read the saved cache; unload only writes it back after that
+        self.thread_cache_loaded = False
         self.webhook = WebhookServer(self)
         self.handlers = GitHubEventHandlers(self)
+        self.scheduler = ReconcileScheduler(self)
+        self.archive_crawler = ArchiveCrawler(self)
+        self.offloader = PayloadOffloader(self)
+        self.routes = RouteTable(self)
+        self.spool_consumer = SpoolConsumer(self)
 
     async def cog_load(self):
-        # Start webhook server
-        self.task = asyncio.create_task(self.webhook.start())
+        # Console logging goes through a background queue (JSON lines when log_json is set)
+        json_logs = self.config.log_json()
+        if inspect.isawaitable(json_logs):
+            json_logs = await json_logs
+        setup_logging(json_output=json_logs is True)
 
-        # Load thread cache
-        self.thread_cache = await self.config.thread_cache()
+        # Worker processes for decoding/rendering large payloads (off unless offload_workers is set)
+        await self.offloader.load()
 
-        # Sync slash commands
-        try:
-            for guild in self.bot.guilds:
-                await self.bot.tree.sync(guild=guild)
-                print(
-                    f"✅ GenHub slash commands synced to guild: "
-                    f"{guild.name} ({guild.id})"
-                )
-        except Exception as e:
-            print(f"⚠️ Failed to sync slash commands: {e}")
+        # Per-repository forums/channels/secrets for multi-org setups
+        await self.routes.load()
+
+        # Caches warm in the background; deliveries wait for this and /health reports "warming"
+        self.warm = asyncio.Event()
+
+        # Start webhook server
+        self.task = asyncio.create_task(self.webhook.start())
 
         # Register text commands cog
         try:
@@ -62,7 +137,6 @@ class GenHub(commands.Cog):
             pass
 
         # Register slash commands
-        import discord
         slash_handler = SlashCommands(self)
         self.bot.tree.add_command(
             discord.app_commands.Command(
@@ -79,22 +153,165 @@ class GenHub(commands.Cog):
             )
         )
 
+        # Warmup and slash command sync run after cog_load returns, so the bot finishes loading
+        self.startup_task = asyncio.create_task(self._start_background())
+
+    async def _start_background(self):
+        await asyncio.gather(self.warm_up(), self.sync_slash_commands())
+
+    async def warm_up(self):
+        """Load the thread, archive, comment and tag caches, then start the background workers."""
+        started = time.perf_counter()
+        try:
+            await self._load_caches()
+
+            # Replay review batches and coalesced event bursts that were still queued when the cog was
+            # last unloaded. This happens before deliveries are let through, so new events join them.
+            await self.handlers.restore_pending_reviews()
+            await self.handlers.coalescer.restore()
+        finally:
+            self.warm.set()
+        log.info("🔥 GenHub caches warmed in %.2fs", time.perf_counter() - started)
+
+        self.archive_crawler.start()
+
+        # Deliveries spooled by the standalone ingest service (idle unless spool_path is set)
+        await self.spool_consumer.start()
+
+        # Background incremental reconciles (idle unless auto_reconcile_minutes is set)
+        self.scheduler.start()
+
+    async def _load_caches(self):
+        """Warm each cache in turn; a failure leaves the rest cold instead of blocking startup."""
+        try:
+            # Load thread cache
+            self.thread_cache = await self.config.thread_cache()
+            self.thread_cache_loaded = True
+
+            # Archived threads indexed by earlier crawls, then keep the index fresh nightly
+            await self.archive_crawler.hydrate()
+
+            # Comment URLs already mirrored into each thread (lets reconcile dedup without history reads)
+            await self.handlers.comment_index.load()
+
+            # Forum channels and their status tags, plus the encoded webhook secret
+            await self.handlers.warm_forum_tags()
+            await self.webhook._secret_key()
+        except Exception as e:
+            log.warning("⚠️ Cache warmup incomplete, continuing with cold caches: %s", e)
+
+    async def sync_slash_commands(self):
+        """Sync slash commands to every guild concurrently, skipping guilds whose command set is unchanged."""
+        hashes = self.config.slash_sync_hashes()
+        if inspect.isawaitable(hashes):
+            hashes = await hashes
+        hashes = dict(hashes) if isinstance(hashes, dict) else {}
+        signature = _command_signature(self.bot.tree)
+        semaphore = asyncio.Semaphore(SYNC_CONCURRENCY)
+
+        async def sync(guild):
+            digest = signature(guild) if signature else None
+            if digest and hashes.get(str(guild.id)) == digest:
+                log.debug("⏭️ Slash commands unchanged for guild %s, skipping sync", guild.id)
+                return
+            async with semaphore:
+                try:
+                    await self.bot.tree.sync(guild=guild)
+                except Exception as e:
+                    log.warning("⚠️ Failed to sync slash commands: %s", e)
+                    return
+            log.info("✅ GenHub slash commands synced to guild: %s (%s)", guild.name, guild.id)
+            if digest:
+                hashes[str(guild.id)] = digest
+
+        await asyncio.gather(*(sync(guild) for guild in self.bot.guilds))
+        if signature:
+            await self.config.slash_sync_hashes.set(hashes)
+
+    @commands.Cog.listener()
+    async def on_raw_thread_delete(self, payload):
+        """Evict deleted threads from every index so the next event re-finds or recreates them."""
+        thread_id = payload.thread_id
+        if invalidate_thread(self.thread_cache, thread_id):
+            log.info("🗑️ Thread %s was deleted, removed from cache", thread_id)
+        self.handlers.comment_index.forget(thread_id)
+        self.archive_crawler.forget(thread_id)
+
+    async def drain(self):
+        """Stop taking deliveries, then let in-flight work finish before the unload tears things down.
+
+        In-flight webhook handlers, the spool consumer's current delivery and a running reconcile
+        (asked to stop at its next checkpoint) get until ``drain_timeout_seconds``; queued review
+        batches are then posted immediately instead of after their debounce. Whatever misses the
+        deadline is persisted by the usual unload steps and picked up by the next ``cog_load``.
+        """
+        timeout = self.config.drain_timeout_seconds()
+        if inspect.isawaitable(timeout):
+            timeout = await timeout
+        if not isinstance(timeout, (int, float)) or isinstance(timeout, bool):
+            timeout = 20
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + max(0, timeout)
+
+        def remaining():
+            return max(0.0, deadline - loop.time())
+
+        self.webhook.stop_accepting()
+        busy_hooks, spool_clean, reconcile_done = await asyncio.gather(
+            self.webhook.drain(remaining()),
+            self.spool_consumer.drain(remaining()),
+            self.handlers.wait_for_reconcile(remaining()),
+        )
+        # Label/assignee/edit bursts still inside their merge window run now
+        unmerged = await self.handlers.coalescer.flush(remaining())
+        unposted = await self.handlers.flush_pending_reviews(remaining())
+        await self.handlers.log_batcher.flush()
+
+        if busy_hooks or not spool_clean or not reconcile_done or unposted or unmerged:
+            log.warning(
+                "⚠️ Drain deadline (%ss) reached: %s delivery(ies) in flight, %s coalesced burst(s) unflushed, %s review batch(es) unposted%s%s; persisting the rest",
+                timeout, busy_hooks, unmerged, unposted,
+                ", spool delivery interrupted" if not spool_clean else "",
+                ", reconcile still running" if not reconcile_done else "",
+            )
+        else:
+            log.info("✅ Drained in-flight work in %.1fs", max(0, timeout) - remaining())
+
     async def cog_unload(self):
+        startup = getattr(self, "startup_task", None)
+        if startup and not startup.done():
+            startup.cancel()
+            try:
+                await startup
+            except (asyncio.CancelledError, Exception):
+                pass
+        await self.drain()
         await self.webhook.stop()
+        await self.spool_consumer.stop()
+        await self.scheduler.stop()
+        await self.archive_crawler.stop()
+        # An unload that cancelled warmup before it read the saved batches must not overwrite them
+        await self.handlers.suspend_pending_reviews(save=self.handlers.pending_reviews_loaded)
+        await self.handlers.coalescer.suspend(save=self.handlers.coalescer.loaded)
+        await self.handlers.comment_index.close()
+        self.offloader.close()
         try:
             await self.bot.remove_cog("ConfigCommands")
         except Exception:
             pass
-        # Save thread cache safely (extract thread IDs if stored as Thread objects)
-        try:
-            serialized_cache = {}
-            for k, v in self.thread_cache.items():
-                str_key = str(k)
-                thread_id = getattr(v, "id", v)
-                if isinstance(thread_id, int):
-                    serialized_cache[str_key] = thread_id
-            await self.config.thread_cache.set(serialized_cache)
-        except Exception:
-            pass
+        # Save thread cache safely (extract thread IDs if stored as Thread objects), unless warmup
+        # was cancelled before loading it; saving then would overwrite it with an empty cache
+        if self.thread_cache_loaded:
+            try:
+                serialized_cache = {}
+                for k, v in self.thread_cache.items():
+                    str_key = str(k)
+                    thread_id = getattr(v, "id", v)
+                    if isinstance(thread_id, int):
+                        serialized_cache[str_key] = thread_id
+                await self.config.thread_cache.set(serialized_cache)
+            except Exception:
+                pass
         if hasattr(self, "task"):
             self.task.cancel()
+        stop_logging()
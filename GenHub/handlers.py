@@ -1,31 +1,130 @@
 import discord
 import asyncio
 import aiohttp
+import contextlib
+import functools
+import json
 import re
 import time
+from .archive_crawler import ArchiveCrawler
+from .coalesce import EventCoalescer
+from .log_batch import LogBatcher
+from .comment_index import SyncedCommentIndex
+from .metrics import metrics
+from .offload import PayloadOffloader
+from .routing import RouteTable
+from .log import log
+from .tracing import detached_task, tracer, traced
 from .utils import (
     send_message,
     get_role_mention,
     format_message,
     get_issue_tags,
     get_pr_tags,
+    issue_tag_names,
+    pr_tag_names,
     update_status_tag,
     get_or_create_thread,
     find_thread,
     get_or_create_tag,
     is_bot_author,
-    clean_github_markdown,
+    render_markdown,
+    EMBED_RENDER_LIMIT,
+    TRUNCATED_SUFFIX,
     create_comment_embed,
     create_review_link_view,
     format_log_line,
     format_comment_preview,
+    format_duration,
     find_comment_message,
+    invalidate_thread,
 )
 
 GITHUB_ISSUE_RE = re.compile(
     r"https://github\.com/([^/]+)/([^/]+)/(issues|pull)/(\d+)"
 )
 
+# Minimum seconds between reconcile checkpoint writes while a run is in progress
+CHECKPOINT_SAVE_INTERVAL = 5.0
+# Pause between bursts of Discord writes during the reconcile apply phase
+RECONCILE_WRITE_PAUSE = 1.0
+
+# Debounce windows for batching review parts before posting to Discord
+REVIEW_FLUSH_DELAY = 2.0
+BOT_REVIEW_FLUSH_DELAY = 6.0
+
+# Events with a handler, mapped to the actions it acts on (None: every action). The webhook
+# acknowledges and drops anything else before decoding the body.
+HANDLED_EVENTS = {
+    "ping": None,
+    "issues": None,
+    "pull_request": None,
+    "issue_comment": frozenset({"created", "edited", "deleted"}),
+    "pull_request_review": frozenset({"submitted", "dismissed"}),
+    "pull_request_review_comment": frozenset({"created", "edited", "deleted"}),
+    "release": frozenset({"published", "created", "released"}),
+}
+
+
+@functools.lru_cache(maxsize=8)
+def resolve_event_filter(allowlist: tuple = ()) -> dict:
+    """Narrow ``HANDLED_EVENTS`` to an ``event_allowlist`` of ``"event"`` / ``"event.action"`` entries.
+
+    An empty allowlist keeps everything GenHub handles; entries naming unhandled events or
+    actions are ignored, since allowing them could not make anything handle them. ``ping`` is
+    always accepted so GitHub's hook test keeps working.
+    """
+    if not allowlist:
+        return HANDLED_EVENTS
+    events, actions = {"ping": None}, {}
+    for entry in allowlist:
+        event, _, action = str(entry).strip().partition(".")
+        if event not in HANDLED_EVENTS:
+            continue
+        if not action:
+            events[event] = HANDLED_EVENTS[event]
+        elif HANDLED_EVENTS[event] is None or action in HANDLED_EVENTS[event]:
+            actions.setdefault(event, set()).add(action)
+    for event, names in actions.items():
+        events.setdefault(event, frozenset(names))
+    return events
+
+def _assignee_change(data: dict, item: dict):
+    """``(name, markdown)`` naming who an assign/unassign event is about.
+
+    Coalesced bursts carry their net change in ``assignee_changes`` (``+alice, -bob``); a single
+    event names the item's assignee.
+    """
+    change = data.get("assignee_changes")
+    if change:
+        logins = [("+", n) for n in change.get("added", [])] + [("-", n) for n in change.get("removed", [])]
+        name = ", ".join(f"{sign}{login}" for sign, login in logins)
+        return name, ", ".join(f"{sign}[{login}](https://github.com/{login})" for sign, login in logins)
+    assignee = item.get("assignee")
+    if not assignee:
+        return "Unknown", "Unknown"
+    return assignee["login"], f"[{assignee['login']}]({assignee['html_url']})"
+
+
+# Item fields that flushing a review batch reads back (tags, thread title/url, timestamps)
+_REVIEW_ITEM_FIELDS = ("number", "title", "html_url", "state", "merged", "merged_at", "assignee", "assignees", "created_at")
+
+
+def _slim_review_payload(data: dict) -> dict:
+    """Reduce a webhook payload to the fields a review flush needs, so persisted batches stay small."""
+    slim = {}
+    for item_key in ("pull_request", "issue"):
+        item = data.get(item_key)
+        if isinstance(item, dict):
+            slim_item = {k: item[k] for k in _REVIEW_ITEM_FIELDS if k in item}
+            if isinstance(item.get("pull_request"), dict):
+                slim_item["pull_request"] = {"merged_at": item["pull_request"].get("merged_at")}
+            slim[item_key] = slim_item
+    review = data.get("review")
+    if isinstance(review, dict):
+        slim["review"] = {k: review[k] for k in ("submitted_at", "state") if k in review}
+    return slim
+
 
 class RateLimiter:
     """GitHub API rate limiter with exponential backoff."""
@@ -48,7 +147,7 @@ class RateLimiter:
         if self.remaining < 100:
             wait_time = max(0, self.reset_time - time.time())
             if wait_time > 0:
-                print(f"⏳ Rate limit low ({self.remaining} remaining), waiting {wait_time:.0f}s...")
+                log.info("⏳ Rate limit low (%s remaining), waiting %.0fs...", self.remaining, wait_time)
                 await asyncio.sleep(wait_time + 1)
         
         self.last_request_time = time.time()
@@ -58,11 +157,84 @@ class RateLimiter:
         try:
             self.remaining = int(headers.get('X-RateLimit-Remaining', 5000))
             self.reset_time = int(headers.get('X-RateLimit-Reset', 0))
-            print(f"📊 Rate limit: {self.remaining} requests remaining")
+            log.debug("📊 Rate limit: %s requests remaining", self.remaining)
         except (ValueError, TypeError):
             pass
 
 
+class ReconcileBudget:
+    """Global worker budget shared by every repo/kind in a reconcile run.
+
+    Each repo may hold at most ``per_repo`` slots (issues and PRs combined), so a
+    repository with thousands of open items queues behind its own cap instead of
+    filling the global queue and starving smaller repositories.
+    """
+
+    def __init__(self, limit: int = 4, per_repo: int = 2):
+        self.limit = max(1, limit)
+        self.per_repo = max(1, min(per_repo, self.limit))
+        self._global = asyncio.Semaphore(self.limit)
+        self._repos = {}
+
+    @contextlib.asynccontextmanager
+    async def slot(self, repo: str):
+        repo_sem = self._repos.setdefault(repo, asyncio.Semaphore(self.per_repo))
+        async with repo_sem:
+            async with self._global:
+                yield
+
+
+class ReconcilePlan:
+    """Diff between GitHub (desired) and the forum (current) for one repo/kind.
+
+    Built entirely from reads during the plan phase; the apply phase then walks
+    ``items`` and ``orphans`` and performs the writes.
+    """
+
+    def __init__(self, repo: str, is_pr: bool):
+        self.repo = repo
+        self.is_pr = is_pr
+        self.items = []
+        self.orphans = []
+
+    def counts(self):
+        return {
+            "threads_to_create": sum(1 for p in self.items if p["create"]),
+            "tags_to_change": sum(1 for p in self.items if p["retag"]),
+            "initial_messages": sum(1 for p in self.items if p["send_initial"]),
+            "comments_to_post": sum(len(p["comments"]) for p in self.items),
+            "orphans_to_delete": len(self.orphans),
+        }
+
+    @staticmethod
+    def merge_counts(plans):
+        totals = {}
+        for plan in plans:
+            for key, value in plan.counts().items():
+                totals[key] = totals.get(key, 0) + value
+        return totals
+
+
+class ReconcileWritePacer:
+    """Spaces out Discord writes during the apply phase: bursts of ``burst`` writes, then a pause.
+
+    Shared by every worker of a run so concurrent items don't stack up on Discord's rate limits.
+    """
+
+    def __init__(self, burst: int = 20, pause: float = 1.0):
+        self.burst = max(1, burst)
+        self.pause = max(0.0, pause)
+        self._count = 0
+        self._lock = asyncio.Lock()
+
+    async def wait(self):
+        async with self._lock:
+            if self._count >= self.burst:
+                await asyncio.sleep(self.pause)
+                self._count = 0
+            self._count += 1
+
+
 LOG_LEVEL_HIERARCHY = {
     "error": 1,
     "errors": 1,
@@ -78,10 +250,19 @@ class GitHubEventHandlers:
     def __init__(self, cog):
         self.cog = cog
         self.pending_reviews = {}
+        self._flushing_reviews = {}
+        # Set once the batches saved by the previous cog instance have been read back
+        self.pending_reviews_loaded = False
+        self.coalescer = EventCoalescer(self)
+        self.log_batcher = LogBatcher(self)
         self.rate_limiter = RateLimiter()
         self.is_reconciling = False
         self.reconcile_cancelled = False
         self._last_bot_edit_log = {}
+        self.last_webhook_at = {}
+        self._checkpoint = None
+        self._checkpoint_saved_at = 0.0
+        self.comment_index = SyncedCommentIndex(cog)
 
     def _should_log_bot_edit(self, repo_full_name: str, number: int | str, author: str) -> bool:
         """Debounce rapid flurries of bot edits to keep log channel clean."""
@@ -95,9 +276,25 @@ class GitHubEventHandlers:
             return True
         return False
 
-    async def _get_config_id(self, key):
-        """Safely fetch a channel/role ID from cog config without crashing on Mock objects."""
+    def _route_override(self, repo, key):
+        routes = getattr(self.cog, "routes", None)
+        if repo and isinstance(routes, RouteTable):
+            return routes.get(repo, key)
+        return None
+
+    async def _route_config(self, repo, key):
+        """``key`` from ``repo``'s route profile when it sets one, else the global config value."""
+        value = self._route_override(repo, key)
+        if value is not None:
+            return value
+        return await getattr(self.cog.config, key)()
+
+    async def _get_config_id(self, key, repo=None):
+        """Safely fetch a channel/role ID (``repo``'s route first) from cog config without crashing on Mock objects."""
         import inspect
+        routed = self._route_override(repo, key)
+        if isinstance(routed, int):
+            return routed
         if not hasattr(self.cog, "config") or not hasattr(self.cog.config, key):
             return None
         attr = getattr(self.cog.config, key)
@@ -111,6 +308,20 @@ class GitHubEventHandlers:
         except Exception:
             return None
 
+    async def _get_config_int(self, key, default: int) -> int:
+        """Fetch a numeric tuning value from cog config, falling back to ``default``."""
+        import inspect
+        attr = getattr(getattr(self.cog, "config", None), key, None)
+        if attr is None:
+            return default
+        try:
+            val = attr()
+            if inspect.isawaitable(val):
+                val = await val
+        except Exception:
+            return default
+        return int(val) if isinstance(val, (int, float)) and not isinstance(val, bool) else default
+
     async def _should_log(self, level: str) -> bool:
         """Determine if a log message should be dispatched to Discord based on configured log level."""
         import inspect
@@ -128,6 +339,7 @@ class GitHubEventHandlers:
         required_level = LOG_LEVEL_HIERARCHY.get(level.lower(), 2)
         return current_threshold >= required_level
 
+    @traced()
     async def _resolve_target_channel(self, channel_id: int):
         """Retrieve a Discord TextChannel, ForumChannel, or Thread (Forum Post) reliably."""
         if not channel_id:
@@ -142,9 +354,26 @@ class GitHubEventHandlers:
                 pass
         return None
 
-    async def _get_or_discover_feed_chat(self, forum_id: int, config_key: str):
+    async def warm_forum_tags(self):
+        """Resolve every configured forum and create missing status tags, off the delivery path."""
+        routes = getattr(self.cog, "routes", None)
+        profiles = list(routes.profiles.values()) if isinstance(routes, RouteTable) else []
+        forums = {}
+        for key, names in (("issues_forum_id", ("Open", "Closed", "Active")), ("prs_forum_id", ("Open", "Closed", "Merged", "Active"))):
+            for forum_id in [await self._get_config_id(key)] + [p.get(key) for p in profiles]:
+                if isinstance(forum_id, int):
+                    forums.setdefault(forum_id, set()).update(names)
+        for forum_id, names in forums.items():
+            forum = await self._resolve_target_channel(forum_id)
+            if forum is None or not hasattr(forum, "available_tags"):
+                continue
+            for name in sorted(names):
+                await get_or_create_tag(forum, name)
+
+    @traced()
+    async def _get_or_discover_feed_chat(self, forum_id: int, config_key: str, repo: str = None):
         """Retrieve the configured chat channel/post, or automatically discover a chat/discussion post inside the forum."""
-        chat_id = await self._get_config_id(config_key)
+        chat_id = await self._get_config_id(config_key, repo)
         if chat_id:
             ch = await self._resolve_target_channel(chat_id)
             if ch:
@@ -229,6 +458,7 @@ class GitHubEventHandlers:
 
         return candidates[0] if candidates else None
 
+    @traced()
     async def _send_to_log_channel(self, formatted_message: str):
         """Helper to send a formatted message to the configured log channel with embeds suppressed."""
         log_channel_id = await self._get_config_id("log_channel_id")
@@ -241,17 +471,17 @@ class GitHubEventHandlers:
                     except (TypeError, discord.HTTPException):
                         await channel.send(formatted_message[:1950])
                 except Exception as e:
-                    print(f"⚠️ Failed to send log to channel: {e}")
+                    log.warning("⚠️ Failed to send log to channel: %s", e)
 
     async def log_error(self, message: str):
         """Log errors to console and Discord log channel (Level: errors)."""
-        print(f"❌ GenHub Error: {message}")
+        log.error("❌ GenHub Error: %s", message)
         if await self._should_log("error"):
             await self._send_to_log_channel(f"❌ **GenHub Error:**\n```{message[:1900]}```")
 
     async def log_info(self, message: str):
         """Log operational notices to console and Discord log channel (Level: info)."""
-        print(f"ℹ️ {message}")
+        log.info("ℹ️ %s", message)
         if await self._should_log("info"):
             badge_emojis = ("🆕", "🔄", "💬", "🏷️", "🚀", "🟣", "❌", "🎉", "📦", "✏️", "🗑️", "📝", "⚡", "📌", "🔒", "🔓", "📋", "👤", "🤖", "ℹ️", "✅", "⚠️", "🏓")
             prefix = "" if any(message.startswith(e) for e in badge_emojis) else "ℹ️ "
@@ -259,7 +489,7 @@ class GitHubEventHandlers:
 
     async def log_audit(self, message: str):
         """Log audit notices to console and Discord log channel (Level: info/audit)."""
-        print(f"📋 {message}")
+        log.info("📋 %s", message)
         if await self._should_log("audit"):
             badge_emojis = ("📋", "🏓", "🔒", "⚙️", "ℹ️")
             prefix = "" if any(message.startswith(e) for e in badge_emojis) else "📋 "
@@ -267,7 +497,7 @@ class GitHubEventHandlers:
 
     async def log_debug(self, message: str):
         """Log verbose debugging info to console and Discord log channel (Level: verbose/debug/all)."""
-        print(f"🔍 {message}")
+        log.debug("🔍 %s", message)
         if await self._should_log("debug"):
             badge_emojis = ("🔍", "ℹ️", "📦", "💬", "📝", "🔄", "✏️", "🗑️")
             prefix = "" if any(message.startswith(e) for e in badge_emojis) else "🔍 "
@@ -278,23 +508,30 @@ class GitHubEventHandlers:
         await self.rate_limiter.wait()
         
         try:
-            async with session.request(method, url) as resp:
+            async with tracer.span("github", method=method, path=url.split("api.github.com", 1)[-1].split("?", 1)[0]), session.request(method, url) as resp:
                 self.rate_limiter.update_from_headers(resp.headers)
+                metrics.inc("genhub_github_api_calls_total", status=resp.status)
+                if resp.status == 401:
+                    metrics.mark("github_auth_failure")
+                elif resp.status < 400:
+                    metrics.mark("github_ok")
                 
                 # Handle rate limit exceeded
                 if resp.status == 403 and 'rate limit' in (await resp.text()).lower():
                     reset_time = int(resp.headers.get('X-RateLimit-Reset', 0))
                     wait_time = max(0, reset_time - time.time()) + 5
-                    print(f"⏳ Rate limit exceeded, waiting {wait_time:.0f}s...")
+                    log.warning("⏳ Rate limit exceeded, waiting %.0fs...", wait_time)
                     await asyncio.sleep(wait_time)
                     # Retry once
                     return await self._make_github_request(session, url, method)
                 
                 return resp.status, await resp.json() if resp.status == 200 else None
         except Exception as e:
-            print(f"❌ Request failed for {url}: {e}")
+            metrics.inc("genhub_github_api_calls_total", status="error")
+            log.error("❌ Request failed for %s: %s", url, e)
             return None, None
 
+    @traced()
     async def _fetch_comments(self, session, repo, number, is_pr):
         """Fetch all comments for an issue or PR."""
         comments = []
@@ -358,6 +595,13 @@ class GitHubEventHandlers:
         comments.sort(key=lambda c: c.get('created_at', ''))
         return comments
 
+    async def _comment_embed(self, **kwargs):
+        """``create_comment_embed``, rendered in the offload pool when the body is large enough."""
+        offloader = getattr(self.cog, "offloader", None)
+        if isinstance(offloader, PayloadOffloader) and offloader.should_offload(len(kwargs.get("body") or "")):
+            return await offloader.comment_embed(**kwargs)
+        return create_comment_embed(**kwargs)
+
     async def _post_comment_to_thread(self, thread, comment, role_mention, extra_count: int = 0, repo: str = None):
         """Post a single comment to a Discord thread formatted as a sleek Discord embed."""
         body = comment.get("body", "")
@@ -371,7 +615,7 @@ class GitHubEventHandlers:
         is_bot = is_bot_author(author, comment.get("user"))
         is_review = comment.get("is_review_comment", False)
 
-        embed = create_comment_embed(
+        embed = await self._comment_embed(
             author=author,
             body=body,
             url=url,
@@ -386,8 +630,36 @@ class GitHubEventHandlers:
         view = create_review_link_view(url, max(extra_count, 1)) if is_bot else None
         try:
             await send_message(thread, embed=embed, view=view)
+            self.comment_index.record(thread, url, bot=author if is_bot else None)
         except Exception as e:
-            print(f"⚠️ Failed to post comment embed to thread: {e}")
+            log.warning("⚠️ Failed to post comment embed to thread: %s", e)
+
+    async def _with_thread_retry(self, thread, reopen, action):
+        """Run ``action(thread)``; if Discord reports the thread gone, invalidate it and retry once.
+
+        ``reopen`` is a zero-argument coroutine factory returning ``(thread, created)`` from
+        ``get_or_create_thread``. Returns the thread the action finally ran on (or None).
+        """
+        try:
+            await action(thread)
+            return thread
+        except discord.NotFound:
+            invalidate_thread(self.cog.thread_cache, thread)
+            self.comment_index.forget(getattr(thread, "id", thread))
+            log.info("🗑️ Thread %s no longer exists, looking it up again", getattr(thread, 'id', '?'))
+        thread, created = await reopen()
+        if not thread:
+            return None
+        if created:
+            self.comment_index.mark_new(thread)
+        await action(thread)
+        return thread
+
+    async def _post_thread_update(self, thread, status=None, message=None):
+        if status:
+            await update_status_tag(thread, status)
+        if message:
+            await send_message(thread, message)
 
     # ---------------------------
     # Entry Point
@@ -401,7 +673,7 @@ class GitHubEventHandlers:
         if event_type == "ping":
             zen = data.get("zen", "No zen")
             hook_id = data.get("hook_id", "N/A")
-            print(f"🏓 [Webhook] Ping received from GitHub (Hook ID: {hook_id}) | Zen: {zen}")
+            log.info("🏓 [Webhook] Ping received from GitHub (Hook ID: %s) | Zen: %s", hook_id, zen)
             await self.log_audit(f"🏓 **GitHub Webhook Ping Received!** (Hook ID: `{hook_id}` • Zen: *{zen}*)")
             return
 
@@ -411,11 +683,12 @@ class GitHubEventHandlers:
 
         if not repo_full_name or repo_full_name.lower().strip().lstrip("/") not in normalized_allowed:
             warn_msg = f"⚠️ [Webhook] Ignored '{event_type}{action_suffix}' for '{repo_full_name}': not in allowed_repos list (Configured: {allowed_repos}). Run '!genhub addrepo {repo_full_name}' to allow."
-            print(warn_msg)
+            log.warning(warn_msg)
             await self.log_error(warn_msg)
             return
 
-        print(f"📦 [Webhook] Dispatching '{event_type}{action_suffix}' for '{repo_full_name}'")
+        self.last_webhook_at[repo_full_name.lower().strip().lstrip("/")] = time.time()
+        log.debug("📦 [Webhook] Dispatching '%s%s' for '%s'", event_type, action_suffix, repo_full_name)
         await self.log_debug(f"📦 [Webhook] Received `{event_type}{action_suffix}` for `{repo_full_name}`")
         handlers = {
             "issues": self.handle_issue,
@@ -427,10 +700,11 @@ class GitHubEventHandlers:
         }
         handler = handlers.get(event_type)
         if handler:
-            await handler(data, repo_full_name)
-            print(f"✅ [Webhook] Finished handling '{event_type}{action_suffix}' for '{repo_full_name}'")
+            async with tracer.span(f"handle_{event_type}", action=action or "-"):
+                await self.coalescer.dispatch(event_type, data, repo_full_name, handler)
+            log.debug("✅ [Webhook] Finished handling '%s%s' for '%s'", event_type, action_suffix, repo_full_name)
         else:
-            print(f"ℹ️ [Webhook] No handler for event '{event_type}' (repo: {repo_full_name}), skipping")
+            log.debug("ℹ️ [Webhook] No handler for event '%s' (repo: %s), skipping", event_type, repo_full_name)
             await self.log_debug(f"ℹ️ No handler for event `{event_type}` (repo: `{repo_full_name}`), skipped")
 
     # ---------------------------
@@ -448,19 +722,19 @@ class GitHubEventHandlers:
         )
         sender = data.get("sender", {}).get("login", "") or author
 
-        forum_id = await self.cog.config.issues_forum_id()
+        forum_id = await self._route_config(repo_full_name, "issues_forum_id")
         forum = await self._resolve_target_channel(forum_id)
         tags = await get_issue_tags(forum, issue)
 
         # Role mention for issue chat
         role_mention = get_role_mention(
-            forum.guild if forum else None, await self.cog.config.contributor_role_id()
+            forum.guild if forum else None, await self._route_config(repo_full_name, "contributor_role_id")
         )
         initial_content = None
         if action == "opened":
             initial_content = format_message("🆕", "Issue created", title, url, author, "")
 
-        thread, _ = await get_or_create_thread(
+        thread, created = await get_or_create_thread(
             self.cog.bot,
             forum_id,
             repo_full_name,
@@ -471,6 +745,8 @@ class GitHubEventHandlers:
             self.cog.thread_cache,
             initial_content,
         )
+        if created and initial_content:
+            self.comment_index.mark_new(thread)
 
         # Log concise single-line entry
         if action == "opened":
@@ -480,12 +756,13 @@ class GitHubEventHandlers:
         elif action == "reopened":
             await self.log_info(format_log_line("📋 🔄", "Issue Reopened", repo_full_name, number, title, url, sender, item_type="Issue", thread=thread))
         elif action in ("assigned", "unassigned"):
-            assignee = issue.get("assignee")
-            assignee_name = assignee["login"] if assignee else "Unknown"
-            await self.log_info(format_log_line("📋 👤", f"Issue {action.capitalize()}", repo_full_name, number, title, url, sender, item_type="Issue", extra=f"Assignee: **{assignee_name}**", thread=thread))
+            assignee_name, _ = _assignee_change(data, issue)
+            line = format_log_line("📋 👤", f"Issue {action.capitalize()}", repo_full_name, number, title, url, sender, item_type="Issue", extra=f"Assignee: **{assignee_name}**", thread=thread)
+            await self.log_batcher.add(line, repo_full_name, "Issue", action, assignee_name, number, url, sender)
         elif action in ("labeled", "unlabeled"):
             label_name = data.get("label", {}).get("name", "tag")
-            await self.log_info(format_log_line("🏷️ 📌", f"Issue {action.capitalize()}", repo_full_name, number, title, url, sender, item_type="Issue", extra=f"`{label_name}`", thread=thread))
+            line = format_log_line("🏷️ 📌", f"Issue {action.capitalize()}", repo_full_name, number, title, url, sender, item_type="Issue", extra=f"`{label_name}`", thread=thread)
+            await self.log_batcher.add(line, repo_full_name, "Issue", action, label_name, number, url, sender)
         elif action == "edited":
             await self.log_info(format_log_line("📋 ✏️", "Issue Edited", repo_full_name, number, title, url, sender, item_type="Issue", thread=thread))
         else:
@@ -495,67 +772,61 @@ class GitHubEventHandlers:
             return
 
         # Send action-specific messages (skip "opened" if we already sent initial content)
+        status, message = None, None
         if action == "opened" and initial_content:
             pass
         elif action == "closed":
-            await update_status_tag(thread, "Closed")
-            await send_message(
-                thread,
-                format_message("❌", "Issue closed", title, url, author, ""),
-            )
+            status, message = "Closed", format_message("❌", "Issue closed", title, url, author, "")
         elif action == "reopened":
-            await update_status_tag(thread, "Open")
-            await send_message(
-                thread,
-                format_message("🔄", "Issue reopened", title, url, author, ""),
-            )
+            status, message = "Open", format_message("🔄", "Issue reopened", title, url, author, "")
         elif action in ("assigned", "unassigned"):
-            assignee = issue.get("assignee")
-            assignee_text = (
-                f"[{assignee['login']}]({assignee['html_url']})"
-                if assignee
-                else "Unknown"
-            )
-            await send_message(
-                thread,
-                f"👤 **Issue {action}:** {assignee_text}\n🔧 Updated by: **{author}**",
-            )
+            _, assignee_text = _assignee_change(data, issue)
+            message = f"👤 **Issue {action}:** {assignee_text}\n🔧 Updated by: **{author}**"
         elif action == "edited":
             expected_name = f"[GH] [#{number}] {title}"[:100]
             if hasattr(thread, "name") and thread.name != expected_name:
                 try:
                     await thread.edit(name=expected_name)
                 except Exception as e:
-                    print(f"⚠️ Could not update thread name on edit: {e}")
+                    log.warning("⚠️ Could not update thread name on edit: %s", e)
+
+        if status or message:
+            thread = await self._with_thread_retry(
+                thread,
+                functools.partial(get_or_create_thread, self.cog.bot, forum_id, repo_full_name, number, title, url, tags, self.cog.thread_cache),
+                lambda t: self._post_thread_update(t, status, message),
+            )
 
         # Send concise overview notification to Issues Feed Chat channel/post (discovered in forum if not explicitly set)
-        chat_ch = await self._get_or_discover_feed_chat(forum_id, "issues_feed_chat_id")
+        chat_ch = await self._get_or_discover_feed_chat(forum_id, "issues_feed_chat_id", repo_full_name)
         if chat_ch:
             thread_ref = f"<#{thread.id}>" if thread else ""
             thread_suffix = f" • Thread: {thread_ref}" if thread_ref else ""
-            try:
-                if action == "opened":
-                    await chat_ch.send(f"🆕 **Issue Created:** [#{number} {title}]({url}){thread_suffix} • By **{author}** {role_mention}".strip())
-                elif action == "closed":
-                    await chat_ch.send(f"❌ **Issue Closed:** [#{number} {title}]({url}){thread_suffix} • By **{author}** {role_mention}".strip())
-                elif action == "reopened":
-                    await chat_ch.send(f"🔄 **Issue Reopened:** [#{number} {title}]({url}){thread_suffix} • By **{author}**")
-            except Exception as e:
-                print(f"⚠️ Failed to send issue chat notification: {e}")
+            async with tracer.span("feed_chat_send"):
+                try:
+                    if action == "opened":
+                        await chat_ch.send(f"🆕 **Issue Created:** [#{number} {title}]({url}){thread_suffix} • By **{author}** {role_mention}".strip())
+                    elif action == "closed":
+                        await chat_ch.send(f"❌ **Issue Closed:** [#{number} {title}]({url}){thread_suffix} • By **{author}** {role_mention}".strip())
+                    elif action == "reopened":
+                        await chat_ch.send(f"🔄 **Issue Reopened:** [#{number} {title}]({url}){thread_suffix} • By **{author}**")
+                except Exception as e:
+                    log.warning("⚠️ Failed to send issue chat notification: %s", e)
 
         # Send milestone/status update to Pinned Updates channel/post
-        updates_ch_id = await self._get_config_id("updates_channel_id")
+        updates_ch_id = await self._get_config_id("updates_channel_id", repo_full_name)
         if updates_ch_id:
             updates_ch = await self._resolve_target_channel(updates_ch_id)
             if updates_ch:
                 thread_ref = f" • Thread: <#{thread.id}>" if thread else ""
-                try:
-                    if action == "opened":
-                        await updates_ch.send(f"📋 **New Issue Opened:** [**#{number} {title}**](<{url}>){thread_ref} • By **{author}**")
-                    elif action == "closed":
-                        await updates_ch.send(f"✅ **Issue Closed:** [**#{number} {title}**](<{url}>){thread_ref} • By **{author}**")
-                except Exception as e:
-                    print(f"⚠️ Failed to send issue update notification: {e}")
+                async with tracer.span("updates_send"):
+                    try:
+                        if action == "opened":
+                            await updates_ch.send(f"📋 **New Issue Opened:** [**#{number} {title}**](<{url}>){thread_ref} • By **{author}**")
+                        elif action == "closed":
+                            await updates_ch.send(f"✅ **Issue Closed:** [**#{number} {title}**](<{url}>){thread_ref} • By **{author}**")
+                    except Exception as e:
+                        log.warning("⚠️ Failed to send issue update notification: %s", e)
 
     async def handle_pull_request(self, data, repo_full_name):
         pr = data["pull_request"]
@@ -569,21 +840,23 @@ class GitHubEventHandlers:
         sender = data.get("sender", {}).get("login", "") or author
         is_merged = pr.get("merged") or pr.get("merged_at")
 
-        forum_id = await self.cog.config.prs_forum_id()
+        forum_id = await self._route_config(repo_full_name, "prs_forum_id")
         forum = await self._resolve_target_channel(forum_id)
         tags = await get_pr_tags(forum, pr)
 
         # Role mention for PRs: only when opened or closed/merged in PR chat
         role_mention = get_role_mention(
-            forum.guild if forum else None, await self.cog.config.contributor_role_id()
+            forum.guild if forum else None, await self._route_config(repo_full_name, "contributor_role_id")
         )
         initial_content = None
         if action == "opened":
             initial_content = format_message("🆕", "PR created", title, url, author, "")
 
-        thread, _ = await get_or_create_thread(
+        thread, created = await get_or_create_thread(
             self.cog.bot, forum_id, repo_full_name, number, title, url, tags, self.cog.thread_cache, initial_content
         )
+        if created and initial_content:
+            self.comment_index.mark_new(thread)
 
         # Log concise single-line entry
         if action == "opened":
@@ -598,12 +871,13 @@ class GitHubEventHandlers:
         elif action == "synchronize":
             await self.log_info(format_log_line("🔄 ⚡", "PR Synchronize", repo_full_name, number, title, url, sender, item_type="PR", thread=thread))
         elif action in ("assigned", "unassigned"):
-            assignee = pr.get("assignee")
-            assignee_name = assignee["login"] if assignee else "Unknown"
-            await self.log_info(format_log_line("👤 📌", f"PR {action.capitalize()}", repo_full_name, number, title, url, sender, item_type="PR", extra=f"Assignee: **{assignee_name}**", thread=thread))
+            assignee_name, _ = _assignee_change(data, pr)
+            line = format_log_line("👤 📌", f"PR {action.capitalize()}", repo_full_name, number, title, url, sender, item_type="PR", extra=f"Assignee: **{assignee_name}**", thread=thread)
+            await self.log_batcher.add(line, repo_full_name, "PR", action, assignee_name, number, url, sender)
         elif action in ("labeled", "unlabeled"):
             label_name = data.get("label", {}).get("name", "tag")
-            await self.log_info(format_log_line("🏷️ 📌", f"PR {action.capitalize()}", repo_full_name, number, title, url, sender, item_type="PR", extra=f"`{label_name}`", thread=thread))
+            line = format_log_line("🏷️ 📌", f"PR {action.capitalize()}", repo_full_name, number, title, url, sender, item_type="PR", extra=f"`{label_name}`", thread=thread)
+            await self.log_batcher.add(line, repo_full_name, "PR", action, label_name, number, url, sender)
         elif action == "edited":
             await self.log_info(format_log_line("🚀 ✏️", "PR Edited", repo_full_name, number, title, url, sender, item_type="PR", thread=thread))
         else:
@@ -613,66 +887,72 @@ class GitHubEventHandlers:
             return
 
         # Send action-specific messages (skip "opened" if we already sent initial content)
+        status, message = None, None
         if action == "opened" and initial_content:
             pass
         elif action == "closed":
             if is_merged:
-                await update_status_tag(thread, "Merged")
-                await send_message(thread, format_message("✅", "PR merged", title, url, author, ""))
+                status, message = "Merged", format_message("✅", "PR merged", title, url, author, "")
             else:
-                await update_status_tag(thread, "Closed")
-                await send_message(thread, format_message("❌", "PR closed", title, url, author, ""))
+                status, message = "Closed", format_message("❌", "PR closed", title, url, author, "")
         elif action == "reopened":
-            await update_status_tag(thread, "Open")
-            await send_message(thread, format_message("🔄", "PR reopened", title, url, author, ""))
+            status, message = "Open", format_message("🔄", "PR reopened", title, url, author, "")
         elif action in ("assigned", "unassigned"):
-            assignee = pr.get("assignee")
-            assignee_text = f"[{assignee['login']}]({assignee['html_url']})" if assignee else "Unknown"
-            await send_message(thread, f"👤 **PR {action}:** {assignee_text}\n🔧 Updated by: **{author}**")
+            _, assignee_text = _assignee_change(data, pr)
+            message = f"👤 **PR {action}:** {assignee_text}\n🔧 Updated by: **{author}**"
         elif action == "edited":
             expected_name = f"[GH] [#{number}] {title}"[:100]
             if hasattr(thread, "name") and thread.name != expected_name:
                 try:
                     await thread.edit(name=expected_name)
                 except Exception as e:
-                    print(f"⚠️ Could not update thread name on edit: {e}")
+                    log.warning("⚠️ Could not update thread name on edit: %s", e)
+
+        if status or message:
+            thread = await self._with_thread_retry(
+                thread,
+                functools.partial(get_or_create_thread, self.cog.bot, forum_id, repo_full_name, number, title, url, tags, self.cog.thread_cache),
+                lambda t: self._post_thread_update(t, status, message),
+            )
 
         # Send concise overview notification to PRs Feed Chat channel/post (discovered in forum if not explicitly set)
-        chat_ch = await self._get_or_discover_feed_chat(forum_id, "prs_feed_chat_id")
+        chat_ch = await self._get_or_discover_feed_chat(forum_id, "prs_feed_chat_id", repo_full_name)
         if chat_ch:
             thread_ref = f"<#{thread.id}>" if thread else ""
             thread_suffix = f" • Thread: {thread_ref}" if thread_ref else ""
-            try:
-                if action == "opened":
-                    await chat_ch.send(f"🆕 **PR Opened:** [#{number} {title}]({url}){thread_suffix} • By **{author}** {role_mention}".strip())
-                elif action == "closed":
-                    if is_merged:
-                        await chat_ch.send(f"🟣 **PR Merged:** [#{number} {title}]({url}){thread_suffix} • By **{author}** {role_mention}".strip())
-                    else:
-                        await chat_ch.send(f"❌ **PR Closed (Unmerged):** [#{number} {title}]({url}){thread_suffix} • By **{author}** {role_mention}".strip())
-                elif action == "reopened":
-                    await chat_ch.send(f"🔄 **PR Reopened:** [#{number} {title}]({url}){thread_suffix} • By **{author}**")
-            except Exception as e:
-                print(f"⚠️ Failed to send PR chat notification: {e}")
-
-        # Send development milestone announcement to Pinned Updates channel (No role mentions)
-        updates_ch_id = await self._get_config_id("updates_channel_id")
-        if updates_ch_id:
-            updates_ch = await self._resolve_target_channel(updates_ch_id)
-            if updates_ch:
-                thread_ref = f" • Thread: <#{thread.id}>" if thread else ""
+            async with tracer.span("feed_chat_send"):
                 try:
                     if action == "opened":
-                        await updates_ch.send(f"🚀 **New PR Opened:** [**#{number} {title}**](<{url}>){thread_ref} • By **{author}**")
+                        await chat_ch.send(f"🆕 **PR Opened:** [#{number} {title}]({url}){thread_suffix} • By **{author}** {role_mention}".strip())
                     elif action == "closed":
                         if is_merged:
-                            base_ref = pr.get("base", {}).get("ref", "main")
-                            msg = f"🔨 **Merged into `{base_ref}`:** [**#{number} {title}**](<{url}>){thread_ref} • By **{author}**"
-                            await updates_ch.send(msg)
+                            await chat_ch.send(f"🟣 **PR Merged:** [#{number} {title}]({url}){thread_suffix} • By **{author}** {role_mention}".strip())
                         else:
-                            await updates_ch.send(f"❌ **PR Closed (Unmerged):** [**#{number} {title}**](<{url}>){thread_ref} • By **{author}**")
+                            await chat_ch.send(f"❌ **PR Closed (Unmerged):** [#{number} {title}]({url}){thread_suffix} • By **{author}** {role_mention}".strip())
+                    elif action == "reopened":
+                        await chat_ch.send(f"🔄 **PR Reopened:** [#{number} {title}]({url}){thread_suffix} • By **{author}**")
                 except Exception as e:
-                    print(f"⚠️ Failed to send pinned update on PR: {e}")
+                    log.warning("⚠️ Failed to send PR chat notification: %s", e)
+
+        # Send development milestone announcement to Pinned Updates channel (No role mentions)
+        updates_ch_id = await self._get_config_id("updates_channel_id", repo_full_name)
+        if updates_ch_id:
+            updates_ch = await self._resolve_target_channel(updates_ch_id)
+            if updates_ch:
+                thread_ref = f" • Thread: <#{thread.id}>" if thread else ""
+                async with tracer.span("updates_send"):
+                    try:
+                        if action == "opened":
+                            await updates_ch.send(f"🚀 **New PR Opened:** [**#{number} {title}**](<{url}>){thread_ref} • By **{author}**")
+                        elif action == "closed":
+                            if is_merged:
+                                base_ref = pr.get("base", {}).get("ref", "main")
+                                msg = f"🔨 **Merged into `{base_ref}`:** [**#{number} {title}**](<{url}>){thread_ref} • By **{author}**"
+                                await updates_ch.send(msg)
+                            else:
+                                await updates_ch.send(f"❌ **PR Closed (Unmerged):** [**#{number} {title}**](<{url}>){thread_ref} • By **{author}**")
+                    except Exception as e:
+                        log.warning("⚠️ Failed to send pinned update on PR: %s", e)
 
     async def handle_release(self, data, repo_full_name):
         """Handle GitHub release events and announce to Pinned Updates channel with prominent visual styling."""
@@ -690,15 +970,16 @@ class GitHubEventHandlers:
         sender = data.get("sender", {}).get("login", "") or author
         is_prerelease = release.get("prerelease", False) or "alpha" in tag_name.lower() or "beta" in tag_name.lower()
 
-        updates_ch_id = await self._get_config_id("updates_channel_id")
+        updates_ch_id = await self._get_config_id("updates_channel_id", repo_full_name)
         await self.log_info(format_log_line("🎉 📦", f"Release {action.capitalize()}", repo_full_name, None, f"{name} ({tag_name})", url, sender, item_type="Release"))
         if updates_ch_id:
             updates_ch = await self._resolve_target_channel(updates_ch_id)
             if updates_ch:
                 try:
-                    clean_body = clean_github_markdown(body)
-                    if len(clean_body) > 1800:
-                        clean_body = clean_body[:1700].rstrip() + f"\n\n... *([Read full changelog on GitHub](<{url}>))*"
+                    clean_body = render_markdown(body or "", None, EMBED_RENDER_LIMIT)
+                    truncated = clean_body.endswith(TRUNCATED_SUFFIX)
+                    if truncated or len(clean_body) > 1800:
+                        clean_body = clean_body.removesuffix(TRUNCATED_SUFFIX)[:1700].rstrip() + f"\n\n... *([Read full changelog on GitHub](<{url}>))*"
 
                     # Distinctive styling: Magenta for Alpha/Beta/Pre-release, Blurple for Official Releases
                     badge = "🧪 Alpha / Pre-release" if is_prerelease else "🎉 Official Release"
@@ -718,7 +999,7 @@ class GitHubEventHandlers:
                     embed.set_footer(text=f"GeneralsHub Release Announcement • {repo_full_name}")
                     await updates_ch.send(embed=embed)
                 except Exception as e:
-                    print(f"⚠️ Failed to send release announcement: {e}")
+                    log.warning("⚠️ Failed to send release announcement: %s", e)
 
     async def handle_issue_comment(self, data, repo_full_name):
         action = data.get("action", "created")
@@ -738,7 +1019,7 @@ class GitHubEventHandlers:
         preview = format_comment_preview(body)
         target_user = author if (sender and author and sender != author) else ""
 
-        forum_id = await (self.cog.config.prs_forum_id() if is_pr else self.cog.config.issues_forum_id())
+        forum_id = await self._route_config(repo_full_name, "prs_forum_id" if is_pr else "issues_forum_id")
         forum = await self._resolve_target_channel(forum_id)
         tags = await (get_pr_tags(forum, issue) if is_pr else get_issue_tags(forum, issue))
 
@@ -754,16 +1035,17 @@ class GitHubEventHandlers:
                 )
                 return
 
-            thread, _ = await get_or_create_thread(
-                self.cog.bot, forum_id, repo_full_name, number, issue["title"], issue["html_url"], tags, self.cog.thread_cache
+            reopen = functools.partial(
+                get_or_create_thread, self.cog.bot, forum_id, repo_full_name, number, issue["title"], issue["html_url"], tags, self.cog.thread_cache
             )
+            thread, _ = await reopen()
             await self.log_info(format_log_line("💬 🆕", "New Comment", repo_full_name, number, issue.get("title", ""), url, sender, item_type=item_label, extra=preview, target_user=target_user, thread=thread))
             if not thread:
                 return
 
             author_icon = comment.get("user", {}).get("avatar_url") if comment.get("user") else None
             created_at = comment.get("created_at")
-            embed = create_comment_embed(
+            embed = await self._comment_embed(
                 author=author,
                 body=body,
                 url=url,
@@ -774,7 +1056,9 @@ class GitHubEventHandlers:
                 repo=repo_full_name,
             )
             view = create_review_link_view(url, 1) if is_bot else None
-            await send_message(thread, embed=embed, view=view)
+            thread = await self._with_thread_retry(thread, reopen, lambda t: send_message(t, embed=embed, view=view))
+            if thread:
+                self.comment_index.record(thread, url, bot=author if is_bot else None)
 
         elif action == "edited":
             thread = await find_thread(self.cog.bot, forum_id, repo_full_name, number, self.cog.thread_cache)
@@ -791,7 +1075,7 @@ class GitHubEventHandlers:
                 author_icon = comment.get("user", {}).get("avatar_url") if comment.get("user") else None
                 is_bot = is_bot_author(author, comment.get("user"))
                 updated_at = comment.get("updated_at") or comment.get("created_at")
-                embed = create_comment_embed(
+                embed = await self._comment_embed(
                     author=author,
                     body=body,
                     url=url,
@@ -804,9 +1088,9 @@ class GitHubEventHandlers:
                 view = create_review_link_view(url, 1) if is_bot else None
                 try:
                     await msg.edit(embed=embed, view=view)
-                    print(f"📝 Live-updated Discord comment in thread #{number} for {author}")
+                    log.info("📝 Live-updated Discord comment in thread #%s for %s", number, author)
                 except Exception as e:
-                    print(f"⚠️ Failed to edit comment in thread #{number}: {e}")
+                    log.warning("⚠️ Failed to edit comment in thread #%s: %s", number, e)
 
         elif action == "deleted":
             thread = await find_thread(self.cog.bot, forum_id, repo_full_name, number, self.cog.thread_cache)
@@ -815,12 +1099,13 @@ class GitHubEventHandlers:
                 return
 
             msg = await find_comment_message(thread, url, author)
+            self.comment_index.discard(thread, url)
             if msg:
                 try:
                     await msg.delete()
-                    print(f"🗑️ Deleted Discord comment message in thread #{number} for {author}")
+                    log.info("🗑️ Deleted Discord comment message in thread #%s for %s", number, author)
                 except Exception as e:
-                    print(f"⚠️ Failed to delete comment in thread #{number}: {e}")
+                    log.warning("⚠️ Failed to delete comment in thread #%s: %s", number, e)
 
     async def handle_pull_request_review(self, data, repo_full_name):
         action = data.get("action")
@@ -851,7 +1136,7 @@ class GitHubEventHandlers:
                 entry["body"] = review_body
                 await self._schedule_flush(repo_full_name, pr_number, review_id, data)
         elif action == "dismissed":
-            forum_id = await self.cog.config.prs_forum_id()
+            forum_id = await self._route_config(repo_full_name, "prs_forum_id")
             thread = await find_thread(self.cog.bot, forum_id, repo_full_name, pr_number, self.cog.thread_cache)
             dismissal_msg = review.get("dismissal_message") or review.get("body") or ""
             preview = format_comment_preview(dismissal_msg)
@@ -869,7 +1154,7 @@ class GitHubEventHandlers:
         comment_author = comment.get("user", {}).get("login", "Unknown") if comment.get("user") else "Unknown"
         sender = data.get("sender", {}).get("login", "") or comment_author
         comment_url = comment.get("html_url", "")
-        forum_id = await self.cog.config.prs_forum_id()
+        forum_id = await self._route_config(repo_full_name, "prs_forum_id")
 
         is_bot = is_bot_author(comment_author, comment.get("user")) or is_bot_author(sender)
         path = comment.get("path", "")
@@ -908,7 +1193,7 @@ class GitHubEventHandlers:
             if msg:
                 author_icon = comment.get("user", {}).get("avatar_url") if comment.get("user") else None
                 updated_at = comment.get("updated_at") or comment.get("created_at")
-                embed = create_comment_embed(
+                embed = await self._comment_embed(
                     author=comment_author,
                     body=comment_body,
                     url=comment_url,
@@ -920,9 +1205,9 @@ class GitHubEventHandlers:
                 )
                 try:
                     await msg.edit(embed=embed)
-                    print(f"📝 Live-updated review comment in PR #{pr_number} for {comment_author}")
+                    log.info("📝 Live-updated review comment in PR #%s for %s", pr_number, comment_author)
                 except Exception as e:
-                    print(f"⚠️ Failed to edit review comment in PR #{pr_number}: {e}")
+                    log.warning("⚠️ Failed to edit review comment in PR #%s: %s", pr_number, e)
 
         elif action == "deleted":
             thread = await find_thread(self.cog.bot, forum_id, repo_full_name, pr_number, self.cog.thread_cache)
@@ -934,15 +1219,16 @@ class GitHubEventHandlers:
             if msg:
                 try:
                     await msg.delete()
-                    print(f"🗑️ Deleted review comment in PR #{pr_number} for {comment_author}")
+                    log.info("🗑️ Deleted review comment in PR #%s for %s", pr_number, comment_author)
                 except Exception as e:
-                    print(f"⚠️ Failed to delete review comment in PR #{pr_number}: {e}")
+                    log.warning("⚠️ Failed to delete review comment in PR #%s: %s", pr_number, e)
 
     async def _schedule_bot_review(self, repo_full_name, pr_number, author, data, body=None, url=None, author_icon=None, inline_comment=None):
         """Aggregate all bot reviews, notices, and inline comments for a PR into ONE single unified Discord message."""
         key = (repo_full_name, pr_number, author.lower().strip())
         entry = self.pending_reviews.setdefault(
             key, {
+                "kind": "bot",
                 "author": author,
                 "url": url or "",
                 "body": None,
@@ -967,96 +1253,129 @@ class GitHubEventHandlers:
         if created_at:
             entry["created_at"] = created_at
 
-        async def flush_bot_review():
-            await asyncio.sleep(6.0)
-            ent = self.pending_reviews.pop(key, None)
-            if not ent:
-                return
+        self._arm_review_flush(key, BOT_REVIEW_FLUSH_DELAY)
+        await self._save_pending_reviews()
 
-            forum_id = await self.cog.config.prs_forum_id()
-            forum = await self._resolve_target_channel(forum_id)
-            pr_info = ent["data"].get("pull_request") or ent["data"].get("issue") or {}
-            if not pr_info:
-                return
+    async def _schedule_flush(self, repo_full_name, pr_number, review_id, data):
+        key = (repo_full_name, pr_number, review_id)
+        entry = self.pending_reviews[key]
+        entry["kind"] = "review"
+        entry["data"] = data
+        self._arm_review_flush(key, REVIEW_FLUSH_DELAY)
+        await self._save_pending_reviews()
+
+    def _arm_review_flush(self, key, delay):
+        """(Re)start the debounce task that posts the pending batch stored under ``key``."""
+        entry = self.pending_reviews[key]
+        if "task" in entry:
+            entry["task"].cancel()
+        entry["task"] = detached_task(self._run_review_flush(key, delay))
+
+    async def _run_review_flush(self, key, delay):
+        await asyncio.sleep(delay)
+        entry = self.pending_reviews.pop(key, None)
+        if not entry:
+            return
 
-            tags = await get_pr_tags(forum, pr_info)
-            thread, _ = await get_or_create_thread(
-                self.cog.bot, forum_id, repo_full_name, pr_number, pr_info.get("title", f"PR #{pr_number}"), pr_info.get("html_url", ""), tags, self.cog.thread_cache
-            )
-            if not thread:
-                return
+        # Keep the batch visible to persistence until it has actually been posted
+        self._flushing_reviews[key] = entry
+        post = self._post_bot_review if entry.get("kind") == "bot" else self._post_review_batch
+        try:
+            await post(key, entry)
+        except asyncio.CancelledError:
+            # Interrupted mid-post (cog unload): leave it persisted so the next load replays it
+            raise
+        except Exception:
+            self._flushing_reviews.pop(key, None)
+            raise
+        else:
+            self._flushing_reviews.pop(key, None)
+        finally:
+            await self._save_pending_reviews()
 
-            comment_count = len(ent["comments"])
-            review_body = ent.get("body")
-            if not review_body and ent["comments"]:
-                review_body = ent["comments"][0][0]
-
-            embed = create_comment_embed(
-                author=ent["author"],
-                body=review_body or "*Automated code review findings submitted on GitHub.*",
-                url=ent["url"],
-                author_icon=ent.get("author_icon"),
-                is_bot=True,
-                is_review=True,
-                extra_count=comment_count,
-                created_at=ent.get("created_at"),
-                repo=repo_full_name,
-            )
-            view = create_review_link_view(ent["url"], comment_count) if comment_count > 0 else create_review_link_view(ent["url"], 1)
+    async def _post_bot_review(self, key, ent):
+        repo_full_name, pr_number, _ = key
+        forum_id = await self._route_config(repo_full_name, "prs_forum_id")
+        forum = await self._resolve_target_channel(forum_id)
+        pr_info = ent["data"].get("pull_request") or ent["data"].get("issue") or {}
+        if not pr_info:
+            return
 
-            # Check if a message from this bot already exists in the thread
-            existing_msg = await find_comment_message(thread, ent["url"], ent["author"])
-            if existing_msg:
-                try:
-                    await existing_msg.edit(embed=embed, view=view)
-                    print(f"📝 Live-updated existing bot review in PR #{pr_number} for {ent['author']} ({comment_count} comments)")
-                    return
-                except Exception as e:
-                    print(f"⚠️ Failed to edit existing bot review in PR #{pr_number}: {e}")
+        tags = await get_pr_tags(forum, pr_info)
+        reopen = functools.partial(
+            get_or_create_thread, self.cog.bot, forum_id, repo_full_name, pr_number, pr_info.get("title", f"PR #{pr_number}"), pr_info.get("html_url", ""), tags, self.cog.thread_cache
+        )
+        thread, _ = await reopen()
+        if not thread:
+            return
 
-            await send_message(thread, embed=embed, view=view)
-            print(f"✅ Posted unified bot review in PR #{pr_number} for {ent['author']} ({comment_count} comments)")
+        comment_count = len(ent["comments"])
+        review_body = ent.get("body")
+        if not review_body and ent["comments"]:
+            review_body = ent["comments"][0][0]
+
+        embed = await self._comment_embed(
+            author=ent["author"],
+            body=review_body or "*Automated code review findings submitted on GitHub.*",
+            url=ent["url"],
+            author_icon=ent.get("author_icon"),
+            is_bot=True,
+            is_review=True,
+            extra_count=comment_count,
+            created_at=ent.get("created_at"),
+            repo=repo_full_name,
+        )
+        view = create_review_link_view(ent["url"], comment_count) if comment_count > 0 else create_review_link_view(ent["url"], 1)
 
-        if key in self.pending_reviews and "task" in self.pending_reviews[key]:
-            self.pending_reviews[key]["task"].cancel()
-        self.pending_reviews[key]["task"] = asyncio.create_task(flush_bot_review())
+        # Check if a message from this bot already exists in the thread
+        existing_msg = await find_comment_message(thread, ent["url"], ent["author"])
+        if existing_msg:
+            try:
+                await existing_msg.edit(embed=embed, view=view)
+                log.info("📝 Live-updated existing bot review in PR #%s for %s (%s comments)", pr_number, ent['author'], comment_count)
+                return
+            except Exception as e:
+                log.warning("⚠️ Failed to edit existing bot review in PR #%s: %s", pr_number, e)
 
-    async def _schedule_flush(self, repo_full_name, pr_number, review_id, data):
-        key = (repo_full_name, pr_number, review_id)
+        thread = await self._with_thread_retry(thread, reopen, lambda t: send_message(t, embed=embed, view=view))
+        if not thread:
+            return
+        self.comment_index.record(thread, ent["url"], bot=ent["author"])
+        log.info("✅ Posted unified bot review in PR #%s for %s (%s comments)", pr_number, ent['author'], comment_count)
 
-        async def flush():
-            await asyncio.sleep(2)
-            entry = self.pending_reviews.pop(key, None)
-            if not entry:
-                return
+    async def _post_review_batch(self, key, entry):
+        repo_full_name, pr_number, _ = key
+        data = entry["data"]
+        forum_id = await self._route_config(repo_full_name, "prs_forum_id")
+        forum = await self._resolve_target_channel(forum_id)
+        pr_data = data.get("pull_request") or data.get("issue")
+        if not pr_data:
+            return
 
-            forum_id = await self.cog.config.prs_forum_id()
-            forum = await self._resolve_target_channel(forum_id)
-            pr_data = data.get("pull_request") or data.get("issue")
-            if not pr_data:
-                return
+        tags = await get_pr_tags(forum, pr_data)
+        reopen = functools.partial(
+            get_or_create_thread, self.cog.bot, forum_id, repo_full_name, pr_number, pr_data["title"], pr_data["html_url"], tags, self.cog.thread_cache
+        )
+        thread, _ = await reopen()
+        if not thread:
+            return
 
-            tags = await get_pr_tags(forum, pr_data)
-            thread, _ = await get_or_create_thread(
-                self.cog.bot, forum_id, repo_full_name, pr_number, pr_data["title"], pr_data["html_url"], tags, self.cog.thread_cache
-            )
-            if not thread:
-                return
+        is_bot = is_bot_author(entry["author"])
+        extra_comments = len(entry["comments"]) if (is_bot and len(entry["comments"]) > 1) else 0
 
-            is_bot = is_bot_author(entry["author"])
-            extra_comments = len(entry["comments"]) if (is_bot and len(entry["comments"]) > 1) else 0
-
-            created_at = data.get("review", {}).get("submitted_at") or pr_data.get("created_at")
-            review_state = data.get("review", {}).get("state", "").upper()
-            state_label = {"APPROVED": "✅ Approved", "CHANGES_REQUESTED": "🛑 Changes Requested", "COMMENTED": "💬 Commented"}.get(review_state, "")
-            review_body = entry.get("body") or ""
-            preview = format_comment_preview(review_body)
-            extras = [p for p in (state_label, preview) if p]
-            extra_str = " • ".join(extras)
-            await self.log_info(format_log_line("📝 🔍", "PR Review Posted", repo_full_name, pr_number, pr_data.get("title", ""), entry["url"], entry["author"], item_type="PR", extra=extra_str, thread=thread))
-            view = create_review_link_view(entry["url"], extra_comments) if extra_comments > 0 else None
+        created_at = data.get("review", {}).get("submitted_at") or pr_data.get("created_at")
+        review_state = data.get("review", {}).get("state", "").upper()
+        state_label = {"APPROVED": "✅ Approved", "CHANGES_REQUESTED": "🛑 Changes Requested", "COMMENTED": "💬 Commented"}.get(review_state, "")
+        review_body = entry.get("body") or ""
+        preview = format_comment_preview(review_body)
+        extras = [p for p in (state_label, preview) if p]
+        extra_str = " • ".join(extras)
+        await self.log_info(format_log_line("📝 🔍", "PR Review Posted", repo_full_name, pr_number, pr_data.get("title", ""), entry["url"], entry["author"], item_type="PR", extra=extra_str, thread=thread))
+        view = create_review_link_view(entry["url"], extra_comments) if extra_comments > 0 else None
+
+        async def post(thread):
             if entry["body"]:
-                embed = create_comment_embed(
+                embed = await self._comment_embed(
                     author=entry["author"],
                     body=entry["body"],
                     url=entry["url"],
@@ -1067,191 +1386,323 @@ class GitHubEventHandlers:
                     repo=repo_full_name,
                 )
                 await send_message(thread, embed=embed, view=view)
+                self.comment_index.record(thread, entry["url"])
 
-            if entry["comments"]:
-                for i, (body, url) in enumerate(reversed(entry["comments"])):
-                    embed = create_comment_embed(
-                        author=entry["author"],
-                        body=body,
-                        url=url,
-                        is_bot=is_bot,
-                        is_review=True,
-                        created_at=created_at,
-                        repo=repo_full_name,
-                    )
-                    await send_message(thread, embed=embed)
+            for body, url in reversed(entry["comments"]):
+                embed = await self._comment_embed(
+                    author=entry["author"],
+                    body=body,
+                    url=url,
+                    is_bot=is_bot,
+                    is_review=True,
+                    created_at=created_at,
+                    repo=repo_full_name,
+                )
+                await send_message(thread, embed=embed)
+                self.comment_index.record(thread, url)
+
+        await self._with_thread_retry(thread, reopen, post)
+
+    # ---------------------------
+    # Pending Review Persistence
+    # ---------------------------
+
+    def _serialize_pending_reviews(self) -> dict:
+        """Snapshot queued and mid-post review batches into JSON-safe Config data (flush tasks excluded)."""
+        snapshot = {}
+        for batches in (self.pending_reviews, self._flushing_reviews):
+            for key, entry in batches.items():
+                stored = {k: v for k, v in entry.items() if k != "task"}
+                stored["comments"] = [list(c) for c in entry.get("comments", [])]
+                stored["data"] = _slim_review_payload(entry.get("data") or {})
+                snapshot[json.dumps(list(key))] = stored
+        return snapshot
+
+    async def _store_config(self, key, value):
+        """Persist ``value`` under a cog config key without crashing on Mock/missing configs."""
+        import inspect
+        store = getattr(getattr(self.cog, "config", None), key, None)
+        if store is None:
+            return
+        try:
+            res = store.set(value)
+            if inspect.isawaitable(res):
+                await res
+        except Exception as e:
+            log.warning("⚠️ Failed to persist %s: %s", key, e)
+
+    async def _save_pending_reviews(self):
+        """Mirror the pending review buffer into Config so a cog reload or restart can replay it."""
+        await self._store_config("pending_reviews", self._serialize_pending_reviews())
 
-        if key in self.pending_reviews and "task" in self.pending_reviews[key]:
-            self.pending_reviews[key]["task"].cancel()
-        self.pending_reviews[key]["task"] = asyncio.create_task(flush())
+    async def restore_pending_reviews(self):
+        """Rehydrate review batches persisted by a previous cog instance and reschedule their flushes."""
+        import inspect
+        store = getattr(getattr(self.cog, "config", None), "pending_reviews", None)
+        if store is None:
+            return 0
+        try:
+            saved = store()
+            if inspect.isawaitable(saved):
+                saved = await saved
+        except Exception as e:
+            log.warning("⚠️ Failed to load pending reviews: %s", e)
+            return 0
+        self.pending_reviews_loaded = True
+        if not isinstance(saved, dict):
+            return 0
+
+        restored = 0
+        for raw_key, stored in saved.items():
+            try:
+                key = tuple(json.loads(raw_key))
+                if len(key) != 3 or not isinstance(stored, dict):
+                    continue
+            except (TypeError, ValueError):
+                continue
+            if key in self.pending_reviews:
+                continue
+            entry = dict(stored)
+            entry["comments"] = [tuple(c) for c in stored.get("comments", [])]
+            entry["data"] = stored.get("data") or {}
+            entry.setdefault("kind", "review")
+            self.pending_reviews[key] = entry
+            delay = BOT_REVIEW_FLUSH_DELAY if entry["kind"] == "bot" else REVIEW_FLUSH_DELAY
+            self._arm_review_flush(key, delay)
+            restored += 1
+
+        if restored:
+            log.info("♻️ Restored %s pending review batch(es) from previous session", restored)
+        return restored
+
+    async def flush_pending_reviews(self, timeout: float) -> int:
+        """Post every queued review batch now instead of after its debounce; returns batches still unposted.
+
+        Batches not posted within ``timeout`` seconds are left for ``suspend_pending_reviews`` to persist.
+        """
+        for key in list(self.pending_reviews):
+            self._arm_review_flush(key, 0)
+        tasks = self._review_flush_tasks()
+        if tasks and timeout > 0:
+            await asyncio.wait(tasks, timeout=timeout)
+        return len(self.pending_reviews) + len(self._flushing_reviews)
+
+    def _review_flush_tasks(self):
+        """Unfinished flush tasks, both still debouncing and already posting their batch."""
+        tasks = set()
+        for batches in (self.pending_reviews, self._flushing_reviews):
+            tasks.update(entry["task"] for entry in batches.values() if "task" in entry)
+        return {t for t in tasks if not t.done()}
+
+    async def wait_for_reconcile(self, timeout: float) -> bool:
+        """Ask a running reconcile to stop at its next checkpoint and wait up to ``timeout`` for it."""
+        if not self.is_reconciling:
+            return True
+        self.reconcile_cancelled = True
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while self.is_reconciling and loop.time() < deadline:
+            await asyncio.sleep(0.1)
+        return not self.is_reconciling
+
+    async def suspend_pending_reviews(self, save: bool = True):
+        """Cancel review flush tasks without dropping their batches, then persist what is left (if ``save``).
+
+        Batches interrupted mid-post stay in ``_flushing_reviews`` and are saved for the next load to replay.
+        """
+        tasks = self._review_flush_tasks()
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.wait(tasks)
+        if save:
+            await self._save_pending_reviews()
 
     # ---------------------------
     # Reconciliation
     # ---------------------------
 
-    async def _reconcile_item(self, session, forum, repo, item, is_pr, ctx, idx, repo_name):
+    async def _plan_item(self, session, forum, repo, item, is_pr):
+        """Work out what Discord needs for one open item using reads only (no Discord writes)."""
         number = item["number"]
         title = item["title"]
         url = item["html_url"]
         author = item["user"]["login"] if item.get("user") else "Unknown"
-        forum_id = forum.id
 
-        # Only reconcile open items (skip closed/merged issues and PRs)
-        if item.get("state") != "open":
-            await self.log_debug(f"⏭️ Skipping non-open {('PR' if is_pr else 'issue')} {repo}#{number} ({item.get('state')})")
-            return
-
-        # Compute desired tags
-        tags = await (get_pr_tags(forum, item) if is_pr else get_issue_tags(forum, item))
-        repo_tag = await get_or_create_tag(forum, repo.split("/")[-1])
-        if repo_tag and repo_tag not in tags:
-            tags.append(repo_tag)
+        tag_names = pr_tag_names(item) if is_pr else issue_tag_names(item)
+        repo_name = repo.split("/")[-1]
+        if repo_name.lower() not in {n.lower() for n in tag_names}:
+            tag_names.append(repo_name)
 
         # Prepare initial content (only tag role on PRs)
         role_mention = (
-            get_role_mention(forum.guild, await self.cog.config.contributor_role_id())
+            get_role_mention(forum.guild, await self._route_config(repo, "contributor_role_id"))
             if is_pr
             else ""
         )
-        emoji = "🆕"
         action = "PR created" if is_pr else "Issue created"
-        initial_content = format_message(emoji, action, title, url, author, role_mention, number=number)
+        initial_content = format_message("🆕", action, title, url, author, role_mention, number=number)
+
+        thread = await find_thread(self.cog.bot, forum.id, repo, number, self.cog.thread_cache)
+        if thread is not None and getattr(thread, "archived", False):
+            # get_or_create_thread recreates archived threads as active ones
+            thread = None
+
+        plan = {
+            "item": item,
+            "number": number,
+            "title": title,
+            "url": url,
+            "tag_names": tag_names,
+            "role_mention": role_mention,
+            "initial_content": initial_content,
+            "create": thread is None,
+            "retag": False,
+            "send_initial": False,
+            "comments": [],
+        }
+
+        synced = {"urls": set(), "bots": set()}
+        if thread is not None:
+            try:
+                synced = await self.comment_index.entry_for(thread)
+                plan["send_initial"] = not synced["initial"]
+            except Exception as e:
+                await self.log_error(f"⚠️ Could not read thread history for {repo}#{number}: {e}")
+
+            current = set(t.name.lower() for t in (thread.applied_tags or []))
+            plan["retag"] = current != {n.lower() for n in tag_names}
+
+        # Check if item has any comments before making API requests
+        # Note: GitHub issues endpoint returns 'comments' count, but pulls list endpoint does not.
+        if not is_pr and item.get("comments") is not None and item.get("comments") == 0:
+            return plan
+        if self.reconcile_cancelled:
+            return plan
+
+        try:
+            await self.log_debug(f"📥 Fetching comments and reviews for {repo}#{number}...")
+            comments = await self._fetch_comments(session, repo, number, is_pr)
+        except Exception as e:
+            await self.log_error(f"⚠️ Error fetching comments for {repo}#{number}: {e}")
+            return plan
+        if not comments:
+            return plan
+
+        # Comments already mirrored into this thread, from the synced-comment index
+        existing_comment_urls = synced["urls"]
+        existing_bot_authors = synced["bots"]
+
+        # Separate comments into human comments and bot comments
+        bot_comments_by_author = {}
+        for comment in comments:
+            author_login = comment.get('user', {}).get('login', 'Unknown')
+            if is_bot_author(author_login, comment.get('user')):
+                bot_comments_by_author.setdefault(author_login, []).append(comment)
+            else:
+                comment_url = comment.get('html_url', '')
+                if comment_url and comment_url in existing_comment_urls:
+                    continue
+                plan["comments"].append((comment, 0))
+
+        # Bot comments collapse to at most 1 compact embed per bot (skipped if that bot already posted in thread)
+        for bot_name, b_comments in bot_comments_by_author.items():
+            if bot_name.lower().strip() in existing_bot_authors:
+                await self.log_debug(f"ℹ️ Skipping bot review from {bot_name} on {repo}#{number} (already in thread)")
+                continue
+            if any(c.get('html_url', '') in existing_comment_urls for c in b_comments if c.get('html_url')):
+                continue
+            # Sort comments chronologically and post the latest/most recent review status
+            b_comments.sort(key=lambda c: c.get('created_at', ''))
+            plan["comments"].append((b_comments[-1], len(b_comments) - 1))
+
+        return plan
+
+    async def _apply_item(self, forum, repo, plan, pacer=None):
+        """Execute one item's planned writes, pacing each Discord call through ``pacer``."""
+        number = plan["number"]
+        pacer = pacer or ReconcileWritePacer()
+        tags = [t for t in [await get_or_create_tag(forum, n) for n in plan["tag_names"]] if t]
 
-        # Get or create thread
+        await pacer.wait()
         thread, created = await get_or_create_thread(
-            self.cog.bot, forum_id, repo, number, title, url, tags, 
-            self.cog.thread_cache, initial_content
+            self.cog.bot, forum.id, repo, number, plan["title"], plan["url"], tags,
+            self.cog.thread_cache, plan["initial_content"]
         )
-        
         if not thread:
-            await self.log_error(f"❌ Failed to create/find forum thread for {repo}#{number} ({title[:80]})")
+            await self.log_error(f"❌ Failed to create/find forum thread for {repo}#{number} ({plan['title'][:80]})")
             return
 
         await self.log_debug(f"{'✅ Created' if created else '📝 Found existing'} thread for {repo}#{number}")
+        if created:
+            self.comment_index.mark_new(thread)
 
-        # Handle initial message for existing threads
-        if not created:
+        if not created and plan["send_initial"]:
             try:
-                history = []
-                async for message in thread.history(limit=1, oldest_first=True):
-                    history.append(message)
-                    break
-
-                if not history:
-                    await send_message(thread, initial_content)
-                    await self.log_debug(f"📝 Sent initial message to existing empty thread {repo}#{number}")
+                await pacer.wait()
+                await send_message(thread, plan["initial_content"])
+                await self.log_debug(f"📝 Sent initial message to existing empty thread {repo}#{number}")
             except Exception as e:
-                await self.log_error(f"⚠️ Could not check thread history for {repo}#{number}: {e}")
+                await self.log_error(f"⚠️ Could not send initial message to {repo}#{number}: {e}")
 
-        if self.reconcile_cancelled:
-            return
-
-        # Reconcile tags (only if different)
-        current = set(t.name.lower() for t in (thread.applied_tags or []))
-        desired = set(t.name.lower() for t in (tags or []))
-        if current != desired and not created:
+        if not created and plan["retag"] and not self.reconcile_cancelled:
             try:
+                await pacer.wait()
                 await thread.edit(applied_tags=tags or [])
             except Exception as e:
                 await self.log_error(f"⚠️ Could not update tags for {repo}#{number}: {e}")
 
-        # Check if item has any comments before making API requests
-        # Note: GitHub issues endpoint returns 'comments' count, but pulls list endpoint does not.
-        should_fetch_comments = True
-        if not is_pr and item.get("comments") is not None and item.get("comments") == 0:
-            should_fetch_comments = False
-
-        if should_fetch_comments and not self.reconcile_cancelled:
-            # Fetch and post comments with bot spam protection
+        for comment, extra_count in plan["comments"]:
+            if self.reconcile_cancelled:
+                break
             try:
-                await self.log_debug(f"📥 Fetching comments and reviews for {repo}#{number}...")
-                comments = await self._fetch_comments(session, repo, number, is_pr)
-
-                if comments and not self.reconcile_cancelled:
-                    # Get existing message URLs and bot authors in thread to avoid duplicates
-                    existing_comment_urls = set()
-                    existing_bot_authors = set()
-                    if not created:
-                        try:
-                            async for message in thread.history(limit=50):
-                                if message.content:
-                                    urls = re.findall(r'https://github\.com/[^/]+/[^/]+/(?:issues|pull)/\d+[#\w\-]+', message.content)
-                                    existing_comment_urls.update(urls)
-                                for emb in getattr(message, "embeds", []):
-                                    if emb.author and emb.author.name:
-                                        # e.g. "deepsource-io[bot] (Bot Notice)" -> "deepsource-io[bot]"
-                                        author_token = emb.author.name.split(" ")[0].lower().strip()
-                                        existing_bot_authors.add(author_token)
-                                    if emb.author and emb.author.url:
-                                        existing_comment_urls.add(emb.author.url)
-                                    if emb.description:
-                                        urls = re.findall(r'https://github\.com/[^/]+/[^/]+/(?:issues|pull)/\d+[#\w\-]+', emb.description)
-                                        existing_comment_urls.update(urls)
-                        except Exception as e:
-                            await self.log_error(f"⚠️ Could not check existing comments for {repo}#{number}: {e}")
-
-                    # Separate comments into human comments and bot comments
-                    human_comments = []
-                    bot_comments_by_author = {}
-
-                    for comment in comments:
-                        author_login = comment.get('user', {}).get('login', 'Unknown')
-                        if is_bot_author(author_login, comment.get('user')):
-                            bot_comments_by_author.setdefault(author_login, []).append(comment)
-                        else:
-                            comment_url = comment.get('html_url', '')
-                            if comment_url and comment_url in existing_comment_urls:
-                                continue
-                            human_comments.append(comment)
-
-                    # 1. Post human comments
-                    for comment in human_comments:
-                        if self.reconcile_cancelled:
-                            break
-                        await self._post_comment_to_thread(thread, comment, role_mention, repo=repo)
-                        await asyncio.sleep(0.2)
-
-                    # 2. Post bot comments cleanly as at most 1 compact embed per bot (skip if bot already posted in thread)
-                    for bot_name, b_comments in bot_comments_by_author.items():
-                        if self.reconcile_cancelled:
-                            break
-                        if not b_comments:
-                            continue
-
-                        # If thread already has an embed from this bot, skip it to avoid duplicate reviews
-                        if bot_name.lower().strip() in existing_bot_authors:
-                            await self.log_debug(f"ℹ️ Skipping bot review from {bot_name} on {repo}#{number} (already in thread)")
-                            continue
-
-                        # Also check if any URL from b_comments is already in existing_comment_urls
-                        if any(c.get('html_url', '') in existing_comment_urls for c in b_comments if c.get('html_url')):
-                            continue
-
-                        # Sort comments chronologically and post the latest/most recent review status
-                        b_comments.sort(key=lambda c: c.get('created_at', ''))
-                        latest_bot_comment = b_comments[-1]
-                        extra_count = len(b_comments) - 1
-                        await self._post_comment_to_thread(
-                            thread,
-                            latest_bot_comment,
-                            role_mention,
-                            extra_count=extra_count,
-                            repo=repo,
-                        )
-                        existing_bot_authors.add(bot_name.lower().strip())
-                        await asyncio.sleep(0.2)
-
+                await pacer.wait()
+                await self._post_comment_to_thread(
+                    thread, comment, plan["role_mention"], extra_count=extra_count, repo=repo
+                )
             except Exception as e:
-                await self.log_error(f"⚠️ Error fetching/posting comments for {repo}#{number}: {e}")
+                await self.log_error(f"⚠️ Error posting comment to {repo}#{number}: {e}")
+
+    async def reconcile_forum_tags(self, ctx=None, repo_filter: str = None, since: str = None, resume: bool = False, checkpoint: bool = True, dry_run: bool = False):
+        """Reconcile forum threads against GitHub.
+
+        ``since`` (ISO-8601) limits the run to items updated after that time; incremental runs
+        skip orphan cleanup because they do not see the full open-item list.
+        ``resume`` continues the run recorded in the saved checkpoint instead of starting from page 1.
+        ``dry_run`` stops after the plan phase and returns the diff counts without writing to Discord;
+        it leaves the saved checkpoint alone.
+        """
+        if self.is_reconciling:
+            # One run at a time: a second one (dry or not) would reset the running one's checkpoint and cancel flag
+            if ctx:
+                await ctx.send("⚠️ A reconciliation is already running.")
+            return
+        if not dry_run:
+            if resume:
+                saved = await self.load_reconcile_checkpoint()
+                if not saved:
+                    if ctx:
+                        await ctx.send("ℹ️ No interrupted reconciliation to resume.")
+                    return
+                repo_filter, since = saved.get("repo_filter"), saved.get("since")
+                self._checkpoint = saved
+            elif checkpoint:
+                self._checkpoint = {"repo_filter": repo_filter, "since": since, "started_at": time.time(), "jobs": {}}
+            else:
+                self._checkpoint = None
 
-    async def reconcile_forum_tags(self, ctx=None, repo_filter: str = None):
+        log_banner = self.log_debug if since else self.log_info
         self.is_reconciling = True
         self.reconcile_cancelled = False
+        completed = False
 
         try:
+            if not dry_run:
+                await self._save_reconcile_checkpoint(force=True)
             allowed_repos = await self.cog.config.allowed_repos()
-            print(f"🔍 Starting reconcile. Allowed repos: {allowed_repos}")
-            await self.log_info(f"🔄 **Reconciliation Started** for {len(allowed_repos)} repositories ({', '.join(allowed_repos)})")
+            log.debug("🔍 Starting reconcile. Allowed repos: %s", allowed_repos)
+            scope = f" (updated since {since})" if since else ""
+            await log_banner(f"🔄 **Reconciliation Started** for {len(allowed_repos)} repositories ({', '.join(allowed_repos)}){scope}")
             
             token = await self.cog.config.github_token()
             headers = {"Accept": "application/vnd.github.v3+json"}
@@ -1264,88 +1715,159 @@ class GitHubEventHandlers:
             # Reset rate limiter for reconciliation
             self.rate_limiter = RateLimiter()
 
+            repos = []
+            # Config entries may carry stray whitespace or a leading slash; compare cleaned names
+            repo_filter = repo_filter.strip().lstrip("/") if repo_filter else repo_filter
+            for repo in allowed_repos:
+                repo = repo.strip().lstrip("/")
+                if repo_filter and repo != repo_filter:
+                    continue
+                if repo in repos:
+                    await self.log_debug(f"⏭️ Skipping already processed repo: {repo}")
+                    continue
+                repos.append(repo)
+
             async with aiohttp.ClientSession(headers=headers) as session:
-                processed_repos = set()
-                for repo in allowed_repos:
-                    if self.reconcile_cancelled:
-                        if ctx:
-                            await ctx.send("🛑 Reconciliation cancelled by user.")
-                        return
-
-                    if repo_filter and repo != repo_filter:
-                        continue
-                        
-                    repo = repo.strip().lstrip("/")
-                    if repo in processed_repos:
-                        await self.log_debug(f"⏭️ Skipping already processed repo: {repo}")
-                        continue
-                        
-                    processed_repos.add(repo)
-                    repo_name = repo.split("/")[-1]
-                    await self.log_info(f"🔄 **Reconciling repository:** `{repo}`")
+                # Verify every repo up front (concurrently) so one bad repo doesn't stall the plan
+                checks = await asyncio.gather(*(self._check_reconcile_repo(session, repo, ctx, log_banner) for repo in repos))
+                if self.reconcile_cancelled:
                     if ctx:
-                        await ctx.send(f"🔄 Reconciling repo: {repo}")
-
-                    # Check if repository exists
-                    repo_check_url = f"https://api.github.com/repos/{repo}"
-                    await self.log_debug(f"🔍 Checking if repository {repo} exists...")
-                    
-                    status, _ = await self._make_github_request(session, repo_check_url)
-                    
-                    if status == 404:
-                        await self.log_error(f"❌ Repository `{repo}` does not exist on GitHub (404)")
-                        if ctx:
-                            await ctx.send(f"❌ Repository '{repo}' does not exist.")
-                        continue
-                    elif status == 403:
-                        await self.log_error(f"🚫 Cannot access repository `{repo}` (403 Forbidden - check token permissions)")
-                        if ctx:
-                            await ctx.send(f"🚫 Cannot access '{repo}'. Check token permissions.")
-                        continue
-                    elif status == 401:
-                        await self.log_error(f"🚫 GitHub authentication failed for `{repo}` (401 Unauthorized)")
-                        if ctx:
-                            await ctx.send(f"🚫 GitHub authentication failed. Check your token.")
-                        continue
-                    elif status != 200:
-                        await self.log_error(f"⚠️ Unexpected status {status} checking repository `{repo}`")
-                        if ctx:
-                            await ctx.send(f"⚠️ Cannot verify repository '{repo}'")
-                        continue
-                    else:
-                        await self.log_debug(f"✅ Repository {repo} exists and is accessible")
-
-                    # Process issues
-                    await self._reconcile_repo_items(session, repo, repo_name, False, ctx)
-                    if self.reconcile_cancelled:
-                        if ctx:
-                            await ctx.send("🛑 Reconciliation cancelled by user.")
-                        return
-
-                    # Process PRs
-                    await self._reconcile_repo_items(session, repo, repo_name, True, ctx)
-                    if self.reconcile_cancelled:
-                        if ctx:
-                            await ctx.send("🛑 Reconciliation cancelled by user.")
-                        return
-
-            print("🎉 Reconciliation process finished!")
-            await self.log_info("🎉 **Reconciliation Finished** successfully")
+                        await ctx.send("🛑 Reconciliation cancelled by user.")
+                    return
+
+                # A repo may always use its fair share of the budget, more when few repos are queued
+                limit = await self._get_config_int("reconcile_concurrency", 6)
+                active = max(1, sum(1 for ok in checks if ok))
+                budget = ReconcileBudget(limit, max(await self._get_config_int("reconcile_repo_concurrency", 2), limit // active))
+
+                pacer = ReconcileWritePacer(await self._get_config_int("reconcile_write_burst", 20), RECONCILE_WRITE_PAUSE)
+
+                # Issues and PRs of every repo run side by side under one shared budget
+                jobs = [
+                    self._reconcile_repo_items(
+                        session, repo, repo.split("/")[-1], is_pr, ctx,
+                        since=since, budget=budget, dry_run=dry_run, pacer=pacer,
+                    )
+                    for repo, ok in zip(repos, checks) if ok
+                    for is_pr in (False, True)
+                ]
+                plans = [p for p in await asyncio.gather(*jobs) if p is not None]
+                if self.reconcile_cancelled:
+                    if ctx:
+                        await ctx.send("🛑 Reconciliation cancelled by user.")
+                    return
+
+            if dry_run:
+                totals = ReconcilePlan.merge_counts(plans)
+                lines = ["🧪 **Reconcile dry run** — nothing was changed", ""]
+                lines += [f"• {key.replace('_', ' ').capitalize()}: `{value}`" for key, value in totals.items()]
+                lines.append(f"• Discord writes needed: `{sum(totals.values())}`")
+                await self.log_info(" | ".join(lines[2:]))
+                if ctx:
+                    await ctx.send("\n".join(lines))
+                return totals
+
+            completed = True
+            log.info("🎉 Reconciliation process finished!")
+            await log_banner("🎉 **Reconciliation Finished** successfully")
             if ctx:
                 await ctx.send("✅ Reconciliation complete.")
         finally:
             self.is_reconciling = False
+            if self._checkpoint is not None and not dry_run:
+                if completed:
+                    self._checkpoint = None
+                    await self._store_config("reconcile_checkpoint", {})
+                else:
+                    # Cancelled or crashed: keep what we have so `reconcile resume` can pick it up
+                    await self._save_reconcile_checkpoint(force=True)
+                    if ctx:
+                        await ctx.send("💾 Progress saved. Run `!genhub reconcile resume` to continue from the checkpoint.")
 
-    async def _reconcile_repo_items(self, session, repo, repo_name, is_pr, ctx):
-        """Reconcile issues or PRs for a repository with bounded parallel workers."""
-        if self.reconcile_cancelled:
+    async def load_reconcile_checkpoint(self):
+        """Return the saved reconcile checkpoint, or None when there is nothing to resume."""
+        import inspect
+        store = getattr(getattr(self.cog, "config", None), "reconcile_checkpoint", None)
+        if store is None:
+            return None
+        try:
+            saved = store()
+            if inspect.isawaitable(saved):
+                saved = await saved
+        except Exception:
+            return None
+        if not isinstance(saved, dict) or not saved.get("jobs") and "started_at" not in saved:
+            return None
+        return saved
+
+    async def _save_reconcile_checkpoint(self, force: bool = False):
+        """Persist the active checkpoint, at most every few seconds unless ``force`` is set."""
+        if self._checkpoint is None:
             return
+        now = time.time()
+        if not force and now - self._checkpoint_saved_at < CHECKPOINT_SAVE_INTERVAL:
+            return
+        self._checkpoint_saved_at = now
+        await self._store_config("reconcile_checkpoint", self._checkpoint)
+
+    def _checkpoint_job(self, repo, is_pr):
+        """Return the checkpoint record for one repo/kind, creating it on first use."""
+        if self._checkpoint is None:
+            return None
+        kind = "prs" if is_pr else "issues"
+        return self._checkpoint["jobs"].setdefault(
+            f"{repo}:{kind}", {"repo": repo, "kind": kind, "last_page": 0, "synced": [], "done": False}
+        )
+
+    async def _check_reconcile_repo(self, session, repo, ctx, log_banner):
+        """Return True when ``repo`` exists and the configured token can read it."""
+        await log_banner(f"🔄 **Reconciling repository:** `{repo}`")
+        if ctx:
+            await ctx.send(f"🔄 Reconciling repo: {repo}")
+
+        repo_check_url = f"https://api.github.com/repos/{repo}"
+        await self.log_debug(f"🔍 Checking if repository {repo} exists...")
+
+        status, _ = await self._make_github_request(session, repo_check_url)
+
+        if status == 404:
+            await self.log_error(f"❌ Repository `{repo}` does not exist on GitHub (404)")
+            if ctx:
+                await ctx.send(f"❌ Repository '{repo}' does not exist.")
+            return False
+        elif status == 403:
+            await self.log_error(f"🚫 Cannot access repository `{repo}` (403 Forbidden - check token permissions)")
+            if ctx:
+                await ctx.send(f"🚫 Cannot access '{repo}'. Check token permissions.")
+            return False
+        elif status == 401:
+            await self.log_error(f"🚫 GitHub authentication failed for `{repo}` (401 Unauthorized)")
+            if ctx:
+                await ctx.send(f"🚫 GitHub authentication failed. Check your token.")
+            return False
+        elif status != 200:
+            await self.log_error(f"⚠️ Unexpected status {status} checking repository `{repo}`")
+            if ctx:
+                await ctx.send(f"⚠️ Cannot verify repository '{repo}'")
+            return False
+
+        await self.log_debug(f"✅ Repository {repo} exists and is accessible")
+        return True
+
+    async def _reconcile_repo_items(self, session, repo, repo_name, is_pr, ctx, since: str = None, budget=None, dry_run: bool = False, pacer=None):
+        """Reconcile issues or PRs for a repository, drawing workers from the shared reconcile budget.
+
+        Runs in two phases: every item is planned first (GitHub and Discord reads only), then the
+        resulting :class:`ReconcilePlan` is applied. Returns the plan, or None when nothing ran.
+        """
+        if self.reconcile_cancelled:
+            return None
 
         item_type = "PRs" if is_pr else "issues"
         endpoint = "pulls" if is_pr else "issues"
-        forum_id = await (self.cog.config.prs_forum_id() if is_pr else self.cog.config.issues_forum_id())
+        forum_id = await self._route_config(repo, "prs_forum_id" if is_pr else "issues_forum_id")
 
-        print(f"📋 {item_type} forum ID: {forum_id}")
+        log.info("📋 %s forum ID: %s", item_type, forum_id)
         forum = await self._resolve_target_channel(forum_id)
 
         if not forum:
@@ -1356,10 +1878,20 @@ class GitHubEventHandlers:
 
         await self.log_debug(f"✅ {item_type} forum found: {getattr(forum, 'name', forum_id)} ({forum_id})")
 
+        job = None if dry_run else self._checkpoint_job(repo, is_pr)
+        if job and job["done"]:
+            await self.log_debug(f"⏭️ {item_type} for {repo} already completed in this run (checkpoint)")
+            return
+        already_synced = set(job["synced"]) if job else set()
+        start_page = job["last_page"] + 1 if job else 1
+        if start_page > 1:
+            await self.log_info(f"⏩ Resuming {item_type.lower()} for `{repo}` from page {start_page} ({len(already_synced)} already synced)")
+
         # Collect all GitHub items (only fetch OPEN items for both issues and PRs)
         github_items = {}
         items_to_process = []
-        page = 1
+        page_pending = {}
+        page = start_page
         max_pages = 50
         state_param = "open"  # Only fetch OPEN issues and OPEN PRs
 
@@ -1368,6 +1900,9 @@ class GitHubEventHandlers:
                 return
 
             url = f"https://api.github.com/repos/{repo}/{endpoint}?state={state_param}&per_page=100&page={page}"
+            if since:
+                # Issues support ?since= natively; pulls only sort by update time, so we stop paging below
+                url += f"&since={since}" if not is_pr else "&sort=updated&direction=desc"
             await self.log_debug(f"🌐 Fetching open {item_type.lower()} page {page} for {repo}")
 
             status, data = await self._make_github_request(session, url)
@@ -1381,10 +1916,15 @@ class GitHubEventHandlers:
             if not data or len(data) == 0:
                 break
 
+            reached_since = False
             for item in data:
                 if self.reconcile_cancelled:
                     return
 
+                if since and is_pr and (item.get("updated_at") or "") < since:
+                    reached_since = True
+                    break
+
                 # Filter out PRs from issues endpoint
                 if not is_pr and item.get("pull_request"):
                     continue
@@ -1395,69 +1935,127 @@ class GitHubEventHandlers:
 
                 number = item["number"]
                 github_items[number] = item
-                items_to_process.append(item)
+                if number in already_synced:
+                    continue
+                items_to_process.append((page, item))
+                page_pending[page] = page_pending.get(page, 0) + 1
 
-            if len(data) < 100:
+            page_pending.setdefault(page, 0)
+            if reached_since or len(data) < 100:
                 break
             page += 1
 
         total_count = len(items_to_process)
+        plan = ReconcilePlan(repo, is_pr)
+        # Resumed runs never saw the earlier pages, so they cannot tell which threads are orphaned.
+        # PRs only reconcile open ones so closed PR threads are preserved.
+        check_orphans = not is_pr and not since and start_page == 1
+
         if total_count == 0:
             await self.log_debug(f"ℹ️ No open {item_type.lower()} found to reconcile for {repo}")
-            if ctx:
+            if ctx and not dry_run:
                 await ctx.send(f"ℹ️ No {item_type.lower()} to reconcile for `{repo}`.")
-            return
+            if job:
+                job["done"] = True
+                await self._save_reconcile_checkpoint(force=True)
+            return plan
 
-        await self.log_info(f"⚡ Reconciling **{total_count} open {item_type.lower()}** for `{repo}` in parallel (4 workers)...")
+        if budget is None:
+            budget = ReconcileBudget(4, 4)
+
+        # Plan phase: reads only
+        async def planner(item):
+            if self.reconcile_cancelled:
+                return None
+            async with budget.slot(repo):
+                if self.reconcile_cancelled:
+                    return None
+                try:
+                    return await self._plan_item(session, forum, repo, item, is_pr)
+                except Exception as e:
+                    await self.log_error(f"❌ Error planning {item_type.lower()[:-1]} {repo}#{item.get('number')}: {e}")
+                    return None
+
+        item_plans = await asyncio.gather(*(planner(item) for _, item in items_to_process))
+        plan.items = [p for p in item_plans if p is not None]
+        if check_orphans and not self.reconcile_cancelled:
+            plan.orphans = await self._find_orphaned_threads(forum, repo, github_items)
+
+        if dry_run or self.reconcile_cancelled:
+            return plan
+
+        await self._apply_repo_plan(forum, repo, repo_name, item_type, plan, items_to_process, item_plans, ctx, budget, pacer, job, page_pending, len(already_synced))
+
+        if check_orphans and not self.reconcile_cancelled:
+            await self._delete_orphaned_threads(plan.orphans, item_type, pacer)
+        return plan
+
+    async def _apply_repo_plan(self, forum, repo, repo_name, item_type, plan, items_to_process, item_plans, ctx, budget, pacer, job, page_pending, prior_synced):
+        """Apply phase: execute planned writes, advancing the checkpoint as items complete."""
+        total_count = len(items_to_process)
+        counts = plan.counts()
+        pending_writes = counts["threads_to_create"] + counts["tags_to_change"] + counts["initial_messages"] + counts["comments_to_post"]
+        await self.log_info(f"⚡ Reconciling **{total_count} open {item_type.lower()}** for `{repo}` — {pending_writes} Discord writes planned (shared budget: {budget.limit} workers)...")
         if ctx:
-            await ctx.send(f"⚡ Reconciling **{total_count} {item_type.lower()}** for `{repo}` in parallel (4 concurrent workers)...")
+            await ctx.send(f"⚡ Reconciling **{total_count} {item_type.lower()}** for `{repo}`: {pending_writes} changes planned (up to {budget.per_repo} of {budget.limit} shared workers)...")
+
+        def advance_checkpoint(page, number):
+            # last_page only moves past pages whose items are all synced, so resume never skips work
+            job["synced"].append(number)
+            page_pending[page] -= 1
+            while page_pending.get(job["last_page"] + 1) == 0:
+                job["last_page"] += 1
 
-        # Bounded parallel workers with Semaphore
-        concurrency_limit = 4
-        sem = asyncio.Semaphore(concurrency_limit)
         processed_count = 0
         progress_lock = asyncio.Lock()
+        started_at = time.time()
+        overall_total = prior_synced + total_count
 
-        async def worker(item, idx):
+        async def worker(page, item, item_plan):
             nonlocal processed_count
             if self.reconcile_cancelled:
                 return
-            async with sem:
+            async with budget.slot(repo):
                 if self.reconcile_cancelled:
                     return
-                try:
-                    await self._reconcile_item(session, forum, repo, item, is_pr, ctx, idx, repo_name)
-                except Exception as e:
-                    await self.log_error(f"❌ Error reconciling {item_type.lower()[:-1]} {repo}#{item.get('number')}: {e}")
+                if item_plan is not None:
+                    try:
+                        await self._apply_item(forum, repo, item_plan, pacer)
+                    except Exception as e:
+                        await self.log_error(f"❌ Error reconciling {item_type.lower()[:-1]} {repo}#{item.get('number')}: {e}")
 
                 async with progress_lock:
                     processed_count += 1
+                    if job is not None and item_plan is not None:
+                        advance_checkpoint(page, item["number"])
+                        await self._save_reconcile_checkpoint()
                     if ctx and not self.reconcile_cancelled and (processed_count % 15 == 0 or processed_count == total_count):
-                        pct = int((processed_count / total_count) * 100)
+                        done = prior_synced + processed_count
+                        pct = int((done / overall_total) * 100)
+                        elapsed = max(time.time() - started_at, 0.001)
+                        rate = processed_count / elapsed
+                        eta = format_duration((total_count - processed_count) / rate) if rate else "?"
                         try:
-                            await ctx.send(f"📊 **Progress ({repo_name} {item_type}):** {processed_count}/{total_count} processed ({pct}%)")
+                            await ctx.send(f"📊 **Progress ({repo_name} {item_type}):** {done}/{overall_total} processed ({pct}%) • {rate * 60:.0f}/min • ETA {eta}")
                         except Exception as send_err:
                             await self.log_error(f"⚠️ Failed to send progress update: {send_err}")
 
-        tasks = [worker(item, i + 1) for i, item in enumerate(items_to_process)]
-        await asyncio.gather(*tasks)
+        await asyncio.gather(*(
+            worker(page, item, item_plan)
+            for (page, item), item_plan in zip(items_to_process, item_plans)
+        ))
+        if job is not None and not self.reconcile_cancelled:
+            job["done"] = all(p is not None for p in item_plans)
+        await self._save_reconcile_checkpoint(force=True)
 
         await self.log_info(f"✅ {item_type} reconciliation complete for `{repo}`: **{processed_count}/{total_count}** processed")
         if ctx and not self.reconcile_cancelled:
             await ctx.send(f"✅ Processed {processed_count}/{total_count} {item_type.lower()} for `{repo}`")
 
-        # Clean up orphaned threads (only for issues; PRs only reconcile open ones so closed PR threads are preserved)
-        if not is_pr:
-            await self._cleanup_orphaned_threads(forum, repo, github_items, is_pr)
-
-    async def _cleanup_orphaned_threads(self, forum, repo, github_items, is_pr):
-        """Clean up threads that exist in forum but don't have corresponding GitHub items."""
-        item_type = "PRs" if is_pr else "issues"
-        print(f"🧹 Checking for orphaned {item_type.lower()} threads in {forum.name}...")
-
-        # Get all threads in the forum
+    async def _find_orphaned_threads(self, forum, repo, github_items):
+        """Return ``(number, thread)`` pairs for repo threads whose GitHub item is no longer open."""
+        log.info("🧹 Checking for orphaned threads in %s...", forum.name)
         all_threads = []
-        orphaned_count = 0
 
         # Check active threads
         try:
@@ -1466,7 +2064,8 @@ class GitHubEventHandlers:
         except (TypeError, AttributeError):
             pass  # Handle mock objects in tests
 
-        # Check archived threads (limit to avoid excessive API calls)
+        # Check archived threads (limit to avoid excessive API calls). The crawler's full archive
+        # index is only used for lookups; deleting across the whole archive is deliberately not done.
         if hasattr(forum, "archived_threads"):
             try:
                 async for thread in forum.archived_threads(limit=100):  # Reasonable limit
@@ -1474,50 +2073,49 @@ class GitHubEventHandlers:
             except (TypeError, AttributeError):
                 pass  # Handle mock objects in tests
 
-        # Check each thread to see if it corresponds to a GitHub item
+        orphans = []
+        repo_short = repo.split('/')[-1].lower()
         for thread in all_threads:
             try:
                 # Extract issue/PR number from thread name
-                import re
                 match = re.search(r'\[GH\]\s*\[#(\d+)\]', thread.name)
                 if not match:
                     continue
-
                 number = int(match.group(1))
 
-                # Check if this thread corresponds to our repository
-                # Look for the repo tag or check thread content
-                repo_tag_found = False
-                if hasattr(thread, 'applied_tags') and thread.applied_tags:
-                    for tag in thread.applied_tags:
-                        if hasattr(tag, 'name') and tag.name.lower() == repo.split('/')[-1].lower():
-                            repo_tag_found = True
-                            break
-
-                if not repo_tag_found:
-                    continue  # This thread is for a different repo
+                # The repo tag tells us which repository the thread belongs to
+                tag_names = [getattr(t, "name", "").lower() for t in (getattr(thread, "applied_tags", None) or [])]
+                if repo_short not in tag_names:
+                    continue
 
-                # Check if GitHub item still exists
                 if number not in github_items:
-                    orphaned_count += 1
-                    print(f"🗑️ Found orphaned {item_type.lower()[:-1]} thread: #{number} - {thread.name[:50]}...")
-
-                    # Try to delete the orphaned thread
-                    try:
-                        await thread.delete()
-                        print(f"✅ Deleted orphaned thread #{number}")
-                    except discord.Forbidden:
-                        print(f"⚠️ Cannot delete thread #{number}: Missing permissions")
-                    except discord.NotFound:
-                        print(f"ℹ️ Thread #{number} already deleted or not found")
-                    except Exception as e:
-                        print(f"⚠️ Failed to delete orphaned thread #{number}: {e}")
-
+                    log.info("🗑️ Found orphaned thread: #%s - %s...", number, thread.name[:50])
+                    orphans.append((number, thread))
             except Exception as e:
-                print(f"⚠️ Error checking thread {getattr(thread, 'name', 'unknown')}: {e}")
+                log.warning("⚠️ Error checking thread %s: %s", getattr(thread, 'name', 'unknown'), e)
                 continue
+        return orphans
+
+    async def _delete_orphaned_threads(self, orphans, item_type, pacer=None):
+        """Delete the orphaned threads found during the plan phase."""
+        pacer = pacer or ReconcileWritePacer()
+        for number, thread in orphans:
+            try:
+                await pacer.wait()
+                await thread.delete()
+                self.comment_index.forget(getattr(thread, "id", thread))
+                crawler = getattr(self.cog, "archive_crawler", None)
+                if isinstance(crawler, ArchiveCrawler):
+                    crawler.forget(getattr(thread, "id", thread))
+                log.info("✅ Deleted orphaned thread #%s", number)
+            except discord.Forbidden:
+                log.warning("⚠️ Cannot delete thread #%s: Missing permissions", number)
+            except discord.NotFound:
+                log.info("ℹ️ Thread #%s already deleted or not found", number)
+            except Exception as e:
+                log.warning("⚠️ Failed to delete orphaned thread #%s: %s", number, e)
 
-        if orphaned_count > 0:
-            print(f"🧹 Cleaned up {orphaned_count} orphaned {item_type.lower()} threads")
+        if orphans:
+            log.info("🧹 Cleaned up %s orphaned %s threads", len(orphans), item_type.lower())
         else:
-            print(f"✅ No orphaned {item_type.lower()} threads found")
+            log.info("✅ No orphaned %s threads found", item_type.lower())
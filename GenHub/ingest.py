@@ -0,0 +1,119 @@
+"""Standalone webhook ingestion service for spool mode.
+
+Verifies GitHub deliveries exactly like the cog's webhook server (event allowlist, body size
+cap, streamed HMAC, per-route secrets) and appends them to a SQLite spool instead of handling
+them. The cog, with ``[p]genhub spool <path>``, consumes the spool and does the Discord work,
+so deliveries that arrive while the bot restarts are kept, and ingestion can run (and be
+scaled or restarted) independently of the gateway connection.
+
+Run it from the directory that contains the ``GenHub`` package, in the bot's environment::
+
+    python -m GenHub.ingest --spool /data/genhub-spool.db --port 8080 --secret "$GENHUB_WEBHOOK_SECRET"
+    python -m GenHub.ingest --spool /data/genhub-spool.db --routes routes.json
+
+``--routes`` takes a JSON object shaped like the cog's ``route_profiles`` config; only the
+``repos`` and ``secret`` of each profile matter here.
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import signal
+from types import SimpleNamespace
+
+from aiohttp import web
+
+from .log import log
+from .routing import RouteTable
+from .spool import Spool
+from .webhook import DEFAULT_MAX_BODY_KB, WebhookServer
+
+
+class StaticConfig:
+    """Read-only stand-in for Red's ``Config`` (``await config.key()``) built from CLI settings."""
+
+    def __init__(self, values: dict):
+        self._values = values
+
+    def __getattr__(self, key):
+        if key.startswith("_"):
+            raise AttributeError(key)
+
+        async def get():
+            return self._values.get(key)
+        return get
+
+
+class IngestServer(WebhookServer):
+    """``WebhookServer`` whose verified deliveries go to the spool instead of the handlers."""
+
+    def __init__(self, spool: Spool, settings: dict, route_profiles: dict = None):
+        cog = SimpleNamespace(config=StaticConfig(settings))
+        cog.routes = RouteTable(cog)
+        cog.routes.build(route_profiles or {})
+        super().__init__(cog)
+        self.spool = spool
+
+    async def _dispatch(self, request, event_type: str, data, body: bytes):
+        delivery_id = request.headers.get("X-GitHub-Delivery", "")
+        try:
+            seq = await asyncio.to_thread(self.spool.append, delivery_id, event_type, body)
+        except Exception as e:
+            log.error("❌ [Ingest] Failed to spool delivery %s: %s", delivery_id, e)
+            return web.Response(status=503, text="Spool unavailable"), ""
+        log.debug("📼 [Ingest] Spooled %s as #%s (Delivery: %s)", event_type, seq, delivery_id)
+        action = data.get("action", "") if isinstance(data, dict) else ""
+        return web.Response(status=202), action
+
+
+async def serve(args):
+    settings = {
+        "webhook_host": args.host,
+        "webhook_port": args.port,
+        "github_secret": args.secret or "",
+        "webhook_max_body_kb": args.max_body_kb,
+        "event_allowlist": args.allow or [],
+        "trace_slow_ms": 0,
+    }
+    routes = {}
+    if args.routes:
+        with open(args.routes, encoding="utf-8") as fh:
+            routes = json.load(fh)
+    spool = Spool(args.spool)
+    server = IngestServer(spool, settings, routes)
+    await server.start()
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, stop.set)
+        except NotImplementedError:
+            pass
+    try:
+        await stop.wait()
+    finally:
+        await server.stop()
+        spool.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="GenHub webhook ingestion service (spool mode)")
+    parser.add_argument("--spool", required=True, help="SQLite spool file shared with the cog")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--secret", default=os.environ.get("GENHUB_WEBHOOK_SECRET", ""), help="global webhook secret (default: $GENHUB_WEBHOOK_SECRET)")
+    parser.add_argument("--routes", help="JSON file of route profiles with per-repository secrets")
+    parser.add_argument("--allow", action="append", help="only spool this event or event.action (repeatable)")
+    parser.add_argument("--max-body-kb", type=int, default=DEFAULT_MAX_BODY_KB)
+    parser.add_argument("-v", "--verbose", action="store_true")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    asyncio.run(serve(args))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,88 @@
+import datetime
+import json
+import logging
+import logging.handlers
+import queue
+import sys
+
+from .tracing import _current_trace
+
+
+log = logging.getLogger("red.genhub")
+
+_STANDARD_ATTRS = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime", "delivery"}
+
+
+class DeliveryFilter(logging.Filter):
+    """Stamp records with the webhook delivery being handled (from the active trace), if any."""
+
+    def filter(self, record):
+        trace = _current_trace.get()
+        record.delivery = trace.delivery_id if trace is not None else None
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line: ``ts``, ``level``, ``logger``, ``message``, ``delivery`` plus any ``extra`` fields."""
+
+    def format(self, record):
+        data = {
+            "ts": datetime.datetime.fromtimestamp(record.created, datetime.timezone.utc).isoformat(),
+            "level": record.levelname.lower(),
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        if getattr(record, "delivery", None):
+            data["delivery"] = record.delivery
+        for key, value in vars(record).items():
+            if key not in _STANDARD_ATTRS and not key.startswith("_"):
+                data[key] = value if isinstance(value, (str, int, float, bool, type(None))) else str(value)
+        if record.exc_info:
+            data["exc"] = self.formatException(record.exc_info)
+        return json.dumps(data, ensure_ascii=False)
+
+
+class _ForwardToRed(logging.Handler):
+    """Hands records drained from the queue to Red's own handlers (console, log files)."""
+
+    def emit(self, record):
+        (log.parent or logging.getLogger()).callHandlers(record)
+
+
+log.addFilter(DeliveryFilter())
+
+_listener = None
+_queue_handler = None
+
+
+def setup_logging(json_output: bool = False):
+    """Route ``red.genhub`` through a queue so callers never block on console or file I/O.
+
+    Records are drained by a background thread into Red's handlers, or as JSON lines on
+    stdout when ``json_output`` is set. Calling it again switches the output mode.
+    """
+    global _listener, _queue_handler
+    stop_logging()
+    records = queue.SimpleQueue()
+    if json_output:
+        target = logging.StreamHandler(sys.stdout)
+        target.setFormatter(JsonFormatter())
+    else:
+        target = _ForwardToRed()
+    _queue_handler = logging.handlers.QueueHandler(records)
+    _listener = logging.handlers.QueueListener(records, target, respect_handler_level=False)
+    log.addHandler(_queue_handler)
+    log.propagate = False
+    _listener.start()
+
+
+def stop_logging():
+    """Flush queued records and restore plain propagation to Red's handlers (idempotent)."""
+    global _listener, _queue_handler
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+    if _queue_handler is not None:
+        log.removeHandler(_queue_handler)
+        _queue_handler = None
+    log.propagate = True
@@ -0,0 +1,93 @@
+import asyncio
+
+from .log import log
+from .tracing import detached_task
+
+
+DEFAULT_WINDOW_SECONDS = 10
+# Item links listed in one summary entry before it switches to "+N more"
+MAX_LINKS = 10
+LOG_MESSAGE_LIMIT = 1950
+
+
+class LogBatcher:
+    """Groups label and assignee log lines per repository into summary log-channel messages.
+
+    Bulk-labelling 40 issues would otherwise post 40 log messages into a channel Discord lets us
+    write 5 messages per 5 seconds to. Lines are collected per repo for ``log_batch_seconds``
+    and grouped by (item type, action, label/assignee, sender); a group of one keeps its usual
+    line, larger groups become one entry like "12 issues labeled `bug` by X" with links. The
+    whole window goes out as one message. Console logging and every other log line (opened,
+    closed, merged, errors...) are not delayed.
+    """
+
+    def __init__(self, handlers):
+        self.handlers = handlers
+        self.pending = {}
+
+    async def add(self, line: str, repo_full_name: str, item_type: str, action: str, detail: str, number, url: str, sender: str):
+        window = await self.handlers._get_config_int("log_batch_seconds", DEFAULT_WINDOW_SECONDS)
+        if window <= 0:
+            return await self.handlers.log_info(line)
+        log.info("ℹ️ %s", line)
+
+        entry = self.pending.get(repo_full_name)
+        if entry is None:
+            entry = self.pending[repo_full_name] = {"groups": {}}
+            entry["task"] = detached_task(self._flush_later(repo_full_name, window))
+        group = entry["groups"].setdefault((item_type, action, detail, sender), [])
+        if not any(n == number for n, _, _ in group):
+            group.append((number, url, line))
+
+    async def _flush_later(self, repo_full_name, window):
+        await asyncio.sleep(window)
+        await self._flush_repo(repo_full_name)
+
+    async def _flush_repo(self, repo_full_name):
+        entry = self.pending.pop(repo_full_name, None)
+        if not entry:
+            return
+        task = entry["task"]
+        if task is not asyncio.current_task():
+            task.cancel()
+        if not await self.handlers._should_log("info"):
+            return
+        lines = [self.summarize(repo_full_name, key, items) for key, items in entry["groups"].items()]
+        for chunk in _chunks(lines, LOG_MESSAGE_LIMIT):
+            await self.handlers._send_to_log_channel(chunk)
+
+    @staticmethod
+    def summarize(repo_full_name, key, items):
+        """One log entry for a group; a single item keeps its original ``format_log_line`` line."""
+        if len(items) == 1:
+            return items[0][2]
+        item_type, action, detail, sender = key
+        noun = "issues" if item_type == "Issue" else "PRs"
+        links = ", ".join(f"[#{n}](<{u}>)" if u else f"#{n}" for n, u, _ in items[:MAX_LINKS])
+        if len(items) > MAX_LINKS:
+            links += f" +{len(items) - MAX_LINKS} more"
+        if action in ("labeled", "unlabeled"):
+            emoji, what = "🏷️ 📌", f"`{detail}`"
+        else:
+            emoji, what = "👤 📌", f"**{detail}**"
+        repo_short = repo_full_name.split("/")[-1]
+        return f"{emoji} **{len(items)} {noun} {action}** {what} by **{sender}** in `{repo_short}`: {links}"
+
+    async def flush(self):
+        """Post every pending summary now (cog unload)."""
+        for repo_full_name in list(self.pending):
+            await self._flush_repo(repo_full_name)
+
+
+def _chunks(lines, limit):
+    """Join ``lines`` with newlines into messages of at most ``limit`` characters."""
+    chunk = ""
+    for line in lines:
+        line = line[:limit]
+        if chunk and len(chunk) + 1 + len(line) > limit:
+            yield chunk
+            chunk = line
+        else:
+            chunk = f"{chunk}\n{line}" if chunk else line
+    if chunk:
+        yield chunk
@@ -0,0 +1,148 @@
+import logging
+import threading
+import time
+
+
+# Upper bounds (seconds) for latency histograms
+LATENCY_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+HELP = {
+    "genhub_webhook_deliveries_total": ("counter", "Webhook deliveries by event, action and HTTP status."),
+    "genhub_webhook_skipped_total": ("counter", "Webhook deliveries acknowledged without processing, by event and action (unhandled names as other)."),
+    "genhub_webhook_signature_failures_total": ("counter", "Webhook deliveries rejected by HMAC verification."),
+    "genhub_handler_latency_seconds": ("histogram", "Time spent handling a delivery, by event type."),
+    "genhub_github_api_calls_total": ("counter", "GitHub REST API calls by response status."),
+    "genhub_github_ratelimit_remaining": ("gauge", "GitHub API requests left in the current rate-limit window."),
+    "genhub_discord_sends_total": ("counter", "Messages sent to Discord."),
+    "genhub_discord_rate_limited_total": ("counter", "Discord HTTP 429 responses reported by discord.py."),
+    "genhub_queue_depth": ("gauge", "Items waiting in GenHub's internal queues."),
+    "genhub_coalesced_events_total": ("counter", "Issue/PR events merged into another handler run, by event type."),
+    "genhub_offloaded_tasks_total": ("counter", "Payload parses and renders run in the offload worker pool, by kind."),
+    "genhub_cache_requests_total": ("counter", "Cache lookups by cache and result (hit/miss)."),
+    "genhub_cache_hit_ratio": ("gauge", "Share of cache lookups served from the cache."),
+}
+
+
+def _fmt_labels(labels):
+    if not labels:
+        return ""
+    parts = []
+    for key, value in labels:
+        value = str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        parts.append(f'{key}="{value}"')
+    return "{" + ",".join(parts) + "}"
+
+
+def _fmt_value(value):
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+
+class Metrics:
+    """In-process counters and histograms rendered in the Prometheus text format.
+
+    Kept dependency-free on purpose; values live for the lifetime of the process.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters = {}
+        self._histograms = {}
+        self._last = {}
+
+    def inc(self, name, amount=1, **labels):
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0) + amount
+
+    def observe(self, name, value, **labels):
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            hist = series.get(key)
+            if hist is None:
+                hist = series[key] = {"buckets": [0] * len(LATENCY_BUCKETS), "sum": 0.0, "count": 0}
+            for i, bound in enumerate(LATENCY_BUCKETS):
+                if value <= bound:
+                    hist["buckets"][i] += 1
+            hist["sum"] += value
+            hist["count"] += 1
+
+    def mark(self, name):
+        """Record that ``name`` (e.g. ``discord_send``) just happened; read back with ``last``."""
+        self._last[name] = time.time()
+
+    def last(self, name):
+        """Unix time ``name`` was last marked, or None."""
+        return self._last.get(name)
+
+    def value(self, name, **labels):
+        """Current value of a counter series (0 when it was never incremented)."""
+        return self._counters.get(name, {}).get(tuple(sorted(labels.items())), 0)
+
+    def reset(self):
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+            self._last.clear()
+
+    def render(self, gauges=None, counters=None):
+        """Render every series; ``gauges``/``counters`` add ``(name, labels_dict, value)`` samples computed at scrape time."""
+        samples = {}
+        with self._lock:
+            for name, series in self._counters.items():
+                for key, value in series.items():
+                    samples.setdefault(name, []).append((key, value))
+            histograms = {
+                name: {key: {"buckets": list(h["buckets"]), "sum": h["sum"], "count": h["count"]} for key, h in series.items()}
+                for name, series in self._histograms.items()
+            }
+        for name, labels, value in list(counters or []) + list(gauges or []):
+            samples.setdefault(name, []).append((tuple(sorted(labels.items())), value))
+
+        lines = []
+        for name in sorted(set(samples) | set(histograms)):
+            kind, help_text = HELP.get(name, ("untyped", name))
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            for key, value in sorted(samples.get(name, []), key=lambda s: s[0]):
+                lines.append(f"{name}{_fmt_labels(key)} {_fmt_value(value)}")
+            for key, hist in sorted(histograms.get(name, {}).items()):
+                for bound, count in zip(LATENCY_BUCKETS, hist["buckets"]):
+                    lines.append(f"{name}_bucket{_fmt_labels(key + (('le', bound),))} {count}")
+                lines.append(f"{name}_bucket{_fmt_labels(key + (('le', '+Inf'),))} {hist['count']}")
+                lines.append(f"{name}_sum{_fmt_labels(key)} {round(hist['sum'], 6)}")
+                lines.append(f"{name}_count{_fmt_labels(key)} {hist['count']}")
+        return "\n".join(lines) + "\n"
+
+
+class DiscordRateLimitCounter(logging.Handler):
+    """Counts the 429 warnings discord.py's HTTP client logs, since it retries them internally."""
+
+    def __init__(self, registry):
+        super().__init__(level=logging.WARNING)
+        self.registry = registry
+
+    def emit(self, record):
+        try:
+            if "rate limit" in record.getMessage().lower():
+                self.registry.inc("genhub_discord_rate_limited_total")
+        except Exception:
+            pass
+
+
+metrics = Metrics()
+_rate_limit_handler = DiscordRateLimitCounter(metrics)
+
+
+def install_discord_rate_limit_counter():
+    """Attach the 429 counter to the ``discord.http`` logger (idempotent)."""
+    logger = logging.getLogger("discord.http")
+    if _rate_limit_handler not in logger.handlers:
+        logger.addHandler(_rate_limit_handler)
+
+
+def uninstall_discord_rate_limit_counter():
+    logging.getLogger("discord.http").removeHandler(_rate_limit_handler)
@@ -0,0 +1,109 @@
+import asyncio
+import inspect
+import multiprocessing
+import os
+import site
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import discord
+
+from .log import log
+from .metrics import metrics
+from .utils import create_comment_embed, decode_json
+
+
+# Hard cap on worker processes, whatever offload_workers says; each one holds a full interpreter
+MAX_WORKERS = 4
+DEFAULT_THRESHOLD_KB = 64
+
+
+def parse_payload(body: bytes):
+    """Decode a webhook body in a worker process."""
+    return decode_json(body)
+
+
+def render_comment_embed(kwargs: dict) -> dict:
+    """Build a comment embed in a worker process; returns ``Embed.to_dict()`` for the event loop to rebuild."""
+    return create_comment_embed(**kwargs).to_dict()
+
+
+class PayloadOffloader:
+    """Runs JSON decoding and markdown rendering of large payloads in a process pool.
+
+    Big bot reviews can take tens of milliseconds to decode and render, all of it on the event
+    loop that also drives the Discord gateway heartbeat. Above ``threshold`` bytes that work is
+    handed to a small ``spawn`` pool instead; smaller payloads stay in-process, where pickling
+    would cost more than it saves. The pool starts lazily on first use and is disabled entirely
+    while ``offload_workers`` is 0. If the pool breaks, work falls back to the event loop.
+    """
+
+    def __init__(self, cog):
+        self.cog = cog
+        self.workers = 0
+        self.threshold = DEFAULT_THRESHOLD_KB * 1024
+        self._pool = None
+
+    def configure(self, workers: int, threshold_kb: int = DEFAULT_THRESHOLD_KB):
+        workers = max(0, min(int(workers), MAX_WORKERS, os.cpu_count() or 1))
+        if workers != self.workers:
+            self.close()
+        self.workers = workers
+        self.threshold = max(0, int(threshold_kb)) * 1024
+
+    async def load(self):
+        workers = await self._get("offload_workers", 0)
+        threshold_kb = await self._get("offload_threshold_kb", DEFAULT_THRESHOLD_KB)
+        self.configure(workers, threshold_kb)
+
+    async def _get(self, key, default: int) -> int:
+        attr = getattr(self.cog.config, key, None)
+        if attr is None:
+            return default
+        try:
+            val = attr()
+            if inspect.isawaitable(val):
+                val = await val
+        except Exception:
+            return default
+        return val if isinstance(val, int) and not isinstance(val, bool) else default
+
+    def should_offload(self, size: int) -> bool:
+        return self.workers > 0 and size >= self.threshold
+
+    def _executor(self):
+        if self._pool is None:
+            # spawn: never fork the bot's event loop, sockets and threads into the workers.
+            # Workers import this package by name, so make its parent directory importable.
+            package_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=site.addsitedir,
+                initargs=(package_root,),
+            )
+        return self._pool
+
+    async def _run(self, kind: str, func, arg):
+        loop = asyncio.get_running_loop()
+        try:
+            result = await loop.run_in_executor(self._executor(), func, arg)
+        except BrokenProcessPool as e:
+            log.warning("⚠️ Offload pool broke (%s); running %s in-process", e, kind)
+            self.close()
+            result = func(arg)
+        metrics.inc("genhub_offloaded_tasks_total", kind=kind)
+        return result
+
+    async def parse(self, body: bytes):
+        """Decode ``body`` as JSON; raises ``json.JSONDecodeError`` like ``json.loads``."""
+        return await self._run("parse", parse_payload, body)
+
+    async def comment_embed(self, **kwargs) -> discord.Embed:
+        """``create_comment_embed(**kwargs)`` rendered in a worker."""
+        return discord.Embed.from_dict(await self._run("render", render_comment_embed, kwargs))
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
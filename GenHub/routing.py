@@ -0,0 +1,92 @@
+import inspect
+
+from .log import log
+
+
+# Settings a route profile may override for its repositories; anything unset falls back to the global value
+ROUTE_KEYS = (
+    "issues_forum_id",
+    "prs_forum_id",
+    "issues_feed_chat_id",
+    "prs_feed_chat_id",
+    "updates_channel_id",
+    "contributor_role_id",
+)
+
+
+def _norm(repo) -> str:
+    return str(repo or "").lower().strip().lstrip("/")
+
+
+class RouteTable:
+    """Per-repository route profiles for serving several orgs/communities from one bot.
+
+    Profiles are stored in ``route_profiles`` as ``{name: {"repos": [...], "secret": "...",
+    <ROUTE_KEYS>...}}``. ``build`` flattens them into a repo -> profile index (and encodes
+    each profile's webhook secret once), so handlers resolve a delivery's forums, chats and
+    role with a single dict lookup. Repositories without a profile use the global settings.
+    """
+
+    def __init__(self, cog):
+        self.cog = cog
+        self.profiles = {}
+        self.index = {}
+        self._secrets = {}
+
+    async def load(self):
+        attr = getattr(self.cog.config, "route_profiles", None)
+        profiles = {}
+        if attr is not None:
+            try:
+                val = attr()
+                if inspect.isawaitable(val):
+                    val = await val
+                if isinstance(val, dict):
+                    profiles = val
+            except Exception as e:
+                log.warning("⚠️ Failed to load route profiles: %s", e)
+        self.build(profiles)
+
+    def build(self, profiles: dict):
+        index, secrets = {}, {}
+        for name, profile in profiles.items():
+            if not isinstance(profile, dict):
+                continue
+            for repo in profile.get("repos", []):
+                if _norm(repo) in index:
+                    log.warning("⚠️ %s is routed by several profiles; using %s", repo, name)
+                index[_norm(repo)] = name
+            if profile.get("secret"):
+                secrets[name] = str(profile["secret"]).encode()
+        self.profiles = {name: dict(profile) for name, profile in profiles.items() if isinstance(profile, dict)}
+        self.index = index
+        self._secrets = secrets
+
+    def profile_name(self, repo):
+        return self.index.get(_norm(repo))
+
+    def get(self, repo, key):
+        """``key`` from ``repo``'s profile, or None when the repo has no profile or the profile doesn't set it."""
+        name = self.index.get(_norm(repo))
+        return self.profiles[name].get(key) if name is not None else None
+
+    def secret_for(self, repo) -> bytes:
+        """The encoded webhook secret of ``repo``'s profile, or ``b""`` to use the global secret."""
+        name = self.index.get(_norm(repo))
+        return self._secrets.get(name, b"") if name is not None else b""
+
+    @property
+    def secret_keys(self):
+        return tuple(self._secrets.values())
+
+    def repos(self):
+        """Every routed repository, as configured."""
+        return [repo for profile in self.profiles.values() for repo in profile.get("repos", [])]
+
+    def forum_ids(self):
+        ids = []
+        for profile in self.profiles.values():
+            for key in ("issues_forum_id", "prs_forum_id"):
+                if isinstance(profile.get(key), int) and profile[key] not in ids:
+                    ids.append(profile[key])
+        return ids
@@ -0,0 +1,187 @@
+import asyncio
+import datetime
+import inspect
+import random
+import time
+
+from .log import log
+
+
+# How often the scheduler wakes up to look for repos whose next run is due
+TICK_SECONDS = 30
+# Delay applied to a due repo while a manual reconcile is still running
+BUSY_RETRY_SECONDS = 120
+
+
+class ReconcileScheduler:
+    """Runs incremental per-repo reconciles in the background on jittered intervals."""
+
+    def __init__(self, cog):
+        self.cog = cog
+        self.task = None
+        self.next_run = {}
+        self.last_run = {}
+        self._loaded = False
+
+    def start(self):
+        if self.task and not self.task.done():
+            return
+        self.task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self.task:
+            self.task.cancel()
+            try:
+                await self.task
+            except (asyncio.CancelledError, Exception):
+                pass
+            self.task = None
+
+    async def _get(self, key, default):
+        """Read a config value, tolerating missing keys and mocked configs."""
+        attr = getattr(self.cog.config, key, None)
+        if attr is None:
+            return default
+        try:
+            val = attr()
+            if inspect.isawaitable(val):
+                val = await val
+        except Exception:
+            return default
+        if isinstance(default, (int, float)):
+            return val if isinstance(val, (int, float)) and not isinstance(val, bool) else default
+        return val if isinstance(val, type(default)) else default
+
+    async def interval_for(self, repo: str) -> float:
+        """Return the configured interval for ``repo`` in seconds (0 disables scheduling)."""
+        overrides = await self._get("auto_reconcile_repo_minutes", {})
+        minutes = overrides.get(repo, await self._get("auto_reconcile_minutes", 0))
+        try:
+            return max(0.0, float(minutes) * 60)
+        except (TypeError, ValueError):
+            return 0.0
+
+    async def _jittered(self, interval: float) -> float:
+        jitter = min(max(await self._get("auto_reconcile_jitter", 0.2), 0.0), 0.9)
+        return interval * random.uniform(1 - jitter, 1 + jitter)
+
+    async def _load_state(self):
+        if self._loaded:
+            return
+        self._loaded = True
+        saved = await self._get("reconcile_schedule", {})
+        for repo, state in saved.items():
+            if isinstance(state, dict):
+                self.last_run[repo] = dict(state)
+
+    async def _save_state(self):
+        store = getattr(self.cog.config, "reconcile_schedule", None)
+        if store is None:
+            return
+        try:
+            res = store.set(self.last_run)
+            if inspect.isawaitable(res):
+                await res
+        except Exception as e:
+            log.warning("⚠️ Failed to persist reconcile schedule: %s", e)
+
+    async def _run(self):
+        while True:
+            try:
+                await self.tick()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                log.warning("⚠️ Reconcile scheduler tick failed: %s", e)
+            await asyncio.sleep(TICK_SECONDS)
+
+    async def tick(self, now: float = None):
+        """Run every repo whose next run is due; repos are reconciled one at a time."""
+        await self._load_state()
+        now = time.time() if now is None else now
+        allowed = await self.cog.config.allowed_repos()
+        repos = []
+        for r in allowed:
+            clean = r.strip().lstrip("/")
+            if clean and clean not in repos:
+                repos.append(clean)
+
+        for repo in list(self.next_run):
+            if repo not in repos:
+                self.next_run.pop(repo, None)
+
+        for repo in repos:
+            interval = await self.interval_for(repo)
+            if not interval:
+                self.next_run.pop(repo, None)
+                continue
+            if repo not in self.next_run:
+                last = self.last_run.get(repo, {}).get("at")
+                if last:
+                    self.next_run[repo] = last + await self._jittered(interval)
+                else:
+                    # Spread first runs across the interval so repos don't all fire at once
+                    self.next_run[repo] = now + random.uniform(0, interval)
+
+        for repo in sorted(self.next_run, key=self.next_run.get):
+            if self.next_run[repo] > now:
+                continue
+            await self._run_repo(repo, now)
+            now = time.time()
+
+    async def _run_repo(self, repo: str, now: float):
+        handlers = self.cog.handlers
+        interval = await self.interval_for(repo)
+
+        if handlers.is_reconciling:
+            self.next_run[repo] = now + BUSY_RETRY_SECONDS
+            return
+
+        # Back off until the GitHub window resets when the shared limiter is running low
+        limiter = handlers.rate_limiter
+        min_remaining = await self._get("auto_reconcile_min_ratelimit", 500)
+        if limiter.remaining < min_remaining and limiter.reset_time > now:
+            self.next_run[repo] = limiter.reset_time + random.uniform(0, TICK_SECONDS * 2)
+            self._record(repo, now, "deferred (rate limit low)", duration=0, keep_since=True)
+            return
+
+        # Webhooks already kept this repo fresh; try again once it has been quiet for a while
+        quiet = await self._get("auto_reconcile_quiet_minutes", 10) * 60
+        last_hook = handlers.last_webhook_at.get(repo.lower())
+        if last_hook and now - last_hook < quiet:
+            self.next_run[repo] = last_hook + quiet + random.uniform(0, TICK_SECONDS * 2)
+            self._record(repo, now, "skipped (recent webhook)", duration=0, keep_since=True)
+            return
+
+        since_ts = self.last_run.get(repo, {}).get("since")
+        since = (
+            datetime.datetime.fromtimestamp(since_ts, datetime.timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+            if since_ts
+            else None
+        )
+
+        started = time.time()
+        status = "ok"
+        try:
+            await handlers.reconcile_forum_tags(None, repo_filter=repo, since=since, checkpoint=False)
+            if handlers.reconcile_cancelled:
+                status = "cancelled"
+        except Exception as e:
+            status = f"failed: {e}"[:120]
+            log.warning("⚠️ Scheduled reconcile for %s failed: %s", repo, e)
+
+        self._record(repo, started, status, duration=time.time() - started, keep_since=(status != "ok"))
+        self.next_run[repo] = time.time() + await self._jittered(interval)
+        await self._save_state()
+
+    def _record(self, repo, at, status, duration, keep_since):
+        state = self.last_run.setdefault(repo, {})
+        state.update({"at": at, "status": status, "duration": round(duration, 1)})
+        if not keep_since:
+            # Next incremental run only needs items updated after this one started
+            state["since"] = at
+
+    def status_rows(self):
+        """Return ``(repo, next_run, last_run_state)`` rows for every scheduled or previously run repo."""
+        repos = sorted(set(self.next_run) | set(self.last_run))
+        return [(r, self.next_run.get(r), self.last_run.get(r, {})) for r in repos]
@@ -33,6 +33,8 @@ class SlashCommands:
         for key, value in updates.items():
             if value is not None:
                 await getattr(self.cog.config, key).set(value)
+        if github_secret is not None and hasattr(self.cog, "webhook"):
+            self.cog.webhook.set_secret(github_secret)
 
         await interaction.response.send_message(
             "✅ GenHub configuration updated.",
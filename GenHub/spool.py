@@ -0,0 +1,242 @@
+import asyncio
+import inspect
+import sqlite3
+import threading
+import time
+
+from .log import log
+
+
+# Deliveries read per poll, and how long to wait when the spool is empty
+BATCH_SIZE = 50
+POLL_INTERVAL = 0.5
+# Attempts for a delivery whose handler fails before moving past it
+MAX_ATTEMPTS = 3
+RETRY_DELAY = 2.0
+# Consumed deliveries (and their dedupe records) are kept this long, then pruned
+RETAIN_SECONDS = 24 * 3600
+PRUNE_EVERY = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS deliveries (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    delivery_id TEXT,
+    event TEXT NOT NULL,
+    body BLOB NOT NULL,
+    received_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS checkpoint (
+    consumer TEXT PRIMARY KEY,
+    offset INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS processed (
+    delivery_id TEXT PRIMARY KEY,
+    processed_at REAL NOT NULL
+);
+"""
+
+
+class Spool:
+    """Durable delivery log shared by the ingest service (writer) and the cog (reader).
+
+    A SQLite database in WAL mode, so one process can append while another reads. Rows are
+    verified webhook bodies in arrival order; the reader's position is the ``checkpoint``
+    offset, and ``processed`` remembers which delivery IDs already went through the handlers.
+    Methods are blocking; async callers run them with ``asyncio.to_thread``.
+    """
+
+    def __init__(self, path: str, consumer: str = "genhub"):
+        self.path = path
+        self.consumer = consumer
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None, timeout=30)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(_SCHEMA)
+
+    def append(self, delivery_id: str, event: str, body: bytes) -> int:
+        with self._lock:
+            cur = self._db.execute(
+                "INSERT INTO deliveries (delivery_id, event, body, received_at) VALUES (?, ?, ?, ?)",
+                (delivery_id, event, body, time.time()),
+            )
+            return cur.lastrowid
+
+    def offset(self) -> int:
+        with self._lock:
+            row = self._db.execute("SELECT offset FROM checkpoint WHERE consumer = ?", (self.consumer,)).fetchone()
+        return row[0] if row else 0
+
+    def read(self, after: int, limit: int = BATCH_SIZE):
+        """Return up to ``limit`` ``(seq, delivery_id, event, body)`` rows after offset ``after``."""
+        with self._lock:
+            return self._db.execute(
+                "SELECT seq, delivery_id, event, body FROM deliveries WHERE seq > ? ORDER BY seq LIMIT ?",
+                (after, limit),
+            ).fetchall()
+
+    def backlog(self, after: int) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM deliveries WHERE seq > ?", (after,)).fetchone()[0]
+
+    def is_processed(self, delivery_id: str) -> bool:
+        with self._lock:
+            return self._db.execute("SELECT 1 FROM processed WHERE delivery_id = ?", (delivery_id,)).fetchone() is not None
+
+    def commit(self, seq: int, delivery_id: str = None):
+        """Advance the checkpoint to ``seq`` and, if given, record ``delivery_id`` as handled, atomically."""
+        with self._lock:
+            self._db.execute("BEGIN")
+            try:
+                self._db.execute(
+                    "INSERT INTO checkpoint (consumer, offset) VALUES (?, ?) "
+                    "ON CONFLICT(consumer) DO UPDATE SET offset = excluded.offset",
+                    (self.consumer, seq),
+                )
+                if delivery_id:
+                    self._db.execute(
+                        "INSERT OR REPLACE INTO processed (delivery_id, processed_at) VALUES (?, ?)",
+                        (delivery_id, time.time()),
+                    )
+                self._db.execute("COMMIT")
+            except Exception:
+                self._db.execute("ROLLBACK")
+                raise
+
+    def prune(self, before: float):
+        """Drop consumed deliveries and dedupe records older than ``before``; returns rows deleted."""
+        with self._lock:
+            row = self._db.execute("SELECT offset FROM checkpoint WHERE consumer = ?", (self.consumer,)).fetchone()
+            offset = row[0] if row else 0
+            deleted = self._db.execute("DELETE FROM deliveries WHERE seq <= ? AND received_at < ?", (offset, before)).rowcount
+            self._db.execute("DELETE FROM processed WHERE processed_at < ?", (before,))
+        return deleted
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+
+class SpoolConsumer:
+    """Feeds deliveries from the spool through the cog's handlers (spool mode).
+
+    Each delivery is dispatched and then checkpointed, so after a crash or reload at most the
+    delivery in flight is handled again (at-least-once); delivery IDs that already went
+    through the handlers are skipped, which also absorbs GitHub redeliveries of handled events.
+    A delivery whose handler keeps failing is retried ``MAX_ATTEMPTS`` times and then left
+    unrecorded, so redelivering it from GitHub runs it again.
+    """
+
+    def __init__(self, cog):
+        self.cog = cog
+        self.spool = None
+        self.task = None
+        self.offset = 0
+        self.consumed = 0
+        self.duplicates = 0
+        self.failed = 0
+        self.last_consumed_at = None
+        self._draining = False
+
+    async def _path(self):
+        attr = getattr(self.cog.config, "spool_path", None)
+        if attr is None:
+            return ""
+        try:
+            val = attr()
+            if inspect.isawaitable(val):
+                val = await val
+        except Exception:
+            return ""
+        return val if isinstance(val, str) else ""
+
+    async def start(self):
+        """Open the configured spool and start consuming; a no-op while ``spool_path`` is unset."""
+        await self.stop()
+        path = await self._path()
+        if not path:
+            return
+        try:
+            self.spool = await asyncio.to_thread(Spool, path)
+            self.offset = await asyncio.to_thread(self.spool.offset)
+        except Exception as e:
+            log.error("❌ Could not open delivery spool %s: %s", path, e)
+            self.spool = None
+            return
+        log.info("📼 Consuming webhook deliveries from spool %s (offset %s)", path, self.offset)
+        self._draining = False
+        self.task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self.task:
+            self.task.cancel()
+            try:
+                await self.task
+            except (asyncio.CancelledError, Exception):
+                pass
+            self.task = None
+        if self.spool:
+            await asyncio.to_thread(self.spool.close)
+            self.spool = None
+
+    async def drain(self, timeout: float) -> bool:
+        """Let the delivery in progress finish (up to ``timeout``), then stop; True if it stopped cleanly.
+
+        Everything after the checkpoint stays in the spool for the next load.
+        """
+        self._draining = True
+        clean = True
+        if self.task and not self.task.done() and timeout > 0:
+            done, _ = await asyncio.wait({self.task}, timeout=timeout)
+            clean = bool(done)
+        elif self.task and not self.task.done():
+            clean = False
+        await self.stop()
+        return clean
+
+    async def _run(self):
+        while not self._draining:
+            try:
+                if not await self.consume_once():
+                    await asyncio.sleep(POLL_INTERVAL)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                log.warning("⚠️ Spool consumer error: %s", e)
+                await asyncio.sleep(RETRY_DELAY)
+
+    async def consume_once(self, limit: int = BATCH_SIZE) -> int:
+        """Dispatch the next batch of spooled deliveries; returns how many rows were read."""
+        rows = await asyncio.to_thread(self.spool.read, self.offset, limit)
+        for seq, delivery_id, event, body in rows:
+            if self._draining:
+                break
+            handled = None
+            if delivery_id and await asyncio.to_thread(self.spool.is_processed, delivery_id):
+                self.duplicates += 1
+                log.debug("⏭️ [Spool] Delivery %s already handled, skipping", delivery_id)
+            elif await self._dispatch(seq, delivery_id, event, body):
+                handled = delivery_id
+                self.consumed += 1
+            await asyncio.to_thread(self.spool.commit, seq, handled)
+            self.offset = seq
+            self.last_consumed_at = time.time()
+            if seq % PRUNE_EVERY == 0:
+                await asyncio.to_thread(self.spool.prune, time.time() - RETAIN_SECONDS)
+        return len(rows)
+
+    async def _dispatch(self, seq, delivery_id, event, body) -> bool:
+        for attempt in range(1, MAX_ATTEMPTS + 1):
+            response = await self.cog.webhook.replay_delivery(event, delivery_id, body)
+            if response.status < 500:
+                return True
+            if attempt < MAX_ATTEMPTS:
+                await asyncio.sleep(RETRY_DELAY * attempt)
+        self.failed += 1
+        log.error("❌ [Spool] Giving up on delivery %s (#%s, %s) after %s attempts", delivery_id, seq, event, MAX_ATTEMPTS)
+        return False
+
+    async def backlog(self) -> int:
+        if not self.spool:
+            return 0
+        return await asyncio.to_thread(self.spool.backlog, self.offset)
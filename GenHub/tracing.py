@@ -0,0 +1,172 @@
+import asyncio
+import collections
+import contextlib
+import contextvars
+import functools
+import json
+import time
+import uuid
+
+
+# Deliveries kept in memory for `[p]genhub trace`
+RECENT_TRACES = 200
+
+_current_trace = contextvars.ContextVar("genhub_trace", default=None)
+_current_span = contextvars.ContextVar("genhub_span", default=None)
+
+
+class Trace:
+    """Spans recorded while handling one webhook delivery."""
+
+    def __init__(self, delivery_id: str, name: str):
+        self.delivery_id = delivery_id
+        self.name = name
+        self.started_at = time.time()
+        self._t0 = time.perf_counter()
+        self.duration = None
+        self.spans = []
+
+    def offset_ms(self):
+        return (time.perf_counter() - self._t0) * 1000
+
+    def to_dict(self):
+        return {
+            "delivery": self.delivery_id,
+            "name": self.name,
+            "started_at": self.started_at,
+            "duration_ms": round(self.duration or 0, 2),
+            "spans": self.spans,
+        }
+
+    def render(self, limit: int = 1900) -> str:
+        """Indented span tree, one line per span, e.g. ``  find_thread  12.3 ms (+4.1)``."""
+        return render_trace(self.to_dict(), limit)
+
+
+def render_trace(data: dict, limit: int = 1900) -> str:
+    children = collections.defaultdict(list)
+    for span in data["spans"]:
+        children[span["parent"]].append(span)
+    lines = [f"{data['name']} [{data['delivery']}] {data['duration_ms']:.1f} ms"]
+
+    def walk(parent, depth):
+        for span in children.get(parent, []):
+            attrs = " ".join(f"{k}={v}" for k, v in span.get("attrs", {}).items())
+            err = f" ❌ {span['error']}" if span.get("error") else ""
+            lines.append(f"{'  ' * depth}{span['name']}  {span['duration_ms']:.1f} ms (+{span['start_ms']:.1f}){(' ' + attrs) if attrs else ''}{err}")
+            walk(span["id"], depth + 1)
+
+    walk(None, 1)
+    text = "\n".join(lines)
+    return text if len(text) <= limit else text[: limit - 4] + "\n..."
+
+
+class Tracer:
+    """Keeps the most recent delivery traces and hands out spans for the current one."""
+
+    def __init__(self, capacity: int = RECENT_TRACES):
+        self.recent = collections.OrderedDict()
+        self.capacity = capacity
+
+    @contextlib.contextmanager
+    def trace(self, delivery_id: str, name: str):
+        trace = Trace(delivery_id, name)
+        token = _current_trace.set(trace)
+        span_token = _current_span.set(None)
+        try:
+            yield trace
+        finally:
+            trace.duration = trace.offset_ms()
+            _current_span.reset(span_token)
+            _current_trace.reset(token)
+            self.recent[delivery_id] = trace
+            self.recent.move_to_end(delivery_id)
+            while len(self.recent) > self.capacity:
+                self.recent.popitem(last=False)
+
+    def get(self, delivery_id: str):
+        return self.recent.get(delivery_id)
+
+    @contextlib.asynccontextmanager
+    async def span(self, name: str, **attrs):
+        """Record an awaited call under the current delivery; a no-op outside of one."""
+        trace = _current_trace.get()
+        if trace is None:
+            yield
+            return
+        record = {
+            "id": len(trace.spans),
+            "parent": _current_span.get(),
+            "name": name,
+            "start_ms": round(trace.offset_ms(), 2),
+            "duration_ms": 0.0,
+        }
+        if attrs:
+            record["attrs"] = attrs
+        trace.spans.append(record)
+        token = _current_span.set(record["id"])
+        start = time.perf_counter()
+        try:
+            yield
+        except BaseException as e:
+            record["error"] = type(e).__name__
+            raise
+        finally:
+            record["duration_ms"] = round((time.perf_counter() - start) * 1000, 2)
+            _current_span.reset(token)
+
+    @staticmethod
+    def append_jsonl(path: str, trace: Trace):
+        with open(path, "a", encoding="utf-8") as fh:
+            fh.write(json.dumps(trace.to_dict()) + "\n")
+
+    @staticmethod
+    def find_jsonl(path: str, delivery_id: str):
+        """Return the last trace dict for ``delivery_id`` written to ``path``, or None."""
+        found = None
+        try:
+            with open(path, encoding="utf-8") as fh:
+                for line in fh:
+                    if delivery_id in line:
+                        try:
+                            data = json.loads(line)
+                        except ValueError:
+                            continue
+                        if data.get("delivery") == delivery_id:
+                            found = data
+        except OSError:
+            return None
+        return found
+
+
+tracer = Tracer()
+
+
+def new_delivery_id() -> str:
+    """An ID for a delivery that arrived without ``X-GitHub-Delivery``, so its trace and log lines stay apart."""
+    return f"local-{uuid.uuid4()}"
+
+
+def detached_task(coro):
+    """Start ``coro`` as a task outside the current delivery's trace.
+
+    Tasks copy the caller's context, so a timer armed while handling one delivery would otherwise
+    record spans into that delivery's (long finished) trace and tag its log lines with its ID.
+    """
+    return contextvars.Context().run(asyncio.create_task, coro)
+
+
+def traced(name: str = None):
+    """Decorator recording each call of an async function as a span of the current delivery."""
+    def decorator(func):
+        span_name = name or func.__name__
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            if _current_trace.get() is None:
+                return await func(*args, **kwargs)
+            async with tracer.span(span_name):
+                return await func(*args, **kwargs)
+
+        return wrapper
+    return decorator
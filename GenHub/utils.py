@@ -1,5 +1,37 @@
+import collections
 import discord
+import functools
+import hashlib
+import json
 import re
+from .log import log
+from .metrics import metrics
+from .tracing import traced
+
+try:
+    import orjson
+except ImportError:  # optional speedup; the stdlib decoder is the fallback
+    orjson = None
+
+# Leading `"action": "..."` of a webhook body; GitHub always serializes it as the first key
+_ACTION_SNIFF_RE = re.compile(rb'\A\s*\{\s*"action"\s*:\s*"([^"\\]{1,64})"')
+
+
+def decode_json(body: bytes):
+    """Decode a JSON document straight from bytes, with orjson when it is installed.
+
+    Raises ``json.JSONDecodeError`` (orjson's error subclasses it) on invalid input.
+    """
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body)
+
+
+def sniff_action(body: bytes):
+    """The payload's ``action`` read from the first bytes of ``body`` without decoding it, or None."""
+    match = _ACTION_SNIFF_RE.match(body, 0, 256)
+    return match.group(1).decode("utf-8", "replace") if match else None
+
 
 def clean_github_markdown(text: str, repo: str = None) -> str:
     """Clean and convert GitHub-specific HTML and markdown tags into clean Discord markdown."""
@@ -470,6 +502,136 @@ def summarize_bot_body(body: str, max_chars: int = 280) -> str:
     return summary if summary else (body[:max_chars].rstrip() + "...")
 
 
+# Render guards for very large bodies (bot walkthroughs with collapsed diffs run to 200 KB)
+MAX_RENDER_INPUT = 100_000       # characters of a body ever looked at
+STREAM_RENDER_THRESHOLD = 8_000  # longer bodies are rendered block by block
+RENDER_CHUNK_CHARS = 4_000       # input rendered per step when streaming
+MAX_BLOCK_CHARS = 12_000         # a single table/details/code block is cut to this before rendering
+RENDER_BUDGET_CHARS = 36_000     # input rendered per body before giving up on the rest (about 0.2 s worst case)
+EMBED_RENDER_LIMIT = 2048        # rendered characters an embed can use
+TRUNCATED_SUFFIX = "\n\n…"
+
+_FOOTER_START_RE = re.compile(
+    r"(?:\n\s*[-*_]{3,}\s*)?\n\s*(?:Thanks for using CodeRabbit|[^\w\s]?\s*Share\s*:|Share\s+on\s*:"
+    r"|💡\s*Tip of the day|✨\s*Generated by Qodo|🐰\s*CodeRabbit|Comment\s+`?@coderabbitai\s+help)",
+    re.IGNORECASE,
+)
+_BLOCK_TAG_RE = re.compile(r"<(/?)(?:table|details|picture|blockquote|pre)\b", re.IGNORECASE)
+
+
+def _split_blocks(text: str):
+    """Split at blank lines outside fenced code and open table/details/picture/blockquote/pre tags."""
+    blocks, current, depth, fence = [], [], 0, False
+    for line in text.split("\n"):
+        if line.lstrip().startswith("```"):
+            fence = not fence
+        elif not fence and "<" in line:
+            for closing in _BLOCK_TAG_RE.findall(line):
+                depth = max(0, depth - 1) if closing else depth + 1
+        current.append(line)
+        if not line.strip() and not fence and depth == 0:
+            blocks.append("\n".join(current))
+            current = []
+    if current:
+        blocks.append("\n".join(current))
+    return blocks
+
+
+def _render_streaming(text: str, repo: str = None, limit: int = None):
+    """Render ``text`` a few blocks at a time; returns ``(rendered, complete)``.
+
+    Stops once ``limit`` rendered characters exist or ``RENDER_BUDGET_CHARS`` of input has been
+    rendered. The ``re`` module cannot time out a single pattern, so blocks are capped at
+    ``MAX_BLOCK_CHARS`` to bound what any one pass can scan. Both bounds are sizes rather than
+    wall-clock time, so the same body always renders the same way (results are memoized).
+    """
+    # Bot footers and everything after them are dropped by the full pipeline anyway
+    footer = _FOOTER_START_RE.search(text)
+    if footer:
+        text = text[: footer.start()]
+    text = re.sub(r"<!--[\s\S]*?-->", "", text)
+
+    blocks = _split_blocks(text)
+    rendered, size, consumed, chunk, chunk_len = [], 0, 0, [], 0
+    complete = True
+    for index, block in enumerate(blocks):
+        if len(block) > MAX_BLOCK_CHARS:
+            block = block[:MAX_BLOCK_CHARS]
+            complete = False
+        chunk.append(block)
+        chunk_len += len(block)
+        last = index == len(blocks) - 1
+        if chunk_len < RENDER_CHUNK_CHARS and not last:
+            continue
+        part = clean_github_markdown("\n".join(chunk), repo=repo)
+        consumed += chunk_len
+        chunk, chunk_len = [], 0
+        if part:
+            rendered.append(part)
+            size += len(part) + 2
+        if not last and ((limit and size >= limit) or consumed >= RENDER_BUDGET_CHARS):
+            complete = False
+            break
+    return "\n\n".join(rendered), complete
+
+
+def _render_markdown(body: str, repo: str = None, limit: int = None) -> str:
+    """``clean_github_markdown`` with guards for huge bodies.
+
+    Bodies over ``STREAM_RENDER_THRESHOLD`` are rendered block by block, stopping after
+    ``limit`` output characters (when given) or ``RENDER_BUDGET_CHARS`` of input. Input beyond
+    ``MAX_RENDER_INPUT`` is never read. A result cut short ends with ``TRUNCATED_SUFFIX``.
+    """
+    if len(body) <= STREAM_RENDER_THRESHOLD:
+        return clean_github_markdown(body, repo=repo)
+    capped = len(body) > MAX_RENDER_INPUT
+    text, complete = _render_streaming(body[:MAX_RENDER_INPUT], repo, limit)
+    return text if complete and not capped else text + TRUNCATED_SUFFIX
+
+
+_RenderCacheInfo = collections.namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+
+class _RenderCache:
+    """LRU memo for ``_render_markdown`` keyed on a SHA-1 of the body.
+
+    ``functools.lru_cache`` would keep every cached body as part of its key, so the largest
+    comments seen by a long reconcile stayed pinned for the life of the process. Values are
+    already bounded by ``limit`` and ``RENDER_BUDGET_CHARS``. Exposes ``cache_info()`` and
+    ``__wrapped__`` like ``lru_cache``.
+    """
+
+    def __init__(self, func, maxsize: int):
+        self.__wrapped__ = func
+        self.maxsize = maxsize
+        self._entries = collections.OrderedDict()
+        self.hits = self.misses = 0
+
+    def __call__(self, body: str, repo: str = None, limit: int = None) -> str:
+        key = (hashlib.sha1(body.encode("utf-8", "surrogatepass")).digest(), repo, limit)
+        try:
+            value = self._entries[key]
+        except KeyError:
+            self.misses += 1
+            value = self._entries[key] = self.__wrapped__(body, repo, limit)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+            return value
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return value
+
+    def cache_info(self):
+        return _RenderCacheInfo(self.hits, self.misses, self.maxsize, len(self._entries))
+
+    def cache_clear(self):
+        self._entries.clear()
+        self.hits = self.misses = 0
+
+
+render_markdown = _RenderCache(_render_markdown, maxsize=256)
+
+
 def create_comment_embed(
     author: str,
     body: str,
@@ -483,7 +645,10 @@ def create_comment_embed(
 ) -> discord.Embed:
     """Create a sleek Discord Embed for a GitHub issue or review comment with timestamp."""
     import datetime
-    clean_body = clean_github_markdown(body, repo=repo)
+    clean_body = render_markdown(body or "", repo, EMBED_RENDER_LIMIT)
+    truncated = clean_body.endswith(TRUNCATED_SUFFIX)
+    if truncated:
+        clean_body = clean_body[: -len(TRUNCATED_SUFFIX)]
 
     if is_bot:
         clean_body = summarize_bot_body(clean_body, max_chars=280)
@@ -496,7 +661,7 @@ def create_comment_embed(
         else:
             footer_text = "🤖 Automated Bot Notice"
     else:
-        if len(clean_body) > 2040:
+        if truncated or len(clean_body) > 2040:
             clean_body = clean_body[:1950].rstrip() + f"\n\n... *([Read full comment on GitHub](<{url}>))*"
         color = 0x5865F2
         role_label = "Comment"
@@ -539,13 +704,16 @@ def create_review_link_view(url: str, count: int) -> discord.ui.View:
     return view
 
 
+@traced()
 async def send_message(channel, content: str = "", prefix: str = "", embed: discord.Embed = None, view: discord.ui.View = None):
     """Send a message or embed with optional interactive View, splitting long text into chunks if needed."""
+    metrics.inc("genhub_discord_sends_total")
     if embed:
         if view:
             await channel.send(embed=embed, view=view)
         else:
             await channel.send(embed=embed)
+        metrics.mark("discord_send")
         return
 
     limit = 2000
@@ -579,6 +747,7 @@ async def send_message(channel, content: str = "", prefix: str = "", embed: disc
                 )
         else:
             await channel.send(chunk, allowed_mentions=allowed_mentions, view=v)
+    metrics.mark("discord_send")
 
 
 def get_role_mention(guild, role_id: int):
@@ -640,10 +809,27 @@ def format_message(emoji, action, title, url, author, role_mention, extra="", nu
     return msg
 
 
+def format_duration(seconds: float) -> str:
+    """Render a duration as a compact ``1h 02m`` / ``3m 05s`` / ``12s`` string."""
+    seconds = max(0, int(seconds))
+    hours, rem = divmod(seconds, 3600)
+    minutes, secs = divmod(rem, 60)
+    if hours:
+        return f"{hours}h {minutes:02d}m"
+    if minutes:
+        return f"{minutes}m {secs:02d}s"
+    return f"{secs}s"
+
+
+PREVIEW_INPUT_CHARS = 8_000
+
+
 def format_comment_preview(body: str, max_len: int = 40) -> str:
     """Extract a clean, single-line snippet from a comment body with zero URLs or link embeds."""
     if not body:
         return ""
+    # Only the start of the body can end up in a short preview
+    body = body[:PREVIEW_INPUT_CHARS]
     # 1. Strip HTML comments <!-- ... -->
     text = re.sub(r"<!--[\s\S]*?-->", "", body)
     # 2. Strip images (markdown and HTML)
@@ -724,6 +910,7 @@ def format_log_line(
     return f"{emoji} **{action}:** `{repo_short}` {target_link}{thread_part}{extra_str}{actor_part}"
 
 
+@traced()
 async def find_comment_message(thread, comment_url: str, author_login: str = None):
     """Find an existing Discord message in a thread that corresponds to a GitHub comment URL or bot author."""
     if not thread or not hasattr(thread, "history"):
@@ -771,58 +958,66 @@ async def find_comment_message(thread, comment_url: str, author_login: str = Non
     return None
 
 
+@traced()
 async def get_or_create_tag(forum, name):
     """Find or create a tag by name (case-insensitive)."""
     for tag in forum.available_tags:
         if tag.name.lower() == name.lower():
+            metrics.inc("genhub_cache_requests_total", cache="tag", result="hit")
             return tag
+    metrics.inc("genhub_cache_requests_total", cache="tag", result="miss")
     try:
         return await forum.create_tag(name=name, moderated=False)
     except Exception as e:
-        print(f"⚠️ Failed to create tag '{name}' in {forum.name}: {e}")
+        log.warning("⚠️ Failed to create tag '%s' in %s: %s", name, forum.name, e)
         return None
 
 
-async def get_issue_tags(forum, issue):
-    tags = []
-    if not forum:
-        return tags
+def issue_tag_names(issue):
+    """Return the status tag names an issue should carry, without touching Discord."""
     state = issue.get("state", "open")
-    if str(state).lower() == "open":
-        tag = await get_or_create_tag(forum, "Open")
-    else:
-        tag = await get_or_create_tag(forum, "Closed")
-    if tag:
-        tags.append(tag)
+    names = ["Open" if str(state).lower() == "open" else "Closed"]
     if issue.get("assignees") or issue.get("assignee"):
-        active_tag = await get_or_create_tag(forum, "Active")
-        if active_tag:
-            tags.append(active_tag)
-    return tags
+        names.append("Active")
+    return names
 
 
-async def get_pr_tags(forum, pr):
-    tags = []
-    if not forum:
-        return tags
+def pr_tag_names(pr):
+    """Return the status tag names a pull request should carry, without touching Discord."""
     state = pr.get("state", "open")
     if str(state).lower() == "open":
-        tag = await get_or_create_tag(forum, "Open")
+        names = ["Open"]
     elif pr.get("merged") or pr.get("merged_at") or (
         "pull_request" in pr and pr["pull_request"].get("merged_at")
     ):
-        tag = await get_or_create_tag(forum, "Merged")
+        names = ["Merged"]
     else:
-        tag = await get_or_create_tag(forum, "Closed")
-    if tag:
-        tags.append(tag)
+        names = ["Closed"]
     if pr.get("assignees") or pr.get("assignee"):
-        active_tag = await get_or_create_tag(forum, "Active")
-        if active_tag:
-            tags.append(active_tag)
+        names.append("Active")
+    return names
+
+
+async def _resolve_tags(forum, names):
+    tags = []
+    if not forum:
+        return tags
+    for name in names:
+        tag = await get_or_create_tag(forum, name)
+        if tag:
+            tags.append(tag)
     return tags
 
 
+async def get_issue_tags(forum, issue):
+    return await _resolve_tags(forum, issue_tag_names(issue))
+
+
+async def get_pr_tags(forum, pr):
+    return await _resolve_tags(forum, pr_tag_names(pr))
+
+
+@traced()
 async def update_status_tag(thread, new_status_name):
     """Replace status tag while preserving repo tag."""
     forum = thread.parent
@@ -836,6 +1031,16 @@ async def update_status_tag(thread, new_status_name):
     await thread.edit(applied_tags=current_tags)
 
 
+def invalidate_thread(thread_cache, thread):
+    """Drop every cache entry pointing at ``thread`` (a Thread or a thread ID); returns how many were removed."""
+    thread_id = getattr(thread, "id", thread)
+    stale = [k for k, v in thread_cache.items() if v is thread or getattr(v, "id", v) == thread_id]
+    for k in stale:
+        del thread_cache[k]
+    return len(stale)
+
+
+@traced()
 async def find_thread(bot, forum_id, repo_full_name, topic_number, thread_cache):
     """Find an existing thread by repo + number."""
     # First check cache for a valid thread
@@ -847,6 +1052,22 @@ async def find_thread(bot, forum_id, repo_full_name, topic_number, thread_cache)
     for k in keys_to_try:
         if k in thread_cache:
             cached = thread_cache[k]
+            # Archive crawler entries hold a bare thread ID: resolve from the gateway cache, then REST
+            if isinstance(cached, int) and not isinstance(cached, bool):
+                thread = bot.get_channel(cached)
+                if thread is None and hasattr(bot, "fetch_channel"):
+                    try:
+                        thread = await bot.fetch_channel(cached)
+                    except (discord.NotFound, discord.Forbidden):
+                        del thread_cache[k]
+                        continue
+                    except Exception:
+                        continue
+                if thread is not None:
+                    thread_cache[k] = thread
+                    metrics.inc("genhub_cache_requests_total", cache="thread", result="hit")
+                    return thread
+                continue
             # If we stored a thread object, do a quick validation
             if hasattr(cached, "id"):
                 try:
@@ -855,13 +1076,15 @@ async def find_thread(bot, forum_id, repo_full_name, topic_number, thread_cache)
                         _ = cached.name  # This should fail if the thread is deleted
                         # Also check if the thread is accessible by trying to get its ID
                         _ = cached.id
+                    metrics.inc("genhub_cache_requests_total", cache="thread", result="hit")
                     return cached
                 except (AttributeError, discord.NotFound, discord.Forbidden):
                     # Thread is invalid/stale/deleted, remove from cache
-                    print(f"🗑️ Removing stale thread #{topic_number} from cache")
+                    log.info("🗑️ Removing stale thread #%s from cache", topic_number)
                     del thread_cache[k]
                     continue
 
+    metrics.inc("genhub_cache_requests_total", cache="thread", result="miss")
     forum = bot.get_channel(forum_id)
     if not forum and hasattr(bot, "fetch_channel"):
         try:
@@ -931,16 +1154,17 @@ async def find_thread(bot, forum_id, repo_full_name, topic_number, thread_cache)
     return None
 
 
+@traced()
 async def get_or_create_thread(
     bot, forum_id, repo_full_name, number, title, url, tags, thread_cache, initial_content=None
 ):
     # First try to find an existing thread
     existing = await find_thread(bot, forum_id, repo_full_name, number, thread_cache)
     if existing:
-        print(f"📝 Found existing thread #{number} for {repo_full_name}")
+        log.debug("📝 Found existing thread #%s for %s", number, repo_full_name)
         # Check if thread is archived - if so, recreate as active for reconcile
         if hasattr(existing, 'archived') and existing.archived:
-            print(f"ℹ️ Found archived thread #{number}, recreating as active")
+            log.info("ℹ️ Found archived thread #%s, recreating as active", number)
             # Remove from cache and treat as not found to force recreation
             keys_to_remove = [
                 (forum_id, repo_full_name, number),
@@ -951,7 +1175,7 @@ async def get_or_create_thread(
                 thread_cache.pop(key, None)
             existing = None  # Force recreation
         else:
-            # Validate thread is still accessible with more robust checks
+            # Validate from gateway state only (cheap attribute checks, no API call)
             try:
                 _ = existing.id
 
@@ -961,20 +1185,17 @@ async def get_or_create_thread(
                 if hasattr(existing, 'name'):
                     _ = existing.name
 
-                try:
-                    async for message in existing.history(limit=1):
-                        break
-                except (discord.NotFound, discord.Forbidden):
-                    raise discord.NotFound("Thread history inaccessible")
+                # No REST probe here: deleted threads are evicted by the on_raw_thread_delete listener,
+                # and callers retry once on NotFound when sending.
 
                 # Update name if it doesn't match expected (capped to 100 chars)
                 expected_name = f"[GH] [#{number}] {title}"[:100]
                 if hasattr(existing, 'name') and existing.name != expected_name:
                     try:
                         await existing.edit(name=expected_name)
-                        print(f"📝 Updated thread name for #{number}")
+                        log.info("📝 Updated thread name for #%s", number)
                     except (discord.Forbidden, discord.NotFound):
-                        print(f"⚠️ Could not update thread name for #{number}, recreating")
+                        log.warning("⚠️ Could not update thread name for #%s, recreating", number)
                         keys_to_remove = [
                             (forum_id, repo_full_name, number),
                             (str(forum_id), repo_full_name, number),
@@ -984,7 +1205,7 @@ async def get_or_create_thread(
                             thread_cache.pop(key, None)
                         existing = None
             except (discord.NotFound, discord.Forbidden) as e:
-                print(f"⚠️ Thread #{number} appears to be deleted or inaccessible ({type(e).__name__}), recreating")
+                log.warning("⚠️ Thread #%s appears to be deleted or inaccessible (%s), recreating", number, type(e).__name__)
                 keys_to_remove = [
                     (forum_id, repo_full_name, number),
                     (str(forum_id), repo_full_name, number),
@@ -995,7 +1216,7 @@ async def get_or_create_thread(
                 existing = None
             except AttributeError as e:
                 if "discord" in str(type(existing)).lower():
-                    print(f"⚠️ Thread #{number} appears to be invalid ({type(e).__name__}), recreating")
+                    log.warning("⚠️ Thread #%s appears to be invalid (%s), recreating", number, type(e).__name__)
                     keys_to_remove = [
                         (forum_id, repo_full_name, number),
                         (str(forum_id), repo_full_name, number),
@@ -1016,13 +1237,13 @@ async def get_or_create_thread(
             pass
 
     if not forum:
-        print(f"⚠️ Could not find forum {forum_id}")
+        log.warning("⚠️ Could not find forum %s", forum_id)
         return None, False
 
     # Create thread name with repository, capped strictly to Discord's 100 character maximum
     thread_name = f"[GH] [#{number}] {title}"[:100]
 
-    print(f"🔄 Creating new thread for {repo_full_name}#{number}")
+    log.info("🔄 Creating new thread for %s#%s", repo_full_name, number)
     try:
         content = initial_content if initial_content else f"🆕 Issue created: [{title}]({url})\n👤 By: Unknown"
 
@@ -1031,12 +1252,13 @@ async def get_or_create_thread(
             content=content,
             applied_tags=tags,
         )
-        print(f"✅ Created new thread for {repo_full_name}#{number}")
+        metrics.mark("discord_send")
+        log.info("✅ Created new thread for %s#%s", repo_full_name, number)
     except discord.Forbidden:
-        print(f"⚠️ Missing permissions to create thread in {forum.name}")
+        log.warning("⚠️ Missing permissions to create thread in %s", forum.name)
         return None, False
     except Exception as e:
-        print(f"⚠️ Failed to create thread for {repo_full_name}#{number}: {e}")
+        log.warning("⚠️ Failed to create thread for %s#%s: %s", repo_full_name, number, e)
         return None, False
 
     thread = getattr(thread_with_msg, "thread", thread_with_msg)
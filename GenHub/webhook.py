@@ -1,7 +1,44 @@
+import asyncio
+import collections
 import hmac
+import inspect
 import json
+import time
 from hashlib import sha256
-from aiohttp import web
+from aiohttp import StreamReader, web
+from .metrics import metrics, install_discord_rate_limit_counter, uninstall_discord_rate_limit_counter
+from .coalesce import EventCoalescer
+from .log import log
+from .offload import PayloadOffloader
+from .routing import RouteTable
+from .tracing import detached_task, new_delivery_id, tracer
+from .handlers import HANDLED_EVENTS, resolve_event_filter
+from .utils import decode_json, render_markdown, sniff_action
+
+# GitHub caps webhook payloads at 25 MB
+DEFAULT_MAX_BODY_KB = 25 * 1024
+READ_CHUNK_BYTES = 64 * 1024
+# Longest a delivery waits for startup cache warmup before being handled against cold caches
+WARMUP_WAIT_SECONDS = 30
+
+
+# Actions GitHub sends for issues and pull requests, whose handlers take every action
+ITEM_ACTIONS = frozenset({
+    "opened", "edited", "deleted", "closed", "reopened", "assigned", "unassigned", "labeled",
+    "unlabeled", "locked", "unlocked", "transferred", "pinned", "unpinned", "milestoned",
+    "demilestoned", "synchronize", "converted_to_draft", "ready_for_review", "review_requested",
+    "review_request_removed", "auto_merge_enabled", "auto_merge_disabled", "enqueued", "dequeued",
+})
+
+
+def _known_labels(event_type: str, action: str):
+    """Event/action as metric labels: names GenHub handles, anything else (even unverified input) as ``other``."""
+    if event_type not in HANDLED_EVENTS:
+        return "other", "other" if action else ""
+    actions = HANDLED_EVENTS[event_type]
+    if action and action not in (ITEM_ACTIONS if actions is None else actions):
+        action = "other"
+    return event_type, action
 
 
 class WebhookServer:
@@ -9,6 +46,14 @@ class WebhookServer:
         self.cog = cog
         self.runner = None
         self.server = None
+        self._key = None
+        # Deliveries acknowledged without processing, keyed "event" or "event.action"
+        self.skipped = collections.Counter()
+        # Request tasks currently handling a delivery; ``drain`` waits for them at unload
+        self.accepting = True
+        self._in_flight = set()
+        # Slow-trace reports run after the ack; references kept until they finish
+        self._reports = set()
 
     async def start(self):
         host = await self.cog.config.webhook_host()
@@ -17,7 +62,9 @@ class WebhookServer:
             return web.Response(text="GenHub Webhook Server OK")
 
         async def handle_health(request: web.Request):
-            return web.Response(text="OK")
+            return web.Response(text="warming" if self.warming else "OK")
+
+        install_discord_rate_limit_counter()
 
         app = web.Application()
         app.router.add_post("/github", self.webhook_handler)
@@ -25,6 +72,9 @@ class WebhookServer:
         app.router.add_post("/", self.webhook_handler)
         app.router.add_get("/", handle_root)
         app.router.add_get("/health", handle_health)
+        app.router.add_get("/ready", self.handle_ready)
+        app.router.add_get("/health/detail", self.handle_health_detail)
+        app.router.add_get("/metrics", self.handle_metrics)
         app.router.add_get("/webhook", handle_root)
         app.router.add_get("/github", handle_root)
         self.runner = web.AppRunner(app)
@@ -32,14 +82,149 @@ class WebhookServer:
         self.server = web.TCPSite(self.runner, host, port)
         try:
             await self.server.start()
-            print(f"Webhook server started on {host}:{port}")
+            log.info("Webhook server started on %s:%s", host, port)
         except Exception as e:
-            print(f"Failed to start webhook server: {e}")
+            log.error("Failed to start webhook server: %s", e)
 
     async def stop(self):
+        uninstall_discord_rate_limit_counter()
         if self.runner:
             await self.runner.cleanup()
 
+    @property
+    def warming(self) -> bool:
+        """True while the cog's startup warmup is still loading caches."""
+        warm = getattr(self.cog, "warm", None)
+        return isinstance(warm, asyncio.Event) and not warm.is_set()
+
+    def stop_accepting(self):
+        """Answer new deliveries with 503 (GitHub marks them failed, so they can be redelivered)."""
+        self.accepting = False
+
+    async def drain(self, timeout: float) -> int:
+        """Wait up to ``timeout`` seconds for in-flight deliveries; returns how many are still running."""
+        pending = {t for t in self._in_flight if not t.done()}
+        if pending and timeout > 0:
+            _, pending = await asyncio.wait(pending, timeout=timeout)
+        return len(pending)
+
+    def _scrape_samples(self):
+        """Gauges and cache counters read from live cog state at scrape time."""
+        gauges, counters = [], []
+        handlers = getattr(self.cog, "handlers", None)
+        limiter = getattr(handlers, "rate_limiter", None)
+        if isinstance(getattr(limiter, "remaining", None), int):
+            gauges.append(("genhub_github_ratelimit_remaining", {}, limiter.remaining))
+        for queue, attr in (("pending_reviews", "pending_reviews"), ("flushing_reviews", "_flushing_reviews")):
+            pending = getattr(handlers, attr, None)
+            if isinstance(pending, dict):
+                gauges.append(("genhub_queue_depth", {"queue": queue}, len(pending)))
+        coalescer = getattr(handlers, "coalescer", None)
+        if isinstance(coalescer, EventCoalescer):
+            gauges.append(("genhub_queue_depth", {"queue": "coalescing"}, len(coalescer.pending)))
+
+        info = render_markdown.cache_info()
+        counters.append(("genhub_cache_requests_total", {"cache": "render", "result": "hit"}, info.hits))
+        counters.append(("genhub_cache_requests_total", {"cache": "render", "result": "miss"}, info.misses))
+        for cache in ("thread", "tag", "render"):
+            if cache == "render":
+                hits, misses = info.hits, info.misses
+            else:
+                hits = metrics.value("genhub_cache_requests_total", cache=cache, result="hit")
+                misses = metrics.value("genhub_cache_requests_total", cache=cache, result="miss")
+            if hits + misses:
+                gauges.append(("genhub_cache_hit_ratio", {"cache": cache}, round(hits / (hits + misses), 4)))
+        return gauges, counters
+
+    async def handle_metrics(self, request: web.Request):
+        gauges, counters = self._scrape_samples()
+        return web.Response(
+            text=metrics.render(gauges=gauges, counters=counters),
+            content_type="text/plain",
+            charset="utf-8",
+            headers={"X-Content-Type-Options": "nosniff"},
+        )
+
+    async def health_detail(self):
+        """Component health for ``/ready`` and ``/health/detail``, read from in-memory state only."""
+        handlers = getattr(self.cog, "handlers", None)
+        bot = getattr(self.cog, "bot", None)
+        reasons = []
+
+        connected = _flag(bot, "is_ready")
+        if _flag(bot, "is_closed"):
+            connected = False
+        latency = getattr(bot, "latency", None)
+        latency_ms = round(latency * 1000, 1) if isinstance(latency, float) and latency == latency else None
+        if connected is False:
+            reasons.append("discord gateway disconnected")
+
+        forums = {}
+        for key in ("issues_forum_id", "prs_forum_id"):
+            forum_id = await self._config_value(key, 0)
+            if forum_id:
+                found = hasattr(bot, "get_channel") and bot.get_channel(forum_id) is not None
+                forums[key] = {"id": forum_id, "found": found}
+                if not found:
+                    reasons.append(f"{key} {forum_id} not found")
+
+        limiter = getattr(handlers, "rate_limiter", None)
+        github_ok, auth_failed = metrics.last("github_ok"), metrics.last("github_auth_failure")
+        auth_failing = auth_failed is not None and (github_ok is None or auth_failed > github_ok)
+        if auth_failing:
+            reasons.append("github auth failing")
+
+        queues = {"in_flight_deliveries": sum(1 for t in self._in_flight if not t.done())}
+        for queue, attr in (("pending_reviews", "pending_reviews"), ("flushing_reviews", "_flushing_reviews")):
+            pending = getattr(handlers, attr, None)
+            if isinstance(pending, dict):
+                queues[queue] = len(pending)
+        coalescer = getattr(handlers, "coalescer", None)
+        if isinstance(coalescer, EventCoalescer):
+            queues["coalescing"] = len(coalescer.pending)
+        consumer = getattr(self.cog, "spool_consumer", None)
+        if getattr(consumer, "spool", None) is not None:
+            queues["spool"] = {"offset": consumer.offset, "last_consumed_at": consumer.last_consumed_at, "failed": consumer.failed}
+
+        if self.warming:
+            reasons.insert(0, "warming")
+        if not self.accepting:
+            reasons.insert(0, "draining")
+        return {
+            "status": "ready" if not reasons else ("warming" if reasons == ["warming"] else "not_ready"),
+            "reasons": reasons,
+            "discord": {"connected": connected, "latency_ms": latency_ms, "last_send_at": metrics.last("discord_send")},
+            "forums": forums,
+            "github": {
+                "ratelimit_remaining": getattr(limiter, "remaining", None) if isinstance(getattr(limiter, "remaining", None), int) else None,
+                "ratelimit_reset_at": getattr(limiter, "reset_time", None) if isinstance(getattr(limiter, "reset_time", None), int) else None,
+                "last_ok_at": github_ok,
+                "auth_failing": auth_failing,
+            },
+            "queues": queues,
+            "caches": {"warm": not self.warming, "threads": len(getattr(self.cog, "thread_cache", None) or {})},
+        }
+
+    async def handle_ready(self, request: web.Request):
+        detail = await self.health_detail()
+        if detail["reasons"]:
+            return web.Response(status=503, text="not ready: " + ", ".join(detail["reasons"]))
+        return web.Response(text="ready")
+
+    async def handle_health_detail(self, request: web.Request):
+        detail = await self.health_detail()
+        return web.json_response(detail, status=503 if detail["reasons"] else 200)
+
+    async def _safe_log_info(self, msg: str):
+        import asyncio
+        if hasattr(self.cog, "handlers") and hasattr(self.cog.handlers, "log_info"):
+            try:
+                res = self.cog.handlers.log_info(msg)
+                if asyncio.iscoroutine(res):
+                    await res
+            except Exception:
+                pass
+
     async def _safe_log_error(self, msg: str):
         import asyncio
         if hasattr(self.cog, "handlers") and hasattr(self.cog.handlers, "log_error"):
@@ -52,42 +237,229 @@ class WebhookServer:
 
     async def webhook_handler(self, request: web.Request):
         event_type = request.headers.get("X-GitHub-Event", "unknown")
-        delivery_id = request.headers.get("X-GitHub-Delivery", "N/A")
+        delivery_id = request.headers.get("X-GitHub-Delivery") or new_delivery_id()
+        if not self.accepting:
+            log.info("⏸️ Refusing %s delivery %s while shutting down", event_type, delivery_id)
+            return web.Response(status=503, text="Shutting down")
+        task = asyncio.current_task()
+        self._in_flight.add(task)
+        try:
+            return await self._traced_delivery(delivery_id, event_type, self._handle_delivery(request, event_type, delivery_id))
+        finally:
+            self._in_flight.discard(task)
+
+    async def replay_delivery(self, event_type: str, delivery_id: str, body: bytes):
+        """Dispatch a delivery that was verified elsewhere (the spool consumer); returns the response."""
+        delivery_id = delivery_id or new_delivery_id()
+        request = SpooledRequest(event_type, delivery_id)
+        return await self._traced_delivery(delivery_id, event_type, self._decode_and_dispatch(request, event_type, body))
+
+    async def _traced_delivery(self, delivery_id, event_type, work):
+        with tracer.trace(delivery_id, event_type) as trace:
+            response, action = await work
+            if action:
+                trace.name = f"{event_type}.{action}"
+        event, action = _known_labels(event_type, action)
+        metrics.inc("genhub_webhook_deliveries_total", event=event, action=action, status=response.status)
+        # Posting the report can wait on Discord rate limits; GitHub's ack must not
+        report = detached_task(self._report_slow_trace(trace))
+        self._reports.add(report)
+        report.add_done_callback(self._reports.discard)
+        return response
+
+    async def _config_value(self, key, default):
+        attr = getattr(self.cog.config, key, None)
+        if attr is None:
+            return default
+        try:
+            val = attr()
+            if inspect.isawaitable(val):
+                val = await val
+        except Exception:
+            return default
+        return val if isinstance(val, type(default)) and not isinstance(val, bool) else default
+
+    async def _report_slow_trace(self, trace):
+        """Dump the span tree of deliveries slower than ``trace_slow_ms`` to a JSONL file or the log channel."""
+        threshold = await self._config_value("trace_slow_ms", 2000)
+        if threshold <= 0 or (trace.duration or 0) < threshold:
+            return
+        path = await self._config_value("trace_jsonl_path", "")
+        try:
+            if path:
+                await asyncio.to_thread(tracer.append_jsonl, path, trace)
+            else:
+                await self._safe_log_info(f"🐢 **Slow delivery** `{trace.name}` took {trace.duration:.0f} ms\n```\n{trace.render(1700)}\n```")
+        except Exception as e:
+            log.warning("⚠️ Failed to record slow trace %s: %s", trace.delivery_id, e)
+
+    async def _secret_key(self) -> bytes:
+        """The webhook secret, encoded once and kept until ``set_secret`` replaces it."""
+        if self._key is None:
+            secret = await self.cog.config.github_secret()
+            self._key = secret.encode() if secret else b""
+        return self._key
+
+    def set_secret(self, secret: str):
+        self._key = secret.encode() if secret else b""
+
+    async def _read_body(self, request: web.Request, keys, max_bytes: int):
+        """Read the body in chunks, HMAC-ing it with every key in ``keys`` as it arrives.
+
+        Returns ``(body, hexdigests)`` with one digest per key, or ``(None, None)`` as soon as
+        the declared or received size passes ``max_bytes``.
+        """
+        macs = [hmac.new(key, digestmod=sha256) for key in keys]
+        content = getattr(request, "content", None)
+        if isinstance(content, StreamReader):
+            if (request.content_length or 0) > max_bytes:
+                return None, None
+            chunks, size = [], 0
+            async for chunk in content.iter_chunked(READ_CHUNK_BYTES):
+                size += len(chunk)
+                if size > max_bytes:
+                    return None, None
+                for mac in macs:
+                    mac.update(chunk)
+                chunks.append(chunk)
+            body = b"".join(chunks)
+        else:
+            # Requests without a live stream (replays, tests) hand over the whole body
+            body = await request.read()
+            if len(body) > max_bytes:
+                return None, None
+            for mac in macs:
+                mac.update(body)
+        return body, [mac.hexdigest() for mac in macs]
+
+    async def _reject_signature(self, reason: str, msg: str):
+        log.warning(msg)
+        await self._safe_log_error(msg)
+        metrics.inc("genhub_webhook_signature_failures_total", reason=reason)
+        return web.Response(status=401, text="Missing signature" if reason == "missing" else "Invalid signature"), ""
+
+    def _skip(self, event_type: str, action: str, delivery_id: str):
+        # Runs before verification: only bounded names may become Counter keys or metric series
+        event, known_action = _known_labels(event_type, action)
+        key = f"{event}.{known_action}" if known_action else event
+        self.skipped[key] += 1
+        metrics.inc("genhub_webhook_skipped_total", event=event, action=known_action)
+        log.debug("⏭️ [Webhook] Skipped %s (Delivery: %s)", f"{event_type}.{action}" if action else event_type, delivery_id)
+        return web.Response(status=204)
+
+    async def _handle_delivery(self, request: web.Request, event_type: str, delivery_id: str):
+        """Verify, parse and dispatch one delivery; returns ``(response, action)``."""
         client_ip = getattr(request, "remote", "Unknown IP")
-        print(f"📥 [Webhook] Received HTTP POST {getattr(request, 'path', '/')} | Event: {event_type} | Delivery: {delivery_id} | Client: {client_ip}")
-
-        secret = await self.cog.config.github_secret()
-        body = await request.read()
-
-        if secret:
-            signature = request.headers.get("X-Hub-Signature-256")
-            if not signature:
-                msg = f"⚠️ [Webhook] 401 Unauthorized: Missing X-Hub-Signature-256 header (Delivery: {delivery_id})"
-                print(msg)
-                await self._safe_log_error(msg)
-                return web.Response(status=401, text="Missing signature")
-
-            digest = hmac.new(secret.encode(), body, sha256).hexdigest()
-            if not hmac.compare_digest(f"sha256={digest}", signature):
-                msg = f"⚠️ [Webhook] 401 Unauthorized: Invalid HMAC signature for delivery {delivery_id}. Check that !genhub secret matches GitHub webhook secret."
-                print(msg)
-                await self._safe_log_error(msg)
-                return web.Response(status=401, text="Invalid signature")
+        log.debug("📥 [Webhook] Received HTTP POST %s | Event: %s | Delivery: %s | Client: %s", getattr(request, 'path', '/'), event_type, delivery_id, client_ip)
 
+        # Events nothing handles (or the allowlist excludes) are acknowledged from the headers
+        # alone; ignored actions after reading only the body's leading "action" key. Neither
+        # is verified: dropping a delivery does nothing an attacker could use.
+        allowlist = await self._config_value("event_allowlist", [])
+        event_filter = resolve_event_filter(tuple(str(entry) for entry in allowlist))
+        if "X-GitHub-Event" in request.headers and event_type not in event_filter:
+            return self._skip(event_type, "", delivery_id), ""
+
+        # The global secret plus each route profile's: the repo (and so the secret it must be
+        # signed with) is only known after decoding, so the body is hashed with all of them
+        key = await self._secret_key()
+        routes = getattr(self.cog, "routes", None)
+        routes = routes if isinstance(routes, RouteTable) else None
+        keys = tuple(dict.fromkeys(k for k in (key, *(routes.secret_keys if routes else ())) if k))
+        signature = request.headers.get("X-Hub-Signature-256")
+        if key and not signature:
+            return await self._reject_signature("missing", f"⚠️ [Webhook] 401 Unauthorized: Missing X-Hub-Signature-256 header (Delivery: {delivery_id})")
+
+        max_kb = await self._config_value("webhook_max_body_kb", DEFAULT_MAX_BODY_KB)
+        body, digests = await self._read_body(request, keys, max_kb * 1024)
+        if body is None:
+            msg = f"⚠️ [Webhook] 413 Payload Too Large: body exceeds {max_kb} KB (Delivery: {delivery_id})"
+            log.warning(msg)
+            await self._safe_log_error(msg)
+            return web.Response(status=413, text="Payload too large"), ""
+
+        actions = event_filter.get(event_type)
+        if actions is not None:
+            action = sniff_action(body)
+            if action is not None and action not in actions:
+                return self._skip(event_type, action, delivery_id), action
+
+        matched = {k for k, digest in zip(keys, digests) if signature and hmac.compare_digest(f"sha256={digest}", signature)}
+        if signature and keys and not matched:
+            return await self._reject_signature("invalid", f"⚠️ [Webhook] 401 Unauthorized: Invalid HMAC signature for delivery {delivery_id}. Check that !genhub secret matches GitHub webhook secret.")
+
+        data, error = await self._decode(body)
+        if error:
+            return error, ""
+
+        if routes and routes.secret_keys:
+            repo = (data.get("repository") or {}).get("full_name") if isinstance(data, dict) else None
+            required = routes.secret_for(repo) or key
+            if required and required not in matched:
+                return await self._reject_signature("route", f"⚠️ [Webhook] 401 Unauthorized: delivery {delivery_id} for {repo} is not signed with its route's secret (`!genhub route`).")
+
+        return await self._dispatch(request, event_type, data, body)
+
+    async def _decode(self, body: bytes):
+        """Decode a JSON body (in the offload pool when large); returns ``(data, None)`` or ``(None, 400 response)``."""
         try:
-            data = json.loads(body.decode("utf-8"))
-        except json.JSONDecodeError as e:
+            offloader = getattr(self.cog, "offloader", None)
+            if isinstance(offloader, PayloadOffloader) and offloader.should_offload(len(body)):
+                async with tracer.span("decode", bytes=len(body)):
+                    return await offloader.parse(body), None
+            return decode_json(body), None
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
             msg = f"⚠️ [Webhook] 400 Bad Request: Failed to parse JSON payload ({e})"
-            print(msg)
+            log.warning(msg)
             await self._safe_log_error(msg)
-            return web.Response(status=400, text="Invalid JSON")
+            return None, web.Response(status=400, text="Invalid JSON")
+
+    async def _decode_and_dispatch(self, request, event_type: str, body: bytes):
+        data, error = await self._decode(body)
+        if error:
+            return error, ""
+        return await self._dispatch(request, event_type, data, body)
 
+    async def _dispatch(self, request, event_type: str, data, body: bytes):
+        """Hand a verified, decoded delivery to the handlers; returns ``(response, action)``."""
+        action = data.get("action", "") if isinstance(data, dict) else ""
+        if self.warming:
+            # Handling before the thread cache is loaded would open duplicate threads
+            try:
+                await asyncio.wait_for(self.cog.warm.wait(), WARMUP_WAIT_SECONDS)
+            except asyncio.TimeoutError:
+                log.warning("⚠️ Cache warmup still running after %ss, handling %s anyway", WARMUP_WAIT_SECONDS, event_type)
+        started = time.perf_counter()
         try:
             await self.cog.handlers.process_payload(request, data)
         except Exception as e:
             await self._safe_log_error(
                 f"Error processing {event_type} payload: {e}\nPayload: {data}"
             )
-            return web.Response(status=500, text="Internal Server Error")
+            return web.Response(status=500, text="Internal Server Error"), action
+        finally:
+            metrics.observe("genhub_handler_latency_seconds", time.perf_counter() - started, event=event_type)
+
+        return web.Response(status=200), action
+
+
+def _flag(obj, method):
+    """Result of a bool-returning state method such as ``bot.is_ready()``, or None when it isn't one."""
+    fn = getattr(obj, method, None)
+    if not callable(fn) or inspect.iscoroutinefunction(fn):
+        return None
+    try:
+        val = fn()
+    except Exception:
+        return None
+    return val if isinstance(val, bool) else None
+
+
+class SpooledRequest:
+    """The parts of an aiohttp request the handlers read, for deliveries replayed from the spool."""
+
+    path = "/spool"
+    remote = "spool"
 
-        return web.Response(status=200)
+    def __init__(self, event_type: str, delivery_id: str):
+        self.headers = {"X-GitHub-Event": event_type, "X-GitHub-Delivery": delivery_id}
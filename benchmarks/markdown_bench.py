@@ -0,0 +1,189 @@
+"""Micro-benchmark for GenHub's markdown cleanup paths over a checked-in corpus of real-world bodies.
+
+Times ``clean_github_markdown`` (full and as rendered for embeds), ``summarize_bot_body`` and
+``format_comment_preview`` on every file in ``benchmarks/corpus`` and reports µs/op (best of
+several repeats) and the peak memory allocated by one call (tracemalloc).
+
+Usage::
+
+    python benchmarks/markdown_bench.py                               # print the table
+    python benchmarks/markdown_bench.py --save baseline.json          # record a baseline
+    python benchmarks/markdown_bench.py --compare baseline.json       # exit 1 if a function's corpus total slows >15%
+    python benchmarks/markdown_bench.py --compare baseline.json --threshold 25 -f clean_github_markdown
+"""
+import argparse
+import importlib
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+if "redbot" not in sys.modules:
+    # Importing GenHub pulls in the cog, which needs Red; reuse the test stubs
+    importlib.import_module("tests.conftest")
+
+from GenHub.utils import (  # noqa: E402
+    EMBED_RENDER_LIMIT,
+    clean_github_markdown,
+    format_comment_preview,
+    render_markdown,
+    summarize_bot_body,
+)
+
+CORPUS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "corpus")
+REPO = "acme/widgets"
+
+FUNCTIONS = {
+    "clean_github_markdown": lambda body: clean_github_markdown(body, repo=REPO),
+    # What create_comment_embed pays per uncached body: guarded, truncate-first render
+    "render_markdown_embed": lambda body: render_markdown.__wrapped__(body, REPO, EMBED_RENDER_LIMIT),
+    "summarize_bot_body": summarize_bot_body,
+    "format_comment_preview": format_comment_preview,
+}
+
+
+def load_corpus():
+    corpus = {}
+    for name in sorted(os.listdir(CORPUS_DIR)):
+        if name.endswith(".md"):
+            with open(os.path.join(CORPUS_DIR, name), encoding="utf-8") as fh:
+                corpus[name[:-3]] = fh.read()
+    return corpus
+
+
+def time_per_op(func, body, min_time: float = 0.05, repeats: int = 5):
+    """Best-of-``repeats`` seconds per call, each repeat running for at least ``min_time``."""
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            func(body)
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+        number *= 2 if elapsed == 0 else max(2, int(min_time / elapsed) + 1)
+    best = elapsed / number
+    for _ in range(repeats - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            func(body)
+        best = min(best, (time.perf_counter() - start) / number)
+    return best
+
+
+def peak_allocation(func, body):
+    """Peak bytes allocated while running ``func(body)`` once."""
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        before, _ = tracemalloc.get_traced_memory()
+        func(body)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return max(0, peak - before)
+
+
+def run(functions=None, cases=None, min_time: float = 0.05, repeats: int = 5):
+    """Return ``{function: {case: {"us_per_op", "peak_kib", "bytes"}}}``."""
+    corpus = load_corpus()
+    results = {}
+    for fname, func in FUNCTIONS.items():
+        if functions and fname not in functions:
+            continue
+        rows = results[fname] = {}
+        for case, body in corpus.items():
+            if cases and case not in cases:
+                continue
+            func(body)  # warm regex caches
+            rows[case] = {
+                "us_per_op": round(time_per_op(func, body, min_time, repeats) * 1e6, 2),
+                "peak_kib": round(peak_allocation(func, body) / 1024, 1),
+                "bytes": len(body.encode("utf-8")),
+            }
+    return results
+
+
+def compare(baseline, current, threshold: float, per_case: bool = False):
+    """Return ``(lines, regressions)`` comparing µs/op against ``baseline``; threshold is in percent.
+
+    Per-function totals over the corpus gate by default (single cases are noisy on shared
+    machines); with ``per_case`` every corpus file must stay within the threshold too.
+    """
+    lines, regressions = [], []
+
+    def check(fname, case, old, new, gate):
+        if not old:
+            lines.append(f"{fname:<24}{case:<28}{'new':>12}{new:>12.2f}")
+            return
+        change = (new - old) / old * 100
+        flag = ""
+        if gate and change > threshold:
+            flag = "  ❌ REGRESSION"
+            regressions.append((fname, case, change))
+        lines.append(f"{fname:<24}{case:<28}{old:>12.2f}{new:>12.2f}{change:>+9.1f}%{flag}")
+
+    for fname, rows in current.items():
+        old_rows = baseline.get(fname, {})
+        for case, row in rows.items():
+            check(fname, case, old_rows.get(case, {}).get("us_per_op"), row["us_per_op"], per_case)
+        shared = [case for case in rows if old_rows.get(case, {}).get("us_per_op")]
+        if shared:
+            check(
+                fname, "TOTAL",
+                sum(old_rows[case]["us_per_op"] for case in shared),
+                sum(rows[case]["us_per_op"] for case in shared),
+                True,
+            )
+    return lines, regressions
+
+
+def format_table(results):
+    lines = [f"{'function':<24}{'case':<28}{'bytes':>9}{'µs/op':>12}{'peak KiB':>10}"]
+    for fname, rows in results.items():
+        for case, row in rows.items():
+            lines.append(f"{fname:<24}{case:<28}{row['bytes']:>9}{row['us_per_op']:>12.2f}{row['peak_kib']:>10.1f}")
+        lines.append(f"{fname:<24}{'TOTAL':<28}{'':>9}{sum(r['us_per_op'] for r in rows.values()):>12.2f}")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("-f", "--function", action="append", choices=sorted(FUNCTIONS), help="only benchmark this function (repeatable)")
+    parser.add_argument("-c", "--case", action="append", help="only benchmark this corpus file, without .md (repeatable)")
+    parser.add_argument("--min-time", type=float, default=0.05, help="minimum seconds per timing repeat (default 0.05)")
+    parser.add_argument("--repeats", type=int, default=5, help="timing repeats; the best one is reported (default 5)")
+    parser.add_argument("--save", metavar="FILE", help="write the results as JSON")
+    parser.add_argument("--compare", metavar="FILE", help="compare against a saved baseline and fail on regressions")
+    parser.add_argument("--threshold", type=float, default=15.0, help="allowed slowdown in percent for --compare (default 15)")
+    parser.add_argument("--per-case", action="store_true", help="with --compare, also fail when a single corpus file regresses")
+    args = parser.parse_args(argv)
+
+    results = run(args.function, args.case, args.min_time, args.repeats)
+    print(format_table(results))
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as fh:
+            json.dump(results, fh, indent=2, sort_keys=True)
+        print(f"\nSaved results to {args.save}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as fh:
+            baseline = json.load(fh)
+        lines, regressions = compare(baseline, results, args.threshold, args.per_case)
+        print(f"\n{'function':<24}{'case':<28}{'baseline':>12}{'current':>12}{'change':>10}")
+        print("\n".join(lines))
+        if regressions:
+            print(f"\n❌ {len(regressions)} benchmark(s) slower than the baseline by more than {args.threshold:g}%")
+            return 1
+        print(f"\n✅ No regressions beyond {args.threshold:g}%")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,219 @@
+"""Replay recorded GitHub webhook deliveries against ``WebhookServer`` with a fake Discord backend.
+
+Deliveries are signed and POSTed over real HTTP at a fixed (open-loop) rate, so slow handling
+shows up as queueing rather than a slower sender. Discord is replaced by ``tests/fake_discord.py``,
+which adds per-call latency and per-route rate limits. Reported per event type:
+
+* acknowledgement latency (request sent -> HTTP response) p50/p99
+* end-to-end latency (request sent -> last Discord write attributed to the delivery) p50/p99
+* Discord API calls per delivery, plus totals per route and simulated 429s
+
+Usage::
+
+    python benchmarks/webhook_load.py                                 # every scenario in payloads/
+    python benchmarks/webhook_load.py review_storm --rate 100 --latency 80
+    python benchmarks/webhook_load.py recorded.jsonl --no-rate-limits --json
+
+Scenario files are JSONL, one ``{"event": "<X-GitHub-Event>", "payload": {...}}`` per line.
+"""
+import argparse
+import asyncio
+import collections
+import hashlib
+import hmac
+import json
+import logging
+import math
+import os
+import socket
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+import aiohttp  # noqa: E402
+
+from tests.fake_discord import FakeDiscord, make_cog  # noqa: E402
+from GenHub import handlers as handlers_module  # noqa: E402
+from GenHub.webhook import WebhookServer  # noqa: E402
+
+PAYLOAD_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "payloads")
+SECRET = "bench-secret"
+
+
+def load_scenario(name_or_path: str):
+    path = name_or_path if os.path.exists(name_or_path) else os.path.join(PAYLOAD_DIR, f"{name_or_path}.jsonl")
+    with open(path, encoding="utf-8") as fh:
+        return [json.loads(line) for line in fh if line.strip()]
+
+
+def scenario_names():
+    return sorted(f[:-6] for f in os.listdir(PAYLOAD_DIR) if f.endswith(".jsonl"))
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile; None for an empty sample."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, min(len(ordered), math.ceil(pct / 100 * len(ordered))))
+    return ordered[rank - 1]
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def _wait_idle(cog, api, timeout: float):
+    """Wait for debounced review batches, coalesced event bursts and in-flight Discord calls to finish."""
+    deadline = time.monotonic() + timeout
+    quiet_since = None
+    while time.monotonic() < deadline:
+        busy = cog.handlers.pending_reviews or cog.handlers._flushing_reviews or cog.handlers.coalescer.pending or api.in_flight
+        if busy:
+            quiet_since = None
+        elif quiet_since is None:
+            quiet_since = time.monotonic()
+        elif time.monotonic() - quiet_since >= 0.2:
+            return True
+        await asyncio.sleep(0.05)
+    return False
+
+
+async def replay(deliveries, rate: float = 20.0, api: FakeDiscord = None, idle_timeout: float = 30.0):
+    """POST ``deliveries`` to a live ``WebhookServer`` at ``rate`` per second; returns the report dict."""
+    api = api or FakeDiscord()
+    port = _free_port()
+    cog = make_cog(api, secret=SECRET, webhook_host="127.0.0.1", webhook_port=port)
+    server = WebhookServer(cog)
+    cog.webhook = server
+    await server.start()
+
+    loop = asyncio.get_running_loop()
+    results = []
+    url = f"http://127.0.0.1:{port}/github"
+    started = time.perf_counter()
+    try:
+        async with aiohttp.ClientSession() as http:
+            async def send(index, delivery):
+                body = json.dumps(delivery["payload"]).encode()
+                signature = hmac.new(SECRET.encode(), body, hashlib.sha256).hexdigest()
+                delivery_id = f"bench-{index}"
+                headers = {
+                    "Content-Type": "application/json",
+                    "X-GitHub-Event": delivery["event"],
+                    "X-GitHub-Delivery": delivery_id,
+                    "X-Hub-Signature-256": f"sha256={signature}",
+                }
+                action = delivery["payload"].get("action")
+                sent = time.perf_counter()
+                async with http.post(url, data=body, headers=headers) as resp:
+                    await resp.read()
+                results.append({
+                    "delivery": delivery_id,
+                    "event": f"{delivery['event']}.{action}" if action else delivery["event"],
+                    "status": resp.status,
+                    "sent": sent,
+                    "ack": time.perf_counter() - sent,
+                })
+
+            t0 = loop.time()
+            tasks = []
+            for index, delivery in enumerate(deliveries):
+                delay = t0 + index / rate - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                tasks.append(asyncio.create_task(send(index, delivery)))
+            await asyncio.gather(*tasks)
+        idle = await _wait_idle(cog, api, idle_timeout)
+    finally:
+        await server.stop()
+    return build_report(results, api, time.perf_counter() - started, idle)
+
+
+def build_report(results, api: FakeDiscord, wall: float, idle: bool = True):
+    def summarize(rows):
+        acks = [r["ack"] * 1000 for r in rows]
+        e2e = [
+            (api.last_write_by_delivery[r["delivery"]] - r["sent"]) * 1000
+            for r in rows if r["delivery"] in api.last_write_by_delivery
+        ]
+        calls = [sum(api.calls_by_delivery.get(r["delivery"], {}).values()) for r in rows]
+        return {
+            "deliveries": len(rows),
+            "errors": sum(1 for r in rows if r["status"] >= 400),
+            "ack_p50_ms": percentile(acks, 50),
+            "ack_p99_ms": percentile(acks, 99),
+            "e2e_p50_ms": percentile(e2e, 50),
+            "e2e_p99_ms": percentile(e2e, 99),
+            "api_calls_per_delivery": round(sum(calls) / len(calls), 2) if calls else 0,
+        }
+
+    by_event = collections.defaultdict(list)
+    for row in results:
+        by_event[row["event"]].append(row)
+    return {
+        "wall_s": round(wall, 3),
+        "throughput_per_s": round(len(results) / wall, 2) if wall else None,
+        "drained": idle,
+        "total": summarize(results),
+        "events": {event: summarize(rows) for event, rows in sorted(by_event.items())},
+        "api_calls": dict(api.calls.most_common()),
+        "rate_limited": dict(api.rate_limited.most_common()),
+    }
+
+
+def format_report(name, report):
+    def ms(value):
+        return "-" if value is None else f"{value:.1f}"
+
+    lines = [
+        f"== {name}: {report['total']['deliveries']} deliveries in {report['wall_s']}s "
+        f"({report['throughput_per_s']}/s){'' if report['drained'] else ' [timed out waiting for Discord writes]'}",
+        f"{'event':<36}{'n':>5}{'err':>5}{'ack p50':>10}{'ack p99':>10}{'e2e p50':>10}{'e2e p99':>10}{'calls':>8}",
+    ]
+    for event, s in list(report["events"].items()) + [("TOTAL", report["total"])]:
+        lines.append(
+            f"{event:<36}{s['deliveries']:>5}{s['errors']:>5}{ms(s['ack_p50_ms']):>10}{ms(s['ack_p99_ms']):>10}"
+            f"{ms(s['e2e_p50_ms']):>10}{ms(s['e2e_p99_ms']):>10}{s['api_calls_per_delivery']:>8}"
+        )
+    lines.append("Discord API calls: " + ", ".join(f"{route} ×{n}" for route, n in report["api_calls"].items()))
+    if report["rate_limited"]:
+        lines.append("Simulated 429s: " + ", ".join(f"{route} ×{n}" for route, n in report["rate_limited"].items()))
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("scenarios", nargs="*", help=f"scenario names ({', '.join(scenario_names())}) or JSONL paths")
+    parser.add_argument("--rate", type=float, default=20.0, help="deliveries per second (default 20)")
+    parser.add_argument("--latency", type=float, default=50.0, help="fake Discord latency per call in ms (default 50)")
+    parser.add_argument("--jitter", type=float, default=20.0, help="extra random latency per call in ms (default 20)")
+    parser.add_argument("--no-rate-limits", action="store_true", help="disable simulated per-route rate limits")
+    parser.add_argument("--review-delay", type=float, default=None, help="override the review batching delays (seconds)")
+    parser.add_argument("--json", action="store_true", help="print the reports as JSON")
+    parser.add_argument("-v", "--verbose", action="store_true", help="show GenHub's own log output")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.ERROR)
+    if args.review_delay is not None:
+        handlers_module.REVIEW_FLUSH_DELAY = handlers_module.BOT_REVIEW_FLUSH_DELAY = args.review_delay
+
+    reports = {}
+    for name in args.scenarios or scenario_names():
+        api = FakeDiscord(latency=args.latency / 1000, jitter=args.jitter / 1000, rate_limits=not args.no_rate_limits)
+        report = asyncio.run(replay(load_scenario(name), rate=args.rate, api=api))
+        reports[name] = report
+        if not args.json:
+            print(format_report(name, report) + "\n")
+    if args.json:
+        print(json.dumps(reports, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,3 +1,4 @@
+import functools
 import sys
 import types
 import pytest
@@ -8,10 +9,19 @@ from unittest.mock import MagicMock
 commands_mod = types.ModuleType("redbot.core.commands")
 
 class Cog:
-    pass
+    @staticmethod
+    def listener(name=None):
+        def decorator(func):
+            return func
+        return decorator
 
 def is_owner():
+    async def predicate(ctx):
+        return await ctx.bot.is_owner(ctx.author)
+
     def decorator(func):
+        # Recorded like discord.py does so tests can run a command's checks
+        func.__commands_checks__ = [*getattr(func, "__commands_checks__", []), predicate]
         return func
     return decorator
 
@@ -36,6 +46,11 @@ class _GroupWrapper:
         self.func = func
     def __call__(self, *a, **kw):
         return self.func(*a, **kw)
+    def __get__(self, instance, owner):
+        # Bind like a method so cog.group_name(ctx) works on instances
+        if instance is None:
+            return self
+        return functools.partial(self.func, instance)
     def command(self, *dargs, **dkwargs):
         def deco(f):
             return f
@@ -148,3 +163,11 @@ def clear_thread_cache_and_restore_utils():
             pass
     if _utils._ORIG_get_or_create_thread is not None:
         _utils.get_or_create_thread = _utils._ORIG_get_or_create_thread
+
+
+@pytest.fixture(autouse=True)
+def _restore_logging():
+    """Tests that run cog_load start the queued log listener; stop it so caplog sees later records."""
+    yield
+    from GenHub.log import stop_logging
+    stop_logging()
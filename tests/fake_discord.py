@@ -0,0 +1,377 @@
+"""In-process stand-in for the Discord API, used by tests and the webhook load harness.
+
+Every API-backed method (``send``, ``edit``, ``create_thread``, ``history``...) goes through
+:class:`FakeDiscord`, which applies simulated latency and per-route rate-limit buckets the way
+discord.py experiences them: a request on an exhausted bucket "receives" a 429 and waits out
+the reset before succeeding. Calls are counted per route and attributed to the webhook delivery
+being handled (via the active trace), so callers can report API cost per event.
+"""
+import asyncio
+import collections
+import importlib
+import itertools
+import random
+import sys
+import time
+from types import SimpleNamespace
+
+if "redbot" not in sys.modules:
+    # Outside pytest (e.g. benchmarks/), reuse the redbot stubs from conftest
+    importlib.import_module("tests.conftest")
+
+from GenHub.tracing import _current_trace
+
+
+# (requests, per seconds) per bucket, roughly matching Discord's documented/observed limits
+ROUTE_LIMITS = {
+    "POST /channels/{channel_id}/messages": (5, 5.0),
+    "PATCH /channels/{channel_id}/messages/{message_id}": (5, 5.0),
+    "DELETE /channels/{channel_id}/messages/{message_id}": (5, 1.0),
+    "GET /channels/{channel_id}/messages": (50, 1.0),
+    "POST /channels/{channel_id}/threads": (10, 10.0),
+    "PATCH /channels/{channel_id}": (10, 10.0),
+    "GET /channels/{channel_id}": (50, 1.0),
+    "GET /channels/{channel_id}/threads/archived/public": (50, 1.0),
+}
+GLOBAL_LIMIT = (50, 1.0)
+
+_ids = itertools.count(10_000_000)
+
+
+class _Bucket:
+    def __init__(self, limit, per):
+        self.limit = limit
+        self.per = per
+        self.remaining = limit
+        self.reset_at = 0.0
+        self.lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Take one request from the bucket; returns True if it had to wait out a 429."""
+        limited = False
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                if now >= self.reset_at:
+                    self.remaining = self.limit
+                    self.reset_at = now + self.per
+                if self.remaining > 0:
+                    self.remaining -= 1
+                    return limited
+                limited = True
+                await asyncio.sleep(self.reset_at - now)
+
+
+class FakeDiscord:
+    """Latency, rate limits and call accounting shared by all fake channels of one bot."""
+
+    def __init__(self, latency: float = 0.0, jitter: float = 0.0, rate_limits: bool = True, seed: int = 0):
+        self.latency = latency
+        self.jitter = jitter
+        self.rate_limits = rate_limits
+        self._random = random.Random(seed)
+        self._buckets = {}
+        self._global = _Bucket(*GLOBAL_LIMIT)
+        self.calls = collections.Counter()
+        self.rate_limited = collections.Counter()
+        self.calls_by_delivery = collections.defaultdict(collections.Counter)
+        self.last_write_by_delivery = {}
+        self.in_flight = 0
+
+    async def request(self, method: str, route: str, channel_id=None):
+        key = f"{method} {route}"
+        delivery = _current_trace.get()
+        self.in_flight += 1
+        try:
+            if self.rate_limits:
+                limit = ROUTE_LIMITS.get(key)
+                if limit:
+                    bucket = self._buckets.get((key, channel_id))
+                    if bucket is None:
+                        bucket = self._buckets[(key, channel_id)] = _Bucket(*limit)
+                    if await bucket.acquire():
+                        self.rate_limited[key] += 1
+                if await self._global.acquire():
+                    self.rate_limited["global"] += 1
+            delay = self.latency + (self._random.uniform(0, self.jitter) if self.jitter else 0.0)
+            if delay:
+                await asyncio.sleep(delay)
+            self.calls[key] += 1
+            if delivery is not None:
+                self.calls_by_delivery[delivery.delivery_id][key] += 1
+                if method != "GET":
+                    self.last_write_by_delivery[delivery.delivery_id] = time.perf_counter()
+        finally:
+            self.in_flight -= 1
+
+    def total_calls(self):
+        return sum(self.calls.values())
+
+
+class FakeTag(SimpleNamespace):
+    def __init__(self, name):
+        super().__init__(id=next(_ids), name=name, moderated=False)
+
+    def __hash__(self):
+        return hash(self.id)
+
+
+class FakeMessage:
+    def __init__(self, channel, content=None, embed=None, embeds=None, view=None):
+        self.id = next(_ids)
+        self.channel = channel
+        self.content = content or ""
+        self.embeds = list(embeds or ([embed] if embed else []))
+        self.components = []
+        self.jump_url = f"https://discord.com/channels/{channel.guild.id}/{channel.id}/{self.id}"
+
+    async def edit(self, content=None, embed=None, embeds=None, **kwargs):
+        await self.channel.api.request("PATCH", "/channels/{channel_id}/messages/{message_id}", self.channel.id)
+        if content is not None:
+            self.content = content
+        if embed is not None:
+            self.embeds = [embed]
+        elif embeds is not None:
+            self.embeds = list(embeds)
+        return self
+
+    async def delete(self):
+        await self.channel.api.request("DELETE", "/channels/{channel_id}/messages/{message_id}", self.channel.id)
+        if self in self.channel.messages:
+            self.channel.messages.remove(self)
+
+
+class _Messageable:
+    def __init__(self, api, guild, name):
+        self.api = api
+        self.guild = guild
+        self.id = next(_ids)
+        self.name = name
+        self.messages = []
+        self.mention = f"<#{self.id}>"
+        self.jump_url = f"https://discord.com/channels/{guild.id}/{self.id}"
+
+    async def send(self, content=None, *, embed=None, embeds=None, view=None, **kwargs):
+        await self.api.request("POST", "/channels/{channel_id}/messages", self.id)
+        message = FakeMessage(self, content, embed, embeds, view)
+        self.messages.append(message)
+        return message
+
+    async def history(self, limit=100, oldest_first=False, **kwargs):
+        await self.api.request("GET", "/channels/{channel_id}/messages", self.id)
+        messages = self.messages if oldest_first else list(reversed(self.messages))
+        for message in messages[:limit] if limit else messages:
+            yield message
+
+    async def fetch_message(self, message_id):
+        await self.api.request("GET", "/channels/{channel_id}/messages", self.id)
+        for message in self.messages:
+            if message.id == message_id:
+                return message
+        raise LookupError(message_id)
+
+
+class FakeTextChannel(_Messageable):
+    type = "text"
+
+
+class FakeThread(_Messageable):
+    def __init__(self, api, forum, name, applied_tags=None):
+        super().__init__(api, forum.guild, name)
+        self.parent = forum
+        self.parent_id = forum.id
+        self.applied_tags = list(applied_tags or [])
+        self.archived = False
+        self.locked = False
+
+    async def edit(self, **kwargs):
+        await self.api.request("PATCH", "/channels/{channel_id}", self.id)
+        for key, value in kwargs.items():
+            setattr(self, key, list(value) if key == "applied_tags" else value)
+        return self
+
+    async def delete(self):
+        await self.api.request("DELETE", "/channels/{channel_id}", self.id)
+        self.parent.threads.remove(self)
+
+
+class FakeForum:
+    def __init__(self, api, guild, name):
+        self.api = api
+        self.guild = guild
+        self.id = next(_ids)
+        self.name = name
+        self.available_tags = []
+        self.threads = []
+        self.mention = f"<#{self.id}>"
+
+    async def create_tag(self, name, moderated=False, **kwargs):
+        await self.api.request("PATCH", "/channels/{channel_id}", self.id)
+        tag = FakeTag(name)
+        self.available_tags.append(tag)
+        return tag
+
+    async def create_thread(self, name, content=None, applied_tags=None, embed=None, **kwargs):
+        await self.api.request("POST", "/channels/{channel_id}/threads", self.id)
+        thread = FakeThread(self.api, self, name, applied_tags)
+        message = FakeMessage(thread, content, embed)
+        thread.messages.append(message)
+        self.threads.append(thread)
+        return SimpleNamespace(thread=thread, message=message)
+
+    async def archived_threads(self, limit=100, before=None, **kwargs):
+        await self.api.request("GET", "/channels/{channel_id}/threads/archived/public", self.id)
+        for thread in [t for t in self.threads if t.archived][:limit]:
+            yield thread
+
+
+class FakeGuild:
+    def __init__(self, name="GenHub Test"):
+        self.id = next(_ids)
+        self.name = name
+        self.channels = []
+        self.forums = []
+        self.text_channels = []
+
+    @property
+    def threads(self):
+        return [t for forum in self.forums for t in forum.threads]
+
+    def get_role(self, role_id):
+        return None
+
+
+class FakeBot:
+    """Just enough of ``Red`` for the handlers: channel lookup plus an app-command tree."""
+
+    def __init__(self, api: FakeDiscord = None):
+        self.api = api or FakeDiscord()
+        self.guild = FakeGuild()
+        self.guilds = [self.guild]
+        self.user = SimpleNamespace(id=next(_ids), name="GenHub")
+        self.tree = SimpleNamespace(add_command=lambda *a, **k: None, sync=self._sync)
+
+    async def _sync(self, guild=None):
+        return []
+
+    def add_forum(self, name):
+        forum = FakeForum(self.api, self.guild, name)
+        self.guild.forums.append(forum)
+        self.guild.channels.append(forum)
+        return forum
+
+    def add_text_channel(self, name):
+        channel = FakeTextChannel(self.api, self.guild, name)
+        self.guild.text_channels.append(channel)
+        self.guild.channels.append(channel)
+        return channel
+
+    def get_channel(self, channel_id):
+        for channel in self.guild.channels:
+            if channel.id == channel_id:
+                return channel
+        for thread in self.guild.threads:
+            if thread.id == channel_id:
+                return thread
+        return None
+
+    async def fetch_channel(self, channel_id):
+        await self.api.request("GET", "/channels/{channel_id}", channel_id)
+        channel = self.get_channel(channel_id)
+        if channel is None:
+            raise LookupError(channel_id)
+        return channel
+
+
+class _ValueContext:
+    """What ``config.key()`` returns in Red: awaitable, or ``async with`` to edit a dict/list in place."""
+
+    def __init__(self, store, key):
+        self._store = store
+        self._key = key
+
+    def __await__(self):
+        async def get():
+            return self._store.get(self._key)
+        return get().__await__()
+
+    async def __aenter__(self):
+        return self._store.setdefault(self._key, {})
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class FakeStore:
+    """A single Red Config value on its own, supporting ``await store()`` and ``await store.set(v)``."""
+
+    def __init__(self, value=None):
+        self.value = value if value is not None else {}
+
+    async def __call__(self):
+        return self.value
+
+    async def set(self, value):
+        self.value = value
+
+
+class _ConfigValue:
+    def __init__(self, store, key):
+        self._store = store
+        self._key = key
+
+    def __call__(self):
+        return _ValueContext(self._store, self._key)
+
+    async def set(self, value):
+        self._store[self._key] = value
+
+    async def clear(self):
+        self._store.pop(self._key, None)
+
+
+class FakeConfig:
+    """Dict-backed replacement for Red's ``Config`` global scope (``await config.key()`` / ``.set()``)."""
+
+    def __init__(self, values=None):
+        object.__setattr__(self, "_store", dict(values or {}))
+
+    def __getattr__(self, key):
+        if key.startswith("__"):
+            raise AttributeError(key)
+        return _ConfigValue(self._store, key)
+
+    async def all(self):
+        return dict(self._store)
+
+
+def genhub_defaults():
+    """The global defaults GenHub registers with Config, read from the cog itself."""
+    from GenHub.genhub import GenHub
+
+    cog = GenHub(FakeBot())
+    return dict(cog.config.register_global.call_args.kwargs)
+
+
+def make_cog(api: FakeDiscord = None, repos=("acme/widgets",), secret: str = "", **overrides):
+    """A GenHub-shaped cog wired to fake Discord: issue/PR forums, feed chats, updates and log channels."""
+    from GenHub.handlers import GitHubEventHandlers
+
+    bot = FakeBot(api)
+    issues = bot.add_forum("issues")
+    prs = bot.add_forum("pull-requests")
+    values = genhub_defaults()
+    values.update(
+        github_secret=secret,
+        allowed_repos=list(repos),
+        issues_forum_id=issues.id,
+        prs_forum_id=prs.id,
+        issues_feed_chat_id=bot.add_text_channel("issues-chat").id,
+        prs_feed_chat_id=bot.add_text_channel("prs-chat").id,
+        updates_channel_id=bot.add_text_channel("updates").id,
+        log_channel_id=bot.add_text_channel("genhub-log").id,
+    )
+    values.update(overrides)
+    cog = SimpleNamespace(bot=bot, config=FakeConfig(values), thread_cache={})
+    cog.handlers = GitHubEventHandlers(cog)
+    return cog
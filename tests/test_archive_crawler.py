@@ -0,0 +1,100 @@
+import datetime
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock, patch
+from GenHub.archive_crawler import ArchiveCrawler
+from GenHub.utils import find_thread
+from tests.fake_discord import FakeStore
+
+BASE = datetime.datetime(2025, 1, 1, tzinfo=datetime.timezone.utc)
+
+
+def make_archived(number, minutes, repo_tag="repo"):
+    return SimpleNamespace(
+        id=10_000 + number,
+        name=f"[GH] [#{number}] Item {number}",
+        applied_tags=[SimpleNamespace(name=repo_tag)],
+        archive_timestamp=BASE + datetime.timedelta(minutes=minutes),
+    )
+
+
+class FakeForum:
+    def __init__(self, threads):
+        self.id = 123
+        self.name = "issues"
+        self.threads = []
+        self.archived = threads
+        self.calls = []
+
+    async def archived_threads(self, limit=100, before=None):
+        self.calls.append(before)
+        ordered = sorted(self.archived, key=lambda t: t.archive_timestamp, reverse=True)
+        if before is not None:
+            ordered = [t for t in ordered if t.archive_timestamp < before]
+        for t in ordered[:limit]:
+            yield t
+
+
+def make_cog():
+    cog = Mock()
+    cog.config = Mock(archive_index=FakeStore(), allowed_repos=AsyncMock(return_value=["owner/repo"]))
+    cog.thread_cache = {}
+    return cog
+
+
+@pytest.mark.asyncio
+async def test_full_crawl_pages_with_before_cursor_then_only_fetches_newer():
+    cog = make_cog()
+    forum = FakeForum([make_archived(n, n) for n in range(1, 251)])
+    crawler = ArchiveCrawler(cog)
+
+    with patch("GenHub.archive_crawler.PAGE_PAUSE", 0):
+        added = await crawler.crawl(forum)
+    assert added == 250
+    assert len(forum.calls) == 3 and forum.calls[0] is None
+    assert cog.thread_cache[(123, "owner/repo", 7)] == 10_007
+    assert crawler.index["123"]["threads"]["10001"]["n"] == 1
+
+    forum.archived.append(make_archived(251, 500))
+    forum.calls.clear()
+    with patch("GenHub.archive_crawler.PAGE_PAUSE", 0):
+        added = await crawler.crawl(forum)
+    assert added == 1
+    assert forum.calls == [None]
+
+
+@pytest.mark.asyncio
+async def test_index_survives_restart_and_resolves_through_find_thread():
+    cog = make_cog()
+    forum = FakeForum([make_archived(5, 1), make_archived(6, 2, repo_tag="other")])
+    await ArchiveCrawler(cog).crawl(forum)
+
+    restarted = make_cog()
+    restarted.config.archive_index = cog.config.archive_index
+    await ArchiveCrawler(restarted).hydrate()
+    assert restarted.thread_cache[(123, "owner/repo", 5)] == 10_005
+    assert (123, "owner/repo", 6) not in restarted.thread_cache
+
+    thread = SimpleNamespace(id=10_005, name="[GH] [#5] Item 5")
+    bot = Mock()
+    bot.get_channel = Mock(return_value=None)
+    bot.fetch_channel = AsyncMock(return_value=thread)
+    found = await find_thread(bot, 123, "owner/repo", 5, restarted.thread_cache)
+    assert found is thread
+    bot.fetch_channel.assert_awaited_once_with(10_005)
+
+
+@pytest.mark.asyncio
+async def test_orphan_cleanup_only_considers_recent_archives_after_full_crawl():
+    from GenHub.handlers import GitHubEventHandlers
+
+    cog = make_cog()
+    forum = FakeForum([make_archived(n, n) for n in range(1, 151)])
+    cog.archive_crawler = crawler = ArchiveCrawler(cog)
+    with patch("GenHub.archive_crawler.PAGE_PAUSE", 0):
+        await crawler.crawl(forum)
+    cog.bot.get_channel = Mock(side_effect=AssertionError("archived history must not be resolved"))
+
+    orphans = await GitHubEventHandlers(cog)._find_orphaned_threads(forum, "owner/repo", github_items={})
+    # Only the 100 most recently archived threads are candidates, as before the crawler existed
+    assert sorted(n for n, _ in orphans) == list(range(51, 151))
@@ -0,0 +1,135 @@
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from GenHub.coalesce import EventCoalescer
+from GenHub.webhook import WebhookServer
+from tests.fake_discord import FakeDiscord, make_cog
+
+
+def _issue_event(action, labels=(), item_assignee=None, **extra):
+    issue = {
+        "number": 4,
+        "title": "Crash on start",
+        "html_url": "https://github.com/acme/widgets/issues/4",
+        "user": {"login": "octocat"},
+        "state": "open",
+        "labels": [{"name": n} for n in labels],
+        "assignee": item_assignee,
+        "assignees": [item_assignee] if item_assignee else [],
+    }
+    return {"action": action, "issue": issue, "repository": {"full_name": "acme/widgets"}, "sender": {"login": "octocat"}, **extra}
+
+
+def _request(event="issues"):
+    return Mock(headers={"X-GitHub-Event": event})
+
+
+@pytest.mark.asyncio
+async def test_label_and_assignee_bursts_merge_into_net_changes():
+    handlers = Mock()
+    handlers._get_config_int = AsyncMock(return_value=20)
+    handlers._store_config = AsyncMock()
+    handler = AsyncMock()
+    coalescer = EventCoalescer(handlers)
+    octo = {"login": "octocat", "html_url": "https://github.com/octocat"}
+
+    for name in ("bug", "p1", "ui"):
+        await coalescer.dispatch("issues", _issue_event("labeled", label={"name": name}), "acme/widgets", handler)
+    await coalescer.dispatch("issues", _issue_event("unlabeled", label={"name": "ui"}), "acme/widgets", handler)
+    await coalescer.dispatch("issues", _issue_event("assigned", item_assignee=octo, assignee=octo), "acme/widgets", handler)
+    await coalescer.dispatch("issues", _issue_event("unassigned", assignee=octo), "acme/widgets", handler)
+    handler.assert_not_awaited()
+
+    await asyncio.sleep(0.05)
+    # Five label events become one; the assign/unassign pair cancels out entirely
+    assert handler.await_count == 1
+    merged = handler.await_args.args[0]
+    assert merged["action"] == "labeled" and merged["label"] == {"name": "+bug, +p1"}
+    assert coalescer.merged == 5 and coalescer.pending == {} and coalescer._locks == {}
+
+
+@pytest.mark.asyncio
+async def test_mixed_assignee_burst_posts_both_directions():
+    cog = make_cog(FakeDiscord(rate_limits=False), coalesce_window_ms=60_000, log_batch_seconds=0)
+    handlers = cog.handlers
+    cog.webhook = WebhookServer(cog)
+    alice = {"login": "alice", "html_url": "https://github.com/alice"}
+    bob = {"login": "bob", "html_url": "https://github.com/bob"}
+
+    await handlers.process_payload(_request(), _issue_event("opened", item_assignee=bob))
+    await handlers.process_payload(_request(), _issue_event("assigned", item_assignee=bob, assignee=alice))
+    await handlers.process_payload(_request(), _issue_event("unassigned", item_assignee=alice, assignee=bob))
+    assert await handlers.coalescer.flush(1) == 0
+
+    log_channel = cog.bot.get_channel(await cog.config.log_channel_id())
+    assigned = [m.content for m in log_channel.messages if "Issue Assigned" in m.content]
+    assert len(assigned) == 1 and "+alice, -bob" in assigned[0]
+    forum = cog.bot.get_channel(await cog.config.issues_forum_id())
+    notice = forum.threads[0].messages[-1].content
+    assert "[alice](https://github.com/alice)" in notice and "-[bob]" in notice
+
+
+@pytest.mark.asyncio
+async def test_must_emit_actions_flush_the_burst_first_and_go_out_in_order():
+    cog = make_cog(FakeDiscord(rate_limits=False), coalesce_window_ms=60_000, log_batch_seconds=0)
+    handlers = cog.handlers
+    cog.webhook = WebhookServer(cog)
+
+    await handlers.process_payload(_request(), _issue_event("opened"))
+    for name in ("bug", "p1"):
+        await handlers.process_payload(_request(), _issue_event("labeled", labels=[name], label={"name": name}))
+    await handlers.process_payload(_request(), _issue_event("edited", labels=["bug", "p1"]))
+    assert len(handlers.coalescer.pending) == 1
+
+    await handlers.process_payload(_request(), _issue_event("closed", labels=["bug", "p1"]))
+    assert handlers.coalescer.pending == {}
+
+    forum = cog.bot.get_channel(await cog.config.issues_forum_id())
+    assert len(forum.threads) == 1
+    log_channel = cog.bot.get_channel(await cog.config.log_channel_id())
+    lines = [m.content for m in log_channel.messages]
+    labelled = [l for l in lines if "Issue Labeled" in l]
+    assert len(labelled) == 1 and "+bug, +p1" in labelled[0]
+    assert lines.index(labelled[0]) < next(i for i, l in enumerate(lines) if "Issue Closed" in l)
+
+    # Queued bursts are run by the unload drain too
+    await handlers.process_payload(_request(), _issue_event("labeled", labels=["bug"], label={"name": "wontfix"}))
+    assert await handlers.coalescer.flush(1) == 0
+    assert "wontfix" in log_channel.messages[-1].content
+
+
+@pytest.mark.asyncio
+async def test_queued_bursts_survive_a_restart_and_failures_are_reported():
+    cog = make_cog(FakeDiscord(rate_limits=False), coalesce_window_ms=60_000, log_batch_seconds=0)
+    cog.webhook = WebhookServer(cog)
+    coalescer = cog.handlers.coalescer
+    await coalescer.restore()
+
+    # Acknowledged but still inside the window: already saved
+    await cog.handlers.process_payload(_request(), _issue_event("labeled", labels=["bug"], label={"name": "bug"}))
+    saved = await cog.config.coalesce_pending()
+    assert [b["key"] for b in saved] == [["acme/widgets", 4, "issues"]]
+    assert saved[0]["kinds"]["labels"]["changes"] == [["labeled", "bug"]]
+
+    # A burst whose handler is cut off by the unload deadline is counted and kept
+    async def stuck(data, repo):
+        await asyncio.Event().wait()
+
+    coalescer.pending[("acme/widgets", 4, "issues")]["handler"] = stuck
+    assert await coalescer.flush(0.05) == 1
+    await coalescer.suspend()
+    assert len(await cog.config.coalesce_pending()) == 1
+
+    # The next cog instance replays it; a failing handler goes to the error log
+    restarted = make_cog(FakeDiscord(rate_limits=False))
+    restarted.config = cog.config
+    await cog.config.coalesce_window_ms.set(10)
+    restarted.handlers.handle_issue = AsyncMock(side_effect=RuntimeError("boom"))
+    restarted.handlers.log_error = AsyncMock()
+    assert await restarted.handlers.coalescer.restore() == 1
+    await asyncio.sleep(0.05)
+    assert restarted.handlers.handle_issue.await_args.args[0]["label"] == {"name": "bug"}
+    assert "boom" in restarted.handlers.log_error.await_args.args[0]
+    assert await restarted.config.coalesce_pending() == []
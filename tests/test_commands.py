@@ -251,3 +251,48 @@ async def test_whitelist_commands_and_check():
     ctx_list.send.assert_awaited()
 
 
+
+
+@pytest.mark.asyncio
+async def test_events_report_and_allowlist():
+    import collections
+    from types import SimpleNamespace
+    from tests.fake_discord import FakeConfig
+
+    cog = SimpleNamespace(
+        config=FakeConfig({"event_allowlist": []}),
+        webhook=SimpleNamespace(skipped=collections.Counter({"other": 49, "pull_request": 3, "pull_request_review.other": 2})),
+    )
+    cmd = ConfigCommands(cog)
+    ctx = Mock(send=AsyncMock())
+
+    await cmd.events(ctx)
+    report = ctx.send.await_args.args[0]
+    assert "`pull_request_review`: dismissed, submitted" in report
+    assert "`other` ×49" in report
+    assert "Events GenHub doesn't handle reached the hook" in report
+    assert "disable on the hook:** `pull_request`" in report
+
+    await cmd.events_allow(ctx, "issues", "push", "issue_comment.transferred")
+    assert "`push`, `issue_comment.transferred`" in ctx.send.await_args.args[0]
+    assert await cog.config.event_allowlist() == []
+
+    await cmd.events_allow(ctx, "issues", "issue_comment.created")
+    assert await cog.config.event_allowlist() == ["issues", "issue_comment.created"]
+    await cmd.events(ctx)
+    assert "Enable on the GitHub hook:** `issues`, `issue_comment`" in ctx.send.await_args.args[0]
+
+
+@pytest.mark.asyncio
+async def test_reconcile_subcommands_are_owner_only():
+    ctx = Mock()
+    ctx.bot.is_owner = AsyncMock(return_value=False)
+    for command in (
+        ConfigCommands.reconcile_resume,
+        ConfigCommands.reconcile_status,
+        ConfigCommands.autoreconcile,
+        ConfigCommands.reconcileworkers,
+    ):
+        checks = getattr(command, "__commands_checks__", [])
+        assert checks, command.__name__
+        assert not all([await check(ctx) for check in checks])
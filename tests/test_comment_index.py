@@ -0,0 +1,92 @@
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+from GenHub.comment_index import SyncedCommentIndex
+from GenHub.handlers import GitHubEventHandlers
+from tests.fake_discord import FakeStore
+
+
+def make_thread(messages):
+    thread = Mock(id=42)
+    thread.history_calls = 0
+
+    async def history(limit=None, oldest_first=False):
+        thread.history_calls += 1
+        for m in messages:
+            yield m
+
+    thread.history = history
+    return thread
+
+
+def embed(author_name=None, author_url=None, description=None):
+    author = Mock()
+    author.name = author_name
+    author.url = author_url
+    return Mock(author=author, description=description)
+
+
+@pytest.mark.asyncio
+async def test_legacy_thread_is_seeded_once_from_full_history():
+    cog = Mock()
+    cog.config = Mock(synced_comments=FakeStore())
+    index = SyncedCommentIndex(cog)
+    old_url = "https://github.com/owner/repo/issues/1#issuecomment-1"
+    messages = [Mock(content="🆕 Issue created", embeds=[])]
+    # Older than the previous 50-message window
+    messages += [Mock(content="", embeds=[]) for _ in range(80)]
+    messages.append(Mock(content="", embeds=[embed("coderabbitai[bot] (Review)", old_url)]))
+    thread = make_thread(messages)
+
+    entry = await index.entry_for(thread)
+    assert old_url in entry["urls"]
+    assert "coderabbitai[bot]" in entry["bots"]
+    assert entry["initial"] is True
+
+    await index.entry_for(thread)
+    assert thread.history_calls == 1
+
+
+@pytest.mark.asyncio
+async def test_recorded_comments_survive_reload():
+    store = FakeStore()
+    cog = Mock()
+    cog.config = Mock(synced_comments=store)
+    index = SyncedCommentIndex(cog)
+    thread = make_thread([])
+    index.mark_new(thread)
+    index.record(thread, "https://github.com/owner/repo/issues/1#issuecomment-2")
+    await index.close()
+
+    reloaded = SyncedCommentIndex(cog)
+    entry = await reloaded.entry_for(thread)
+    assert entry["urls"] == {"https://github.com/owner/repo/issues/1#issuecomment-2"}
+    assert thread.history_calls == 0
+
+
+@pytest.mark.asyncio
+async def test_plan_dedups_from_index_without_history_reads():
+    cog = Mock()
+    cog.config = Mock(synced_comments=FakeStore(), contributor_role_id=AsyncMock(return_value=None))
+    cog.thread_cache = {}
+    handler = GitHubEventHandlers(cog)
+    handler.log_debug = AsyncMock()
+    handler.log_error = AsyncMock()
+    posted = "https://github.com/owner/repo/issues/3#issuecomment-1"
+    fresh = "https://github.com/owner/repo/issues/3#issuecomment-2"
+    handler._fetch_comments = AsyncMock(return_value=[
+        {"html_url": posted, "user": {"login": "a"}, "body": "old"},
+        {"html_url": fresh, "user": {"login": "b"}, "body": "new"},
+    ])
+
+    thread = Mock(id=7, archived=False, applied_tags=[])
+    thread.history = Mock(side_effect=AssertionError("history should not be read"))
+    handler.comment_index.mark_new(thread)
+    handler.comment_index.record(thread, posted)
+
+    item = {"number": 3, "title": "T", "html_url": "https://github.com/owner/repo/issues/3", "state": "open", "user": {"login": "a"}}
+    with patch("GenHub.handlers.find_thread", new_callable=AsyncMock, return_value=thread):
+        plan = await handler._plan_item(object(), Mock(id=1), "owner/repo", item, False)
+
+    assert [c["html_url"] for c, _ in plan["comments"]] == [fresh]
+    assert plan["send_initial"] is False
+    await handler.comment_index.close()
@@ -0,0 +1,139 @@
+import asyncio
+import hashlib
+import hmac
+import json
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from GenHub.genhub import GenHub
+from GenHub.spool import SpoolConsumer
+from GenHub.webhook import WebhookServer
+from tests.fake_discord import FakeDiscord, make_cog
+
+
+REPO = {"full_name": "acme/widgets"}
+USER = {"login": "octocat"}
+
+
+def _request(event, payload, delivery_id):
+    body = json.dumps(payload).encode()
+    req = Mock()
+    req.headers = {
+        "X-GitHub-Event": event,
+        "X-GitHub-Delivery": delivery_id,
+        "X-Hub-Signature-256": "sha256=" + hmac.new(b"s", body, hashlib.sha256).hexdigest(),
+    }
+    req.read = AsyncMock(return_value=body)
+    return req
+
+
+def _issue(number):
+    return {
+        "action": "opened",
+        "issue": {"number": number, "title": f"Bug {number}", "html_url": f"https://github.com/acme/widgets/issues/{number}", "user": USER, "labels": []},
+        "repository": REPO,
+        "sender": USER,
+    }
+
+
+def _review():
+    return {
+        "action": "submitted",
+        "pull_request": {"number": 7, "title": "Add cache", "html_url": "https://github.com/acme/widgets/pull/7", "user": USER, "state": "open", "labels": []},
+        "review": {"id": 55, "body": "Needs a test", "state": "commented", "user": {"login": "reviewer"}, "html_url": "https://github.com/acme/widgets/pull/7#review-55"},
+        "repository": REPO,
+        "sender": {"login": "reviewer"},
+    }
+
+
+@pytest.mark.asyncio
+async def test_drain_refuses_new_deliveries_and_finishes_in_flight_work():
+    cog = make_cog(FakeDiscord(rate_limits=False), secret="s", drain_timeout_seconds=5)
+    cog.webhook = WebhookServer(cog)
+    cog.spool_consumer = SpoolConsumer(cog)
+    handlers = cog.handlers
+
+    # A review batch waiting out its debounce
+    assert (await cog.webhook.webhook_handler(_request("pull_request_review", _review(), "r-1"))).status == 200
+    assert len(handlers.pending_reviews) == 1
+
+    # A delivery still being handled when the unload starts
+    gate = asyncio.Event()
+    process = handlers.process_payload
+
+    async def slow_process(*args, **kwargs):
+        await gate.wait()
+        return await process(*args, **kwargs)
+
+    handlers.process_payload = slow_process
+    in_flight = asyncio.create_task(cog.webhook.webhook_handler(_request("issues", _issue(1), "d-1")))
+    await asyncio.sleep(0.01)
+
+    drain = asyncio.create_task(GenHub.drain(cog))
+    await asyncio.sleep(0.01)
+    refused = await cog.webhook.webhook_handler(_request("issues", _issue(2), "d-2"))
+    assert refused.status == 503
+    assert not drain.done()
+
+    gate.set()
+    await asyncio.wait_for(drain, 2)
+    assert (await in_flight).status == 200
+
+    issues = cog.bot.get_channel(await cog.config.issues_forum_id())
+    assert [t.name for t in issues.threads] == ["[GH] [#1] Bug 1"]
+    # The review batch was posted right away instead of being left for the next load
+    assert handlers.pending_reviews == {} and handlers._flushing_reviews == {}
+    assert await cog.config.pending_reviews() == {}
+    prs = cog.bot.get_channel(await cog.config.prs_forum_id())
+    assert any("Needs a test" in json.dumps([e.to_dict() for e in m.embeds]) for t in prs.threads for m in t.messages)
+
+
+@pytest.mark.asyncio
+async def test_drain_deadline_persists_what_is_left():
+    cog = make_cog(FakeDiscord(rate_limits=False), secret="s", drain_timeout_seconds=0)
+    cog.webhook = WebhookServer(cog)
+    cog.spool_consumer = SpoolConsumer(cog)
+    handlers = cog.handlers
+    handlers.is_reconciling = True
+
+    await cog.webhook.webhook_handler(_request("pull_request_review", _review(), "r-1"))
+    await GenHub.drain(cog)
+    await handlers.suspend_pending_reviews()
+
+    assert handlers.reconcile_cancelled
+    assert len(await cog.config.pending_reviews()) == 1
+
+
+@pytest.mark.asyncio
+async def test_unload_while_a_review_batch_is_being_posted():
+    cog = make_cog(FakeDiscord(rate_limits=False), secret="s", drain_timeout_seconds=0)
+    cog.webhook = WebhookServer(cog)
+    cog.spool_consumer = SpoolConsumer(cog)
+    handlers = cog.handlers
+    await cog.webhook.webhook_handler(_request("pull_request_review", _review(), "r-1"))
+
+    # The debounce has fired and the post is stuck on Discord
+    posting, interrupted = asyncio.Event(), asyncio.Event()
+
+    async def stuck_post(key, entry):
+        posting.set()
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            interrupted.set()
+            raise
+
+    handlers._post_review_batch = stuck_post
+    handlers._arm_review_flush(next(iter(handlers.pending_reviews)), 0)
+    await posting.wait()
+    assert handlers.pending_reviews == {} and len(handlers._flushing_reviews) == 1
+
+    assert await handlers.flush_pending_reviews(0.05) == 1
+    await GenHub.drain(cog)
+    await handlers.suspend_pending_reviews()
+
+    # The post was stopped before unload finished and the batch is saved for the next load
+    assert interrupted.is_set()
+    assert not handlers._review_flush_tasks()
+    assert len(await cog.config.pending_reviews()) == 1
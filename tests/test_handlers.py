@@ -595,3 +595,35 @@ async def test_bot_edit_debouncing():
     assert handler._should_log_bot_edit("owner/repo", 1, "bobtista") is True
     assert handler._should_log_bot_edit("owner/repo", 1, "bobtista") is True
 
+
+
+@pytest.mark.asyncio
+async def test_handle_issue_comment_retries_once_when_thread_was_deleted():
+    import discord
+    cog = Mock()
+    cog.config = Mock()
+    cog.config.issues_forum_id = AsyncMock(return_value=123)
+    cog.config.contributor_role_id = AsyncMock(return_value=None)
+    cog.bot = Mock()
+    cog.bot.get_channel = Mock(return_value=Mock(available_tags=[], create_tag=AsyncMock()))
+    stale, fresh = Mock(id=1), Mock(id=2)
+    cog.thread_cache = {(123, "owner/repo", 1): stale}
+
+    lookups = AsyncMock(side_effect=[(stale, False), (fresh, True)])
+    sent_to = []
+
+    async def fake_send(thread, *a, **k):
+        sent_to.append(thread)
+        if thread is stale:
+            raise discord.NotFound(Mock(status=404, reason="Not Found"), "Unknown Channel")
+
+    with patch("GenHub.handlers.get_or_create_thread", lookups), \
+         patch("GenHub.handlers.send_message", side_effect=fake_send):
+        handler = GitHubEventHandlers(cog)
+        issue = {"number": 1, "title": "T", "html_url": "u", "user": {"login": "a"}, "state": "open"}
+        comment = {"body": "hi", "user": {"login": "me"}, "html_url": "c"}
+        await handler.handle_issue_comment({"action": "created", "issue": issue, "comment": comment}, "owner/repo")
+
+    assert sent_to == [stale, fresh]
+    assert lookups.await_count == 2
+    assert (123, "owner/repo", 1) not in cog.thread_cache
@@ -48,7 +48,7 @@ async def test_cog_load_and_unload(monkeypatch):
 
 
 @pytest.mark.asyncio
-async def test_cog_load_sync_failure(capsys):
+async def test_cog_load_sync_failure(caplog):
     from unittest.mock import AsyncMock, Mock
     from GenHub.genhub import GenHub
 
@@ -63,5 +63,7 @@ async def test_cog_load_sync_failure(capsys):
     cog.config.thread_cache = AsyncMock(return_value={})
     cog.config.thread_cache.set = AsyncMock()
     await cog.cog_load()
-    out = capsys.readouterr().out
-    assert "Failed to sync slash commands" in out
+    await cog.startup_task  # syncing runs in the background after cog_load returns
+    from GenHub.log import stop_logging
+    stop_logging()  # drain the queued records into the handlers caplog listens on
+    assert "Failed to sync slash commands" in caplog.text
@@ -0,0 +1,43 @@
+import io
+import json
+import logging
+
+from GenHub.log import JsonFormatter, log, setup_logging, stop_logging
+from GenHub.tracing import tracer
+
+
+def test_json_mode_writes_one_object_per_record_with_delivery(monkeypatch):
+    out = io.StringIO()
+    monkeypatch.setattr("sys.stdout", out)
+    log.setLevel(logging.DEBUG)
+    try:
+        setup_logging(json_output=True)
+        with tracer.trace("del-42", "issues"):
+            log.info("Created thread for %s#%s", "o/r", 7, extra={"repo": "o/r"})
+        log.debug("outside %s", "delivery")
+        stop_logging()
+    finally:
+        log.setLevel(logging.NOTSET)
+
+    records = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert records[0]["message"] == "Created thread for o/r#7"
+    assert records[0]["level"] == "info" and records[0]["logger"] == "red.genhub"
+    assert records[0]["delivery"] == "del-42" and records[0]["repo"] == "o/r"
+    assert "delivery" not in records[1]
+
+
+def test_text_mode_forwards_to_parent_handlers(caplog):
+    setup_logging()
+    log.warning("⚠️ Failed to persist %s: %s", "thread_cache", "boom")
+    stop_logging()
+    assert "Failed to persist thread_cache: boom" in caplog.text
+    assert log.propagate is True
+
+
+def test_json_formatter_includes_exception():
+    try:
+        raise ValueError("bad")
+    except ValueError:
+        record = log.makeRecord(log.name, logging.ERROR, __file__, 1, "failed", (), __import__("sys").exc_info())
+    data = json.loads(JsonFormatter().format(record))
+    assert "ValueError: bad" in data["exc"]
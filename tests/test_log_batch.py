@@ -0,0 +1,67 @@
+import asyncio
+
+import pytest
+
+from tests.fake_discord import FakeDiscord, make_cog
+
+
+def _event(kind, action, number, name, sender="bulkbot"):
+    item = {
+        "number": number,
+        "title": f"Item {number}",
+        "html_url": f"https://github.com/acme/widgets/{'issues' if kind == 'issue' else 'pull'}/{number}",
+        "user": {"login": "octocat"},
+        "state": "open",
+        "labels": [],
+        "assignee": {"login": name, "html_url": f"https://github.com/{name}"} if "assign" in action else None,
+    }
+    data = {"action": action, kind: item, "repository": {"full_name": "acme/widgets"}, "sender": {"login": sender}}
+    if "label" in action:
+        data["label"] = {"name": name}
+    return data
+
+
+@pytest.mark.asyncio
+async def test_label_storms_become_one_summary_while_other_lines_pass_through():
+    cog = make_cog(FakeDiscord(rate_limits=False), log_batch_seconds=60)
+    handlers = cog.handlers
+    log_channel = cog.bot.get_channel(await cog.config.log_channel_id())
+
+    for number in range(1, 13):
+        await handlers.handle_issue(_event("issue", "labeled", number, "bug"), "acme/widgets")
+    await handlers.handle_issue(_event("issue", "assigned", 3, "alice"), "acme/widgets")
+    await handlers.handle_pull_request(_event("pull_request", "labeled", 20, "bug"), "acme/widgets")
+    await handlers.handle_issue(_event("issue", "closed", 1, ""), "acme/widgets")
+
+    # Only the high-priority line has been posted so far
+    assert [m.content for m in log_channel.messages if "📌" in m.content] == []
+    assert any("Issue Closed" in m.content for m in log_channel.messages)
+
+    before = len(log_channel.messages)
+    await handlers.log_batcher.flush()
+    summary = log_channel.messages[before:]
+    assert len(summary) == 1
+    lines = summary[0].content.split("\n")
+    assert lines[0].startswith("🏷️ 📌 **12 issues labeled** `bug` by **bulkbot** in `widgets`: [#1](<https://github.com/acme/widgets/issues/1>)")
+    assert lines[0].endswith("+2 more")
+    # Groups of one keep their usual line
+    assert "Issue Assigned" in lines[1] and "alice" in lines[1]
+    assert "PR Labeled" in lines[2]
+    assert handlers.log_batcher.pending == {}
+
+
+@pytest.mark.asyncio
+async def test_log_batch_window_flushes_on_its_own():
+    cog = make_cog(FakeDiscord(rate_limits=False), log_batch_seconds=0)
+    handlers = cog.handlers
+    log_channel = cog.bot.get_channel(await cog.config.log_channel_id())
+
+    # Disabled: each line goes straight out
+    await handlers.handle_issue(_event("issue", "labeled", 1, "bug"), "acme/widgets")
+    assert "Issue Labeled" in log_channel.messages[-1].content
+
+    cog.config._store["log_batch_seconds"] = 1
+    for number in (2, 3):
+        await handlers.handle_issue(_event("issue", "unlabeled", number, "bug"), "acme/widgets")
+    await asyncio.wait_for(handlers.log_batcher.pending["acme/widgets"]["task"], 3)
+    assert "**2 issues unlabeled** `bug`" in log_channel.messages[-1].content
@@ -0,0 +1,35 @@
+import json
+
+from benchmarks.markdown_bench import compare, load_corpus, main, run
+
+
+def test_corpus_covers_the_bot_formats():
+    corpus = load_corpus()
+    for case in ("coderabbit_walkthrough", "deepsource_report", "kilo_pipe_table", "greptile_summary", "issue_template_large"):
+        assert corpus.get(case)
+
+
+def test_run_reports_time_and_allocations():
+    results = run(["format_comment_preview"], ["human_comment"], min_time=0.001, repeats=1)
+    row = results["format_comment_preview"]["human_comment"]
+    assert row["us_per_op"] > 0 and row["peak_kib"] >= 0 and row["bytes"] > 0
+
+
+def test_compare_gates_on_function_totals_unless_per_case():
+    baseline = {"f": {"a": {"us_per_op": 100.0}, "b": {"us_per_op": 100.0}}}
+    noisy_case = {"f": {"a": {"us_per_op": 130.0}, "b": {"us_per_op": 80.0}}}
+    slower = {"f": {"a": {"us_per_op": 130.0}, "b": {"us_per_op": 120.0}}}
+
+    assert compare(baseline, noisy_case, 15)[1] == []
+    assert [r[1] for r in compare(baseline, noisy_case, 15, per_case=True)[1]] == ["a"]
+    assert [r[1] for r in compare(baseline, slower, 15)[1]] == ["TOTAL"]
+
+
+def test_compare_mode_exit_code(tmp_path):
+    baseline = tmp_path / "baseline.json"
+    args = ["-f", "summarize_bot_body", "-c", "human_comment", "--min-time", "0.001", "--repeats", "1"]
+    assert main(args + ["--save", str(baseline)]) == 0
+    saved = json.loads(baseline.read_text())
+    saved["summarize_bot_body"]["human_comment"]["us_per_op"] /= 10  # pretend it used to be 10x faster
+    baseline.write_text(json.dumps(saved))
+    assert main(args + ["--compare", str(baseline)]) == 1
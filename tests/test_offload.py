@@ -0,0 +1,77 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from GenHub.handlers import GitHubEventHandlers
+from GenHub.metrics import metrics
+from GenHub.offload import MAX_WORKERS, PayloadOffloader
+from GenHub.utils import create_comment_embed
+from GenHub.webhook import WebhookServer
+
+
+def _offloader(cog, threshold_kb=0):
+    offloader = PayloadOffloader(cog)
+    offloader.configure(1, threshold_kb)
+    # Stand-in for the spawn pool: same executor interface, but workers can't import Red here
+    offloader._pool = ThreadPoolExecutor(max_workers=1)
+    return offloader
+
+
+def test_configure_bounds_workers_and_disables_at_zero():
+    offloader = PayloadOffloader(Mock())
+    offloader.configure(64, 16)
+    assert 1 <= offloader.workers <= MAX_WORKERS
+    assert offloader.threshold == 16 * 1024
+    assert offloader.should_offload(16 * 1024) and not offloader.should_offload(100)
+
+    offloader.configure(0)
+    assert not offloader.should_offload(10 ** 9)
+
+
+@pytest.mark.asyncio
+async def test_webhook_decodes_large_bodies_in_the_pool():
+    cog = Mock()
+    cog.config.github_secret = AsyncMock(return_value="")
+    cog.handlers.process_payload = AsyncMock()
+    cog.offloader = _offloader(cog)
+    before = metrics.value("genhub_offloaded_tasks_total", kind="parse")
+
+    req = Mock()
+    req.headers = {"X-GitHub-Event": "issues"}
+    req.read = AsyncMock(return_value=json.dumps({"action": "opened", "issue": {"number": 1}}).encode())
+    resp = await WebhookServer(cog).webhook_handler(req)
+
+    assert resp.status == 200
+    assert cog.handlers.process_payload.await_args.args[1]["issue"]["number"] == 1
+    assert metrics.value("genhub_offloaded_tasks_total", kind="parse") == before + 1
+    assert "# TYPE genhub_offloaded_tasks_total counter" in metrics.render()
+
+    req.read = AsyncMock(return_value=b"{not json")
+    assert (await WebhookServer(cog).webhook_handler(req)).status == 400
+    cog.offloader.close()
+
+
+@pytest.mark.asyncio
+async def test_comment_embed_matches_in_process_render_and_survives_broken_pool():
+    cog = Mock()
+    handlers = GitHubEventHandlers(cog)
+    kwargs = dict(
+        author="octocat", body="## Summary\n\n" + "Looks **good**. " * 300, url="https://github.com/o/r/pull/1#c",
+        is_bot=False, is_review=True, created_at="2024-01-01T00:00:00Z", repo="o/r",
+    )
+    expected = create_comment_embed(**kwargs)
+
+    # Mock cogs (no real offloader) keep rendering in-process
+    assert (await handlers._comment_embed(**kwargs)).description == expected.description
+
+    cog.offloader = _offloader(cog)
+    embed = await handlers._comment_embed(**kwargs)
+    assert embed.to_dict() == expected.to_dict()
+
+    cog.offloader._pool = Mock(submit=Mock(side_effect=BrokenProcessPool("worker died")))
+    embed = await handlers._comment_embed(**kwargs)
+    assert embed.description == expected.description
+    assert cog.offloader._pool is None
@@ -160,3 +160,213 @@ async def test_reconcile_creates_missing_thread():
 
     # Assert that send_message was NOT called since initial content was used
     mock_send.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_reconcile_budget_keeps_small_repo_from_starving():
+    from GenHub.handlers import ReconcileBudget
+
+    budget = ReconcileBudget(limit=2, per_repo=1)
+    started = []
+
+    async def work(repo, n):
+        async with budget.slot(repo):
+            started.append((repo, n))
+            await asyncio.sleep(0.01)
+
+    big = [work("big/repo", i) for i in range(20)]
+    small = [work("small/repo", i) for i in range(2)]
+    await asyncio.gather(*big, *small)
+
+    # The small repo finishes within the first few slots, not after the 20 big items
+    small_positions = [i for i, (repo, _) in enumerate(started) if repo == "small/repo"]
+    assert max(small_positions) <= 4
+
+
+@pytest.mark.asyncio
+async def test_reconcile_runs_repos_and_kinds_concurrently():
+    cog = Mock()
+    cog.config = Mock()
+    cog.config.allowed_repos = AsyncMock(return_value=["a/one", "b/two"])
+    cog.config.github_token = AsyncMock(return_value="")
+    handler = GitHubEventHandlers(cog)
+    handler.log_info = AsyncMock()
+    handler.log_debug = AsyncMock()
+    handler.log_error = AsyncMock()
+    handler._check_reconcile_repo = AsyncMock(return_value=True)
+
+    running = set()
+    peak = 0
+
+    async def fake_items(session, repo, repo_name, is_pr, ctx, since=None, budget=None, **kwargs):
+        nonlocal peak
+        running.add((repo, is_pr))
+        peak = max(peak, len(running))
+        await asyncio.sleep(0.01)
+        running.discard((repo, is_pr))
+
+    handler._reconcile_repo_items = fake_items
+    with patch("GenHub.handlers.aiohttp.ClientSession", return_value=make_fake_session()):
+        await handler.reconcile_forum_tags()
+
+    assert peak == 4
+    assert handler.is_reconciling is False
+
+
+def make_fake_session():
+    class FakeSession:
+        async def __aenter__(self): return self
+        async def __aexit__(self, *a): return False
+    return FakeSession()
+
+
+def make_checkpoint_handler(pages):
+    cog = Mock()
+    cog.config = Mock()
+    cog.config.issues_forum_id = AsyncMock(return_value=123)
+    cog.config.github_token = AsyncMock(return_value="")
+    cog.config.reconcile_checkpoint = AsyncMock(return_value={})
+    cog.config.reconcile_checkpoint.set = AsyncMock()
+    handler = GitHubEventHandlers(cog)
+    handler.log_info = AsyncMock()
+    handler.log_debug = AsyncMock()
+    handler.log_error = AsyncMock()
+    handler._resolve_target_channel = AsyncMock(side_effect=lambda forum_id: Mock(name="forum") if forum_id else None)
+    handler._find_orphaned_threads = AsyncMock(return_value=[])
+    handler._plan_item = AsyncMock(side_effect=lambda session, forum, repo, item, is_pr: {
+        "number": item["number"], "create": False, "retag": False, "send_initial": False, "comments": [],
+    })
+    handler._apply_item = AsyncMock()
+    requested = []
+
+    async def fake_request(session, url):
+        page = int(url.split("&page=")[1].split("&")[0])
+        requested.append(page)
+        return 200, pages.get(page, [])
+
+    handler._make_github_request = fake_request
+    return handler, requested
+
+
+def issue_page(start, count):
+    return [{"number": n, "state": "open"} for n in range(start, start + count)]
+
+
+@pytest.mark.asyncio
+async def test_reconcile_resume_skips_completed_pages_and_synced_items():
+    pages = {1: issue_page(1, 100), 2: issue_page(101, 3)}
+    handler, requested = make_checkpoint_handler(pages)
+    handler._checkpoint = {
+        "repo_filter": None, "since": None, "started_at": 0,
+        "jobs": {"owner/repo:issues": {"repo": "owner/repo", "kind": "issues", "last_page": 1,
+                                        "synced": list(range(1, 102)), "done": False}},
+    }
+
+    await handler._reconcile_repo_items(object(), "owner/repo", "repo", False, None)
+
+    assert requested == [2]
+    done = sorted(c.args[2]["number"] for c in handler._apply_item.await_args_list)
+    assert done == [102, 103]
+    job = handler._checkpoint["jobs"]["owner/repo:issues"]
+    assert job["done"] is True and job["last_page"] == 2
+    # Resumed runs never saw page 1 in this pass, so orphan cleanup must not run
+    handler._find_orphaned_threads.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_reconcile_cancel_keeps_checkpoint_and_completion_clears_it():
+    pages = {1: issue_page(1, 5)}
+    handler, _ = make_checkpoint_handler(pages)
+    handler.cog.config.allowed_repos = AsyncMock(return_value=["owner/repo"])
+    handler.cog.config.prs_forum_id = AsyncMock(return_value=None)
+    handler._check_reconcile_repo = AsyncMock(return_value=True)
+
+    async def cancel_after_two(forum, repo, plan, pacer):
+        if plan["number"] == 2:
+            handler.reconcile_cancelled = True
+
+    handler._apply_item = AsyncMock(side_effect=cancel_after_two)
+    with patch("GenHub.handlers.aiohttp.ClientSession", return_value=make_fake_session()):
+        await handler.reconcile_forum_tags(None)
+
+    saved = handler.cog.config.reconcile_checkpoint.set.await_args.args[0]
+    assert saved["jobs"]["owner/repo:issues"]["synced"] == [1, 2]
+    assert saved["jobs"]["owner/repo:issues"]["done"] is False
+
+    handler.cog.config.reconcile_checkpoint = AsyncMock(return_value=saved)
+    handler.cog.config.reconcile_checkpoint.set = AsyncMock()
+    handler._apply_item = AsyncMock()
+    with patch("GenHub.handlers.aiohttp.ClientSession", return_value=make_fake_session()):
+        await handler.reconcile_forum_tags(None, resume=True)
+
+    assert sorted(c.args[2]["number"] for c in handler._apply_item.await_args_list) == [3, 4, 5]
+    handler.cog.config.reconcile_checkpoint.set.assert_awaited_with({})
+
+
+@pytest.mark.asyncio
+async def test_reconcile_dry_run_reports_plan_without_writing():
+    pages = {1: [
+        {"number": 1, "title": "New", "html_url": "https://github.com/owner/repo/issues/1", "state": "open", "user": {"login": "a"}},
+        {"number": 2, "title": "Old", "html_url": "https://github.com/owner/repo/issues/2", "state": "open", "user": {"login": "b"}},
+    ]}
+    handler, _ = make_checkpoint_handler(pages)
+    del handler._plan_item, handler._apply_item
+    handler.cog.config.allowed_repos = AsyncMock(return_value=["owner/repo"])
+    handler.cog.config.prs_forum_id = AsyncMock(return_value=None)
+    handler._check_reconcile_repo = AsyncMock(return_value=True)
+    handler._fetch_comments = AsyncMock(return_value=[
+        {"html_url": "https://github.com/owner/repo/issues/1#issuecomment-9", "user": {"login": "c"}, "body": "hi"},
+    ])
+    handler._find_orphaned_threads = AsyncMock(return_value=[(7, Mock())])
+    handler.cog.thread_cache = {}
+
+    forum = Mock(id=123, available_tags=[], create_tag=AsyncMock())
+    handler._resolve_target_channel = AsyncMock(side_effect=lambda forum_id: forum if forum_id else None)
+
+    existing = Mock(archived=False, applied_tags=[], edit=AsyncMock())
+
+    async def history(limit=None, oldest_first=False):
+        yield Mock(content="🆕 Issue created", embeds=[])
+
+    existing.history = history
+
+    async def fake_find_thread(bot, forum_id, repo, number, cache):
+        return existing if number == 2 else None
+
+    ctx = Mock()
+    ctx.send = AsyncMock()
+    with patch("GenHub.handlers.aiohttp.ClientSession", return_value=make_fake_session()), \
+         patch("GenHub.handlers.find_thread", side_effect=fake_find_thread), \
+         patch("GenHub.handlers.get_or_create_thread", new_callable=AsyncMock) as create:
+        totals = await handler.reconcile_forum_tags(ctx, dry_run=True)
+
+    assert totals == {
+        "threads_to_create": 1,
+        "tags_to_change": 1,
+        "initial_messages": 0,
+        "comments_to_post": 2,
+        "orphans_to_delete": 1,
+    }
+    create.assert_not_awaited()
+    forum.create_tag.assert_not_awaited()
+    existing.edit.assert_not_awaited()
+    assert "dry run" in ctx.send.await_args.args[0]
+    handler.cog.config.reconcile_checkpoint.set.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_reconcile_refuses_while_another_run_is_active():
+    handler, _ = make_checkpoint_handler({1: issue_page(1, 2)})
+    live = {"repo_filter": None, "since": None, "started_at": 1.0, "jobs": {}}
+    handler._checkpoint = live
+    handler.is_reconciling = True
+
+    ctx = Mock()
+    ctx.send = AsyncMock()
+    for kwargs in ({"dry_run": True}, {}):
+        assert await handler.reconcile_forum_tags(ctx, **kwargs) is None
+        assert "already running" in ctx.send.await_args.args[0]
+    # The running reconcile keeps its checkpoint and state
+    assert handler._checkpoint is live
+    assert handler.is_reconciling and not handler.reconcile_cancelled
+    handler.cog.config.reconcile_checkpoint.set.assert_not_awaited()
@@ -1,6 +1,7 @@
 import pytest
 from unittest.mock import AsyncMock, Mock, patch
 from GenHub.handlers import GitHubEventHandlers
+from tests.fake_discord import FakeStore
 
 
 @pytest.mark.asyncio
@@ -93,3 +94,65 @@ async def test_pull_request_review_comment_flushes_message():
         await task
         mock_send.assert_awaited()
 
+
+@pytest.mark.asyncio
+async def test_pending_reviews_persist_and_restore_after_reload():
+    store = FakeStore()
+    cog = Mock()
+    cog.config = Mock()
+    cog.config.prs_forum_id = AsyncMock(return_value=123)
+    cog.config.pending_reviews = store
+    cog.bot = Mock()
+    forum = Mock()
+    forum.available_tags = []
+    forum.create_tag = AsyncMock()
+    cog.bot.get_channel = Mock(return_value=forum)
+
+    data = {
+        "action": "submitted",
+        "pull_request": {"number": 7, "title": "Add cache", "html_url": "http://url/pr/7", "body": "x" * 5000},
+        "review": {
+            "id": 55,
+            "body": "Needs a test",
+            "state": "commented",
+            "user": {"login": "reviewer"},
+            "html_url": "http://url/review/55",
+        },
+    }
+
+    old = GitHubEventHandlers(cog)
+    await old.handle_pull_request_review(data, "owner/repo")
+    # Simulate a reload before the debounce fires
+    await old.suspend_pending_reviews()
+
+    assert len(store.value) == 1
+    saved = next(iter(store.value.values()))
+    assert "task" not in saved
+    assert saved["body"] == "Needs a test"
+    assert "body" not in saved["data"]["pull_request"]
+
+    mock_thread = AsyncMock()
+    async def fake_get_or_create_thread(*a, **k): return mock_thread, False
+
+    new = GitHubEventHandlers(cog)
+    with (
+        patch("GenHub.handlers.send_message", new_callable=AsyncMock) as mock_send,
+        patch("GenHub.handlers.get_or_create_thread", side_effect=fake_get_or_create_thread),
+        patch("GenHub.handlers.REVIEW_FLUSH_DELAY", 0),
+    ):
+        assert await new.restore_pending_reviews() == 1
+        await new.pending_reviews[("owner/repo", 7, 55)]["task"]
+        mock_send.assert_awaited()
+
+    assert new.pending_reviews == {}
+    assert store.value == {}
+
+
+@pytest.mark.asyncio
+async def test_restore_pending_reviews_ignores_malformed_entries():
+    cog = Mock()
+    cog.config = Mock()
+    cog.config.pending_reviews = FakeStore({"not-json": {}, '["only", 2]': {}})
+    handler = GitHubEventHandlers(cog)
+    assert await handler.restore_pending_reviews() == 0
+    assert handler.pending_reviews == {}
@@ -0,0 +1,94 @@
+import hashlib
+import hmac
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from GenHub.config_commands import ConfigCommands
+from GenHub.routing import RouteTable
+from GenHub.webhook import WebhookServer
+from tests.fake_discord import FakeDiscord, make_cog
+
+
+def _routed_cog():
+    cog = make_cog(FakeDiscord(rate_limits=False), repos=("acme/widgets", "other/gadgets"), secret="global")
+    forum = cog.bot.add_forum("other-issues")
+    cog.config._store["route_profiles"] = {
+        "other": {"repos": ["Other/Gadgets"], "secret": "other-secret", "issues_forum_id": forum.id},
+    }
+    cog.routes = RouteTable(cog)
+    return cog, forum
+
+
+def _delivery(repo, key, number=1):
+    body = json.dumps({
+        "action": "opened",
+        "issue": {"number": number, "title": "Broken", "html_url": f"https://github.com/{repo}/issues/{number}", "user": {"login": "octocat"}, "labels": []},
+        "repository": {"full_name": repo},
+        "sender": {"login": "octocat"},
+    }).encode()
+    req = Mock()
+    req.headers = {
+        "X-GitHub-Event": "issues",
+        "X-Hub-Signature-256": "sha256=" + hmac.new(key, body, hashlib.sha256).hexdigest(),
+    }
+    req.read = AsyncMock(return_value=body)
+    return req
+
+
+@pytest.mark.asyncio
+async def test_route_table_resolves_profiles_by_repo():
+    cog, forum = _routed_cog()
+    await cog.routes.load()
+    assert cog.routes.profile_name("other/gadgets") == "other"
+    assert cog.routes.get("OTHER/GADGETS", "issues_forum_id") == forum.id
+    assert cog.routes.get("other/gadgets", "prs_forum_id") is None
+    assert cog.routes.get("acme/widgets", "issues_forum_id") is None
+    assert cog.routes.secret_for("other/gadgets") == b"other-secret"
+    assert cog.routes.forum_ids() == [forum.id]
+
+
+@pytest.mark.asyncio
+async def test_deliveries_use_their_route_secret_and_forum():
+    cog, forum = _routed_cog()
+    await cog.routes.load()
+    server = WebhookServer(cog)
+    global_forum = cog.bot.get_channel(await cog.config.issues_forum_id())
+
+    assert (await server.webhook_handler(_delivery("other/gadgets", b"other-secret"))).status == 200
+    assert [t.name for t in forum.threads] == ["[GH] [#1] Broken"]
+
+    assert (await server.webhook_handler(_delivery("acme/widgets", b"global", 2))).status == 200
+    assert [t.name for t in global_forum.threads] == ["[GH] [#2] Broken"]
+
+    # Each repo must be signed with its own route's secret, not just any configured one
+    assert (await server.webhook_handler(_delivery("other/gadgets", b"global", 3))).status == 401
+    assert (await server.webhook_handler(_delivery("acme/widgets", b"other-secret", 4))).status == 401
+    assert len(forum.threads) == 1 and len(global_forum.threads) == 1
+
+
+@pytest.mark.asyncio
+async def test_route_commands_edit_profiles_and_reload():
+    cog, forum = _routed_cog()
+    cmd = ConfigCommands(SimpleNamespace(config=cog.config, routes=cog.routes))
+    ctx = Mock(send=AsyncMock(), guild=None)
+
+    await cmd.route_repo(ctx, "acme", "acme/tools")
+    assert "acme/tools" in await cog.config.allowed_repos()
+    await cmd.route_repo(ctx, "acme", "other/gadgets")
+    assert "already routed by profile **other**" in ctx.send.await_args.args[0]
+
+    await cmd.route_set(ctx, "acme", "prs_forum", value=f"<#{forum.id}>")
+    await cmd.route_set(ctx, "acme", "secret", value="s3")
+    assert cog.routes.get("acme/tools", "prs_forum_id") == forum.id
+    assert cog.routes.secret_for("acme/tools") == b"s3"
+    await cmd.route_set(ctx, "acme", "colour", value="1")
+    assert "Unknown setting" in ctx.send.await_args.args[0]
+
+    await cmd.route(ctx)
+    assert "🔒 own webhook secret" in ctx.send.await_args.args[0]
+
+    await cmd.route_remove(ctx, "acme")
+    assert cog.routes.profile_name("acme/tools") is None
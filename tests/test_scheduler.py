@@ -0,0 +1,113 @@
+import pytest
+import time
+from unittest.mock import AsyncMock, Mock
+from GenHub.scheduler import ReconcileScheduler
+from GenHub.handlers import RateLimiter
+
+
+def make_cog(minutes=60, repos=("owner/repo",)):
+    cog = Mock()
+    cog.config = Mock()
+    cog.config.allowed_repos = AsyncMock(return_value=list(repos))
+    cog.config.auto_reconcile_minutes = AsyncMock(return_value=minutes)
+    cog.config.auto_reconcile_repo_minutes = AsyncMock(return_value={})
+    cog.config.auto_reconcile_jitter = AsyncMock(return_value=0.0)
+    cog.config.auto_reconcile_quiet_minutes = AsyncMock(return_value=10)
+    cog.config.auto_reconcile_min_ratelimit = AsyncMock(return_value=500)
+    cog.config.reconcile_schedule = AsyncMock(return_value={})
+    cog.config.reconcile_schedule.set = AsyncMock()
+    cog.handlers = Mock()
+    cog.handlers.is_reconciling = False
+    cog.handlers.reconcile_cancelled = False
+    cog.handlers.last_webhook_at = {}
+    cog.handlers.rate_limiter = RateLimiter()
+    cog.handlers.reconcile_forum_tags = AsyncMock()
+    return cog
+
+
+@pytest.mark.asyncio
+async def test_due_repo_runs_full_then_incremental():
+    cog = make_cog()
+    sched = ReconcileScheduler(cog)
+    now = time.time()
+    await sched.tick(now)
+    # First run is spread across the interval, force it due
+    sched.next_run["owner/repo"] = now - 1
+    await sched.tick(now)
+
+    cog.handlers.reconcile_forum_tags.assert_awaited_once_with(None, repo_filter="owner/repo", since=None, checkpoint=False)
+    assert sched.last_run["owner/repo"]["status"] == "ok"
+    assert sched.next_run["owner/repo"] > now
+    cog.config.reconcile_schedule.set.assert_awaited()
+
+    sched.next_run["owner/repo"] = time.time() - 1
+    await sched.tick()
+    since = cog.handlers.reconcile_forum_tags.await_args.kwargs["since"]
+    assert since and since.endswith("Z")
+
+
+@pytest.mark.asyncio
+async def test_recent_webhook_skips_repo():
+    cog = make_cog()
+    sched = ReconcileScheduler(cog)
+    now = time.time()
+    cog.handlers.last_webhook_at["owner/repo"] = now - 30
+    sched.next_run["owner/repo"] = now - 1
+    await sched.tick(now)
+
+    cog.handlers.reconcile_forum_tags.assert_not_awaited()
+    assert sched.last_run["owner/repo"]["status"].startswith("skipped")
+    assert sched.next_run["owner/repo"] >= now - 30 + 600
+
+
+@pytest.mark.asyncio
+async def test_low_rate_limit_defers_until_reset():
+    cog = make_cog()
+    sched = ReconcileScheduler(cog)
+    now = time.time()
+    cog.handlers.rate_limiter.remaining = 50
+    cog.handlers.rate_limiter.reset_time = now + 900
+    sched.next_run["owner/repo"] = now - 1
+    await sched.tick(now)
+
+    cog.handlers.reconcile_forum_tags.assert_not_awaited()
+    assert sched.next_run["owner/repo"] >= now + 900
+
+
+@pytest.mark.asyncio
+async def test_zero_interval_disables_scheduling():
+    cog = make_cog(minutes=0, repos=("a/b", "c/d"))
+    cog.config.auto_reconcile_repo_minutes = AsyncMock(return_value={"c/d": 30})
+    sched = ReconcileScheduler(cog)
+    await sched.tick()
+    assert "a/b" not in sched.next_run
+    assert "c/d" in sched.next_run
+
+
+@pytest.mark.asyncio
+async def test_scheduled_run_reconciles_unnormalized_allowed_repo():
+    from unittest.mock import patch
+    from GenHub.handlers import GitHubEventHandlers
+
+    cog = make_cog(repos=(" /owner/repo",))
+    cog.config.github_token = AsyncMock(return_value="")
+    handlers = cog.handlers = GitHubEventHandlers(cog)
+    handlers.log_info = handlers.log_debug = handlers.log_error = AsyncMock()
+    handlers._check_reconcile_repo = AsyncMock(return_value=True)
+    handlers._reconcile_repo_items = AsyncMock(return_value=None)
+
+    sched = ReconcileScheduler(cog)
+    now = time.time()
+    await sched.tick(now)
+    sched.next_run["owner/repo"] = now - 1
+
+    class FakeSession:
+        async def __aenter__(self): return self
+        async def __aexit__(self, *a): return False
+
+    with patch("GenHub.handlers.aiohttp.ClientSession", return_value=FakeSession()):
+        await sched.tick(now)
+
+    # The scheduler passes the cleaned name; the stored " /owner/repo" entry must still match it
+    assert [c.args[1] for c in handlers._reconcile_repo_items.await_args_list] == ["owner/repo", "owner/repo"]
+    assert sched.last_run["owner/repo"]["status"] == "ok"
@@ -0,0 +1,86 @@
+import hashlib
+import hmac
+import json
+
+import aiohttp
+import pytest
+
+from benchmarks.webhook_load import _free_port
+from GenHub import spool as spool_module
+from GenHub.ingest import IngestServer
+from GenHub.spool import Spool, SpoolConsumer
+from GenHub.webhook import WebhookServer
+from tests.fake_discord import FakeDiscord, make_cog
+
+
+def _issue(number):
+    return json.dumps({
+        "action": "opened",
+        "issue": {"number": number, "title": f"Bug {number}", "html_url": f"https://github.com/acme/widgets/issues/{number}", "user": {"login": "octocat"}, "labels": []},
+        "repository": {"full_name": "acme/widgets"},
+        "sender": {"login": "octocat"},
+    }).encode()
+
+
+def test_spool_checkpoint_and_dedupe_survive_reopen(tmp_path):
+    path = str(tmp_path / "spool.db")
+    spool = Spool(path)
+    first = spool.append("d-1", "issues", b"{}")
+    spool.append("d-2", "issues", b"{}")
+    spool.commit(first, "d-1")
+    spool.close()
+
+    spool = Spool(path)
+    assert spool.offset() == first
+    assert [row[1] for row in spool.read(spool.offset())] == ["d-2"]
+    assert spool.is_processed("d-1") and not spool.is_processed("d-2")
+    assert spool.backlog(spool.offset()) == 1
+    assert spool.prune(before=float("inf")) == 1  # only consumed rows go
+    spool.close()
+
+
+@pytest.mark.asyncio
+async def test_ingest_spools_verified_deliveries_and_cog_consumes_them_once(tmp_path, monkeypatch):
+    monkeypatch.setattr(spool_module, "RETRY_DELAY", 0)
+    path = str(tmp_path / "spool.db")
+    port = _free_port()
+    ingest = IngestServer(Spool(path), {"webhook_host": "127.0.0.1", "webhook_port": port, "github_secret": "s"})
+    await ingest.start()
+
+    async def post(http, delivery_id, body, key=b"s"):
+        headers = {
+            "X-GitHub-Event": "issues",
+            "X-GitHub-Delivery": delivery_id,
+            "X-Hub-Signature-256": "sha256=" + hmac.new(key, body, hashlib.sha256).hexdigest(),
+        }
+        async with http.post(f"http://127.0.0.1:{port}/github", data=body, headers=headers) as resp:
+            return resp.status
+
+    try:
+        async with aiohttp.ClientSession() as http:
+            assert await post(http, "d-1", _issue(1)) == 202
+            assert await post(http, "d-2", _issue(2)) == 202
+            assert await post(http, "d-1", _issue(1)) == 202  # GitHub redelivery
+            assert await post(http, "d-3", _issue(3), key=b"wrong") == 401
+    finally:
+        await ingest.stop()
+        ingest.spool.close()
+
+    cog = make_cog(FakeDiscord(rate_limits=False), spool_path=path)
+    cog.webhook = WebhookServer(cog)
+    consumer = SpoolConsumer(cog)
+    await consumer.start()
+    consumer.task.cancel()  # drive it by hand
+    assert await consumer.consume_once() == 3
+
+    forum = cog.bot.get_channel(await cog.config.issues_forum_id())
+    assert sorted(t.name for t in forum.threads) == ["[GH] [#1] Bug 1", "[GH] [#2] Bug 2"]
+    assert (consumer.consumed, consumer.duplicates, consumer.offset) == (2, 1, 3)
+    await consumer.stop()
+
+    # A restarted consumer resumes after the checkpoint
+    restarted = SpoolConsumer(cog)
+    await restarted.start()
+    restarted.task.cancel()
+    assert restarted.offset == 3 and await restarted.consume_once() == 0
+    await restarted.stop()
@@ -0,0 +1,115 @@
+import asyncio
+import hashlib
+import hmac
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock
+
+import discord
+import pytest
+
+from GenHub.genhub import GenHub
+from GenHub.webhook import WebhookServer
+from tests.fake_discord import FakeConfig, FakeDiscord, make_cog
+
+
+@pytest.mark.asyncio
+async def test_slash_sync_skips_guilds_whose_commands_are_unchanged():
+    tree = discord.app_commands.CommandTree(discord.Client(intents=discord.Intents.none()))
+    tree.sync = AsyncMock()
+    guilds = [SimpleNamespace(id=i, name=f"Guild {i}") for i in (1, 2, 3)]
+    cog = SimpleNamespace(bot=SimpleNamespace(tree=tree, guilds=guilds), config=FakeConfig({"slash_sync_hashes": {}}))
+
+    async def ping(interaction: discord.Interaction):
+        pass
+
+    await GenHub.sync_slash_commands(cog)
+    assert tree.sync.await_count == 3
+    assert set(await cog.config.slash_sync_hashes()) == {"1", "2", "3"}
+
+    tree.sync.reset_mock()
+    await GenHub.sync_slash_commands(cog)
+    tree.sync.assert_not_awaited()
+
+    # Only the guild whose command set changed is synced again
+    tree.add_command(discord.app_commands.Command(name="ping", description="Ping", callback=ping), guild=discord.Object(2))
+    await GenHub.sync_slash_commands(cog)
+    assert [c.kwargs["guild"].id for c in tree.sync.await_args_list] == [2]
+
+
+@pytest.mark.asyncio
+async def test_slash_sync_skips_unchanged_tree_when_to_dict_takes_no_tree(monkeypatch):
+    # discord.py versions before translations serialize commands with a bare to_dict()
+    monkeypatch.setattr(discord.app_commands.Command, "to_dict", lambda self: {"name": self.name, "description": self.description})
+    tree = discord.app_commands.CommandTree(discord.Client(intents=discord.Intents.none()))
+    tree.sync = AsyncMock()
+
+    async def ping(interaction: discord.Interaction):
+        pass
+
+    tree.add_command(discord.app_commands.Command(name="ping", description="Ping", callback=ping), guild=discord.Object(1))
+    cog = SimpleNamespace(bot=SimpleNamespace(tree=tree, guilds=[SimpleNamespace(id=1, name="Guild 1")]), config=FakeConfig({"slash_sync_hashes": {}}))
+
+    await GenHub.sync_slash_commands(cog)
+    tree.sync.assert_awaited_once()
+    tree.sync.reset_mock()
+    await GenHub.sync_slash_commands(cog)
+    tree.sync.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_deliveries_wait_for_warmup_and_health_reports_warming():
+    cog = make_cog(FakeDiscord(rate_limits=False), secret="s")
+    cog.warm = asyncio.Event()
+    server = WebhookServer(cog)
+    assert server.warming
+
+    body = json.dumps({
+        "action": "opened",
+        "issue": {"number": 1, "title": "Bug", "html_url": "https://github.com/acme/widgets/issues/1", "user": {"login": "octocat"}, "labels": []},
+        "repository": {"full_name": "acme/widgets"},
+        "sender": {"login": "octocat"},
+    }).encode()
+    req = Mock()
+    req.headers = {"X-GitHub-Event": "issues", "X-Hub-Signature-256": "sha256=" + hmac.new(b"s", body, hashlib.sha256).hexdigest()}
+    req.read = AsyncMock(return_value=body)
+    delivery = asyncio.create_task(server.webhook_handler(req))
+    await asyncio.sleep(0.01)
+    assert not delivery.done()
+
+    # Warmup pre-creates the status tags so the first delivery doesn't have to
+    await cog.handlers.warm_forum_tags()
+    prs = cog.bot.get_channel(await cog.config.prs_forum_id())
+    assert sorted(t.name for t in prs.available_tags) == ["Active", "Closed", "Merged", "Open"]
+
+    cog.warm.set()
+    assert (await delivery).status == 200
+    assert not server.warming
+
+
+@pytest.mark.asyncio
+async def test_unload_during_warmup_keeps_saved_caches():
+    from tests.fake_discord import FakeBot, genhub_defaults
+
+    saved_reviews = {json.dumps(["acme/widgets", 7, "review"]): {"comments": [], "data": {}}}
+    cog = GenHub(FakeBot())
+    cog.config = FakeConfig({**genhub_defaults(), "thread_cache": {"(1, 'acme/widgets', 3)": 33}, "pending_reviews": saved_reviews})
+    cog.warm = asyncio.Event()
+
+    # Unloaded before warmup got to read anything back
+    cog.startup_task = asyncio.create_task(cog.warm_up())
+    await cog.cog_unload()
+    assert await cog.config.thread_cache() == {"(1, 'acme/widgets', 3)": 33}
+    assert await cog.config.pending_reviews() == saved_reviews
+
+    # Once warmup has loaded them (reviews before deliveries are released), unload writes them back
+    cog = GenHub(FakeBot())
+    cog.config = FakeConfig({**genhub_defaults(), "thread_cache": {}, "pending_reviews": saved_reviews})
+    cog.warm = asyncio.Event()
+    cog.startup_task = asyncio.create_task(cog.warm_up())
+    await cog.warm.wait()
+    assert cog.handlers.pending_reviews
+    await cog.startup_task
+    cog.thread_cache[(1, "acme/widgets", 4)] = 44
+    await cog.cog_unload()
+    assert await cog.config.thread_cache() == {"(1, 'acme/widgets', 4)": 44}
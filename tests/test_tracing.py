@@ -0,0 +1,144 @@
+import asyncio
+import hashlib
+import hmac
+import json
+
+import pytest
+from unittest.mock import AsyncMock, Mock
+
+from GenHub.tracing import Tracer, traced, tracer, render_trace
+from GenHub.webhook import WebhookServer
+
+
+@pytest.mark.asyncio
+async def test_spans_nest_under_the_delivery_and_outside_calls_are_untraced():
+    local = Tracer(capacity=2)
+
+    @traced("inner_step")
+    async def inner():
+        async with local.span("github", path="/repos/o/r"):
+            pass
+
+    await inner()  # no active delivery: nothing recorded, nothing raised
+
+    with local.trace("abc-123", "issues.opened") as trace:
+        async with local.span("handle_issues"):
+            await inner()
+
+    assert local.get("abc-123") is trace
+    names = [(s["name"], s["parent"]) for s in trace.spans]
+    # traced() uses the module tracer but shares the active trace via contextvars
+    assert names[0] == ("handle_issues", None)
+    assert ("inner_step", 0) in names
+    assert ("github", 1) in names
+    assert trace.duration is not None
+    text = render_trace(trace.to_dict())
+    assert "issues.opened [abc-123]" in text and "path=/repos/o/r" in text
+
+    with local.trace("d2", "x"):
+        pass
+    with local.trace("d3", "x"):
+        pass
+    assert local.get("abc-123") is None  # evicted past capacity
+
+
+@pytest.mark.asyncio
+async def test_slow_delivery_trace_is_appended_to_jsonl(tmp_path):
+    path = tmp_path / "traces.jsonl"
+    cog = Mock()
+    cog.config = Mock()
+    cog.config.github_secret = AsyncMock(return_value="secret")
+    cog.config.trace_slow_ms = AsyncMock(return_value=0.0)  # non-int values fall back to the default
+    cog.config.trace_jsonl_path = AsyncMock(return_value=str(path))
+
+    async def process(event_type, payload):
+        async with tracer.span("handle_issues"):
+            pass
+
+    cog.handlers = Mock()
+    cog.handlers.process_payload = AsyncMock(side_effect=process)
+    server = WebhookServer(cog)
+
+    body = json.dumps({"action": "opened", "repository": {"full_name": "o/r"}}).encode()
+    sig = hmac.new(b"secret", body, hashlib.sha256).hexdigest()
+    req = Mock()
+    req.headers = {"X-Hub-Signature-256": f"sha256={sig}", "X-GitHub-Event": "issues", "X-GitHub-Delivery": "del-1"}
+    req.read = AsyncMock(return_value=body)
+
+    # Default threshold (2s) is not reached: nothing written
+    await server.webhook_handler(req)
+    assert not path.exists()
+
+    cog.config.trace_slow_ms = AsyncMock(return_value=0)  # 0 disables dumping entirely
+    await server.webhook_handler(req)
+    assert not path.exists()
+
+    overrides = {"trace_slow_ms": 1, "trace_jsonl_path": str(path)}
+    server._config_value = AsyncMock(side_effect=lambda key, default: overrides.get(key, default))
+    tracer.recent.pop("del-1", None)
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("GenHub.tracing.Trace.offset_ms", lambda self: 5.0)
+        await server.webhook_handler(req)
+        await asyncio.gather(*server._reports)
+
+    saved = Tracer.find_jsonl(str(path), "del-1")
+    assert saved["name"] == "issues.opened"
+    assert [s["name"] for s in saved["spans"]] == ["handle_issues"]
+    assert tracer.get("del-1").name == "issues.opened"
+
+    # Without a JSONL path the report goes to Discord, after GitHub already has its response
+    overrides.pop("trace_jsonl_path")
+    posting, sent = asyncio.Event(), []
+
+    async def slow_post(msg):
+        await posting.wait()
+        sent.append(msg)
+
+    server._safe_log_info = slow_post
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("GenHub.tracing.Trace.offset_ms", lambda self: 5.0)
+        resp = await asyncio.wait_for(server.webhook_handler(req), 1)
+    assert resp.status == 200 and len(server._reports) == 1
+    posting.set()
+    await asyncio.gather(*server._reports)
+    assert "Slow delivery" in sent[0]
+
+
+@pytest.mark.asyncio
+async def test_background_timers_run_outside_the_delivery_trace():
+    import asyncio
+    from GenHub.tracing import _current_trace, detached_task
+
+    seen = {}
+
+    async def timer(name):
+        await asyncio.sleep(0)
+        seen[name] = _current_trace.get()
+
+    with Tracer().trace("del-timer", "issues"):
+        inherited = asyncio.create_task(timer("inherited"))
+        detached = detached_task(timer("detached"))
+    await asyncio.gather(inherited, detached)
+    assert seen["inherited"].delivery_id == "del-timer"
+    assert seen["detached"] is None
+
+
+@pytest.mark.asyncio
+async def test_deliveries_without_an_id_get_a_distinct_one():
+    cog = Mock()
+    cog.config = Mock()
+    cog.config.github_secret = AsyncMock(return_value="secret")
+    cog.handlers = Mock()
+    cog.handlers.process_payload = AsyncMock()
+    server = WebhookServer(cog)
+
+    body = json.dumps({"action": "opened", "repository": {"full_name": "o/r"}}).encode()
+    req = Mock()
+    req.headers = {"X-Hub-Signature-256": "sha256=" + hmac.new(b"secret", body, hashlib.sha256).hexdigest(), "X-GitHub-Event": "issues"}
+    req.read = AsyncMock(return_value=body)
+
+    before = set(tracer.recent)
+    await server.webhook_handler(req)
+    await server.webhook_handler(req)
+    new = [d for d in tracer.recent if d not in before]
+    assert len(new) == 2 and all(d.startswith("local-") for d in new)
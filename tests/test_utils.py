@@ -370,3 +370,91 @@ async def test_find_comment_message_embed_and_content():
     not_found = await utils.find_comment_message(mock_thread, "https://github.com/owner/repo/issues/999#issuecomment-999", author_login="unknown_user")
     assert not_found is None
 
+
+
+@pytest.mark.asyncio
+async def test_get_or_create_thread_validates_cached_thread_without_api_calls():
+    thread = Mock(id=55, archived=False)
+    thread.name = "[GH] [#1] t"
+    thread.history = Mock(side_effect=AssertionError("no history probe expected"))
+    cache = {(1, "owner/repo", 1): thread}
+    bot = Mock()
+    res = await utils.get_or_create_thread(bot, 1, "owner/repo", 1, "t", "u", [], cache)
+    assert res == (thread, False)
+
+
+def test_invalidate_thread_drops_objects_and_ids():
+    thread = Mock(id=55)
+    cache = {(1, "o/r", 1): thread, ("1", "o/r", 1): thread, (1, "o/r", 2): 55, (1, "o/r", 3): Mock(id=9)}
+    assert utils.invalidate_thread(cache, 55) == 3
+    assert list(cache) == [(1, "o/r", 3)]
+
+
+def test_render_markdown_streams_large_bodies_and_caps_pathological_ones():
+    import time
+    from GenHub.utils import clean_github_markdown, create_comment_embed, render_markdown, TRUNCATED_SUFFIX
+
+    sections = "\n\n".join(f"### Step {i}\n\nSee #{i} and <b>bold {i}</b>.\n\n| k | v |\n|---|---|\n| a | {i} |" for i in range(400))
+    full = clean_github_markdown(sections, repo="o/r")
+    preview = render_markdown.__wrapped__(sections, "o/r", 2048)
+    assert preview.endswith(TRUNCATED_SUFFIX)
+    assert full.startswith(preview[: -len(TRUNCATED_SUFFIX)][:2000])
+
+    # One enormous collapsed diff: the full pipeline backtracks for minutes on this
+    diff = "\n".join(f"+ line {i} <table><tr><td>x</td>" for i in range(20000))
+    body = f"## Walkthrough\n\nSmall intro.\n\n<details><summary>diff</summary>\n\n```diff\n{diff}\n```\n</details>\n"
+    started = time.perf_counter()
+    embed = create_comment_embed("someone", body, "https://github.com/o/r/pull/1#c", repo="o/r")
+    assert time.perf_counter() - started < 2.0
+    assert "Walkthrough" in embed.description
+    assert "Read full comment on GitHub" in embed.description
+
+
+def test_render_markdown_cut_depends_on_size_not_timing(monkeypatch):
+    import time
+    from GenHub import utils
+
+    # Many small sections and no output limit: only the input budget ends the render
+    body = "\n\n".join(f"Section {i} " + "word " * 200 for i in range(100))
+    first = utils.render_markdown.__wrapped__(body, "o/r", None)
+    assert first.endswith(utils.TRUNCATED_SUFFIX)
+    # A slow machine must produce the same (memoized) result as a fast one
+    ticks = iter(range(10**6))
+    monkeypatch.setattr(time, "perf_counter", lambda: next(ticks) * 10.0)
+    assert utils.render_markdown.__wrapped__(body, "o/r", None) == first
+
+
+def test_render_cache_keys_on_a_digest_not_the_body():
+    from GenHub.utils import render_markdown
+
+    body = "Walkthrough\n\n" + "A long bot comment. " * 10_000
+    before = render_markdown.cache_info()
+    first = render_markdown(body, "o/r", 2048)
+    assert render_markdown(body, "o/r", 2048) is first
+    info = render_markdown.cache_info()
+    assert (info.hits, info.misses) == (before.hits + 1, before.misses + 1)
+    # Neither the 200 KB body nor an unbounded rendering is kept alive by the cache
+    assert all(len(part) <= 20 for key in render_markdown._entries for part in key if isinstance(part, bytes))
+    assert not any(body in key for key in render_markdown._entries)
+    assert len(first) < len(body) // 10
+
+
+def test_format_comment_preview_ignores_the_tail_of_huge_bodies():
+    from GenHub.utils import format_comment_preview
+
+    assert format_comment_preview("Looks good to me " + "x" * 500_000, max_len=20) == '"Looks good to me..."'
+
+
+def test_decode_json_and_sniff_action(monkeypatch):
+    import json
+    from GenHub import utils
+
+    body = b'{"action":"labeled","label":{"name":"bug"}}'
+    assert utils.sniff_action(body) == "labeled"
+    assert utils.sniff_action(b'{"zen": "Keep it simple", "action": "x"}') is None
+    assert utils.decode_json(body)["label"]["name"] == "bug"
+
+    monkeypatch.setattr(utils, "orjson", None)
+    assert utils.decode_json("{\"t\": \"é\"}".encode())["t"] == "é"
+    with pytest.raises(json.JSONDecodeError):
+        utils.decode_json(b"{not json")
@@ -128,7 +128,7 @@ async def test_webhook_start_and_stop(monkeypatch):
 
 
 @pytest.mark.asyncio
-async def test_webhook_start_failure(capsys):
+async def test_webhook_start_failure(caplog):
     cog = AsyncMock()
     cog.config = AsyncMock()
     cog.config.webhook_host = AsyncMock(return_value="127.0.0.1")
@@ -137,5 +137,227 @@ async def test_webhook_start_failure(capsys):
 
     with patch("GenHub.webhook.web.TCPSite.start", side_effect=RuntimeError("boom")):
         await server.start()
-    out = capsys.readouterr().out
-    assert "Failed to start webhook server" in out
+    assert "Failed to start webhook server" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_metrics_endpoint_reports_deliveries_failures_and_latency():
+    import logging
+    from GenHub.metrics import metrics, install_discord_rate_limit_counter, uninstall_discord_rate_limit_counter
+    from GenHub.handlers import RateLimiter
+
+    metrics.reset()
+    cog = Mock()
+    cog.config = Mock()
+    cog.config.github_secret = AsyncMock(return_value="secret")
+    cog.handlers = Mock()
+    cog.handlers.process_payload = AsyncMock()
+    cog.handlers.rate_limiter = RateLimiter()
+    cog.handlers.rate_limiter.remaining = 4321
+    cog.handlers.pending_reviews = {("o/r", 1, 2): {}}
+    cog.handlers._flushing_reviews = {}
+    server = WebhookServer(cog)
+
+    body = b'{"action": "opened", "repository": {"full_name": "o/r"}}'
+    sig = hmac.new(b"secret", body, hashlib.sha256).hexdigest()
+    ok = Mock(headers={"X-GitHub-Event": "issues", "X-Hub-Signature-256": f"sha256={sig}"})
+    ok.read = AsyncMock(return_value=body)
+    bad = Mock(headers={"X-GitHub-Event": "issues", "X-Hub-Signature-256": "sha256=bad"})
+    bad.read = AsyncMock(return_value=body)
+    await server.webhook_handler(ok)
+    await server.webhook_handler(bad)
+
+    install_discord_rate_limit_counter()
+    try:
+        logging.getLogger("discord.http").warning("We are being rate limited. POST /channels responded with 429.")
+    finally:
+        uninstall_discord_rate_limit_counter()
+
+    resp = await server.handle_metrics(Mock())
+    text = resp.text
+    assert 'genhub_webhook_deliveries_total{action="opened",event="issues",status="200"} 1' in text
+    assert 'genhub_webhook_signature_failures_total{reason="invalid"} 1' in text
+    assert 'genhub_handler_latency_seconds_count{event="issues"} 1' in text
+    assert "genhub_github_ratelimit_remaining 4321" in text
+    assert 'genhub_queue_depth{queue="pending_reviews"} 1' in text
+    assert "genhub_discord_rate_limited_total 1" in text
+    assert "# TYPE genhub_handler_latency_seconds histogram" in text
+
+
+@pytest.mark.asyncio
+async def test_unhandled_events_and_actions_are_dropped_before_decoding():
+    cog = Mock()
+    cog.config.github_secret = AsyncMock(return_value="")
+    cog.handlers.process_payload = AsyncMock()
+    server = WebhookServer(cog)
+
+    req = Mock()
+    req.headers = {"X-GitHub-Event": "workflow_run"}
+    req.read = AsyncMock(return_value=b"{}")
+    assert (await server.webhook_handler(req)).status == 204
+    req.read.assert_not_awaited()
+
+    req.headers = {"X-GitHub-Event": "pull_request_review"}
+    req.read = AsyncMock(return_value=b'{"action": "edited", "review": {}}')
+    with patch("GenHub.webhook.decode_json") as decode:
+        assert (await server.webhook_handler(req)).status == 204
+    decode.assert_not_called()
+    cog.handlers.process_payload.assert_not_awaited()
+
+    req.read = AsyncMock(return_value=b'{"action": "submitted", "review": {}}')
+    assert (await server.webhook_handler(req)).status == 200
+    cog.handlers.process_payload.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_event_allowlist_skips_on_headers_and_counts_per_type():
+    from tests.fake_discord import FakeConfig
+
+    cog = Mock()
+    cog.config = FakeConfig({"github_secret": "secret", "event_allowlist": ["issues", "pull_request_review.submitted"]})
+    cog.handlers.process_payload = AsyncMock()
+    server = WebhookServer(cog)
+
+    # Skipped deliveries are never verified; ignored actions only need a signature header
+    req = Mock()
+    req.headers = {"X-GitHub-Event": "pull_request"}
+    req.read = AsyncMock(return_value=b'{"action": "opened"}')
+    assert (await server.webhook_handler(req)).status == 204
+    req.read.assert_not_awaited()
+
+    req.headers = {"X-GitHub-Event": "pull_request_review", "X-Hub-Signature-256": "sha256=unchecked"}
+    req.read = AsyncMock(return_value=b'{"action": "dismissed"}')
+    assert (await server.webhook_handler(req)).status == 204
+    assert (await server.webhook_handler(req)).status == 204
+
+    assert server.skipped == {"pull_request": 1, "pull_request_review.dismissed": 2}
+    cog.handlers.process_payload.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_streamed_bodies_are_hmaced_in_chunks_and_capped():
+    import aiohttp
+    from benchmarks.webhook_load import _free_port
+    from tests.fake_discord import FakeConfig
+
+    port = _free_port()
+    cog = Mock()
+    cog.config = FakeConfig({"webhook_host": "127.0.0.1", "webhook_port": port, "github_secret": "secret", "webhook_max_body_kb": 256})
+    cog.handlers.process_payload = AsyncMock()
+    server = WebhookServer(cog)
+    await server.start()
+
+    def signed(body, key=b"secret"):
+        return {"X-GitHub-Event": "issues", "X-Hub-Signature-256": "sha256=" + hmac.new(key, body, hashlib.sha256).hexdigest()}
+
+    body = json.dumps({"action": "opened", "issue": {"body": "x" * 200_000}}).encode()
+    try:
+        async with aiohttp.ClientSession() as http:
+            async with http.post(f"http://127.0.0.1:{port}/github", data=body, headers=signed(body)) as resp:
+                assert resp.status == 200
+            assert cog.handlers.process_payload.await_args.args[1]["issue"]["body"] == "x" * 200_000
+
+            big = b'{"action": "opened", "pad": "' + b"y" * 300_000 + b'"}'
+            async with http.post(f"http://127.0.0.1:{port}/github", data=big, headers=signed(big)) as resp:
+                assert resp.status == 413
+
+            # The encoded key is cached; `[p]genhub secret` swaps it through set_secret
+            await cog.config.github_secret.set("rotated")
+            async with http.post(f"http://127.0.0.1:{port}/github", data=body, headers=signed(body, b"rotated")) as resp:
+                assert resp.status == 401
+            server.set_secret("rotated")
+            async with http.post(f"http://127.0.0.1:{port}/github", data=body, headers=signed(body, b"rotated")) as resp:
+                assert resp.status == 200
+    finally:
+        await server.stop()
+
+
+@pytest.mark.asyncio
+async def test_ready_and_health_detail_report_component_state():
+    from GenHub.metrics import metrics
+    from tests.fake_discord import FakeDiscord, make_cog
+
+    metrics.reset()
+    cog = make_cog(FakeDiscord(rate_limits=False))
+    cog.bot.is_ready = lambda: True
+    cog.bot.latency = 0.042
+    cog.warm = asyncio.Event()
+    server = WebhookServer(cog)
+
+    resp = await server.handle_ready(Mock())
+    assert resp.status == 503 and resp.text == "not ready: warming"
+    assert json.loads((await server.handle_health_detail(Mock())).text)["status"] == "warming"
+
+    cog.warm.set()
+    await cog.handlers.handle_issue({
+        "action": "opened",
+        "issue": {"number": 1, "title": "Bug", "html_url": "https://github.com/acme/widgets/issues/1", "user": {"login": "octocat"}, "labels": []},
+        "repository": {"full_name": "acme/widgets"},
+        "sender": {"login": "octocat"},
+    }, "acme/widgets")
+    resp = await server.handle_ready(Mock())
+    assert (resp.status, resp.text) == (200, "ready")
+    detail = json.loads((await server.handle_health_detail(Mock())).text)
+    assert detail["discord"]["connected"] is True and detail["discord"]["latency_ms"] == 42.0
+    assert detail["discord"]["last_send_at"] is not None
+    assert detail["queues"]["pending_reviews"] == 0 and detail["caches"]["warm"]
+
+    # A broken forum ID, a dropped gateway and failing GitHub auth each make the bot unready
+    cog.config._store["prs_forum_id"] = 999
+    cog.bot.is_ready = lambda: False
+    metrics.mark("github_auth_failure")
+    resp = await server.handle_health_detail(Mock())
+    detail = json.loads(resp.text)
+    assert resp.status == 503 and detail["status"] == "not_ready"
+    assert detail["reasons"] == ["discord gateway disconnected", "prs_forum_id 999 not found", "github auth failing"]
+    metrics.reset()
+
+
+@pytest.mark.asyncio
+async def test_unverified_event_names_do_not_create_counter_keys_or_series():
+    from GenHub.metrics import metrics
+
+    metrics.reset()
+    cog = Mock()
+    cog.config.github_secret = AsyncMock(return_value="secret")
+    server = WebhookServer(cog)
+
+    for i in range(50):
+        req = Mock()
+        req.headers = {"X-GitHub-Event": f"junk-{i}"}
+        req.read = AsyncMock(return_value=b"{}")
+        assert (await server.webhook_handler(req)).status == 204
+    req = Mock()
+    req.headers = {"X-GitHub-Event": "issue_comment", "X-Hub-Signature-256": "sha256=unchecked"}
+    req.read = AsyncMock(return_value=b'{"action": "random-%d"}' % 7)
+    assert (await server.webhook_handler(req)).status == 204
+
+    assert server.skipped == {"other": 50, "issue_comment.other": 1}
+    text = (await server.handle_metrics(Mock())).text
+    skipped_series = [l for l in text.splitlines() if l.startswith("genhub_webhook_skipped_total")]
+    assert not any("junk" in l or "random" in l for l in skipped_series)
+    assert 'genhub_webhook_deliveries_total{action="",event="other",status="204"} 50' in text
+    assert 'genhub_webhook_skipped_total{action="",event="other"} 50' in text
+    assert "# TYPE genhub_webhook_skipped_total counter" in text
+    metrics.reset()
+
+
+@pytest.mark.asyncio
+async def test_delivery_metrics_label_rejected_junk_as_other():
+    from GenHub.metrics import metrics
+
+    metrics.reset()
+    cog = Mock()
+    cog.config.github_secret = AsyncMock(return_value="secret")
+    server = WebhookServer(cog)
+
+    for i in range(20):
+        req = Mock()
+        req.headers = {"X-GitHub-Event": "issues", "X-Hub-Signature-256": "sha256=bad"}
+        req.read = AsyncMock(return_value=b'{"action": "made-up-%d"}' % i)
+        assert (await server.webhook_handler(req)).status == 401
+
+    text = (await server.handle_metrics(Mock())).text
+    delivery_series = [l for l in text.splitlines() if l.startswith("genhub_webhook_deliveries_total")]
+    assert delivery_series == ['genhub_webhook_deliveries_total{action="",event="issues",status="401"} 20']
+    metrics.reset()
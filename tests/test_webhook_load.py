@@ -0,0 +1,41 @@
+import time
+
+import pytest
+
+from benchmarks.webhook_load import load_scenario, percentile, replay
+from tests import fake_discord
+from tests.fake_discord import FakeDiscord, make_cog
+
+
+def test_percentile_nearest_rank():
+    assert percentile([], 50) is None
+    assert percentile([5, 1, 3], 50) == 3
+    assert percentile(list(range(1, 101)), 99) == 99
+
+
+@pytest.mark.asyncio
+async def test_fake_discord_waits_out_route_rate_limits(monkeypatch):
+    monkeypatch.setitem(fake_discord.ROUTE_LIMITS, "POST /channels/{channel_id}/messages", (2, 0.05))
+    cog = make_cog(FakeDiscord())
+    channel = cog.bot.add_text_channel("chat")
+
+    started = time.perf_counter()
+    for i in range(3):
+        await channel.send(f"msg {i}")
+
+    assert time.perf_counter() - started >= 0.04
+    assert cog.bot.api.calls["POST /channels/{channel_id}/messages"] == 3
+    assert cog.bot.api.rate_limited["POST /channels/{channel_id}/messages"] == 1
+    assert [m.content for m in channel.messages] == ["msg 0", "msg 1", "msg 2"]
+
+
+@pytest.mark.asyncio
+async def test_replay_reports_ack_latency_and_api_calls_per_event():
+    deliveries = load_scenario("issues")[:3]
+    report = await replay(deliveries, rate=200, api=FakeDiscord(rate_limits=False), idle_timeout=5)
+
+    opened = report["events"]["issues.opened"]
+    assert opened["deliveries"] == 3 and opened["errors"] == 0
+    assert opened["ack_p50_ms"] > 0 and opened["e2e_p99_ms"] is not None
+    assert opened["api_calls_per_delivery"] >= 2  # thread creation + log line at least
+    assert report["api_calls"]["POST /channels/{channel_id}/threads"] == 3